@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Compact callback_data codec for the Meta Game bot.
+
+Telegram limits callback_data to 64 bytes, and names of districts and
+politicians can be long (Cyrillic takes two bytes a character). Buttons that
+carry entities are packed as
+
+    ~1 <route id> <arg>.<arg>...
+
+with a one-character route id and fixed-size arguments: districts and
+politicians by a 6-character hash of their name, collective actions by their
+UUID in 22 characters of base64. Hashes are resolved back to names through a
+table filled when buttons are built, and reloaded from the database for
+buttons that outlive a restart. Handlers get decoded, typed arguments.
+
+Payloads in the old "prefix:arg:arg" form, still attached to earlier
+messages, decode through each route's legacy prefix.
+"""
+
+import base64
+import hashlib
+import logging
+import re
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from db import get_districts, get_politician_names
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+MARKER = "~"
+VERSION = "1"
+PREFIX = MARKER + VERSION
+SEPARATOR = "."
+MAX_CALLBACK_DATA_BYTES = 64
+# Unknown entity ids reload the names from the database at most this often
+MIN_RELOAD_INTERVAL = 60  # seconds
+
+# Characters for route ids and choice indexes
+_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-_"
+
+
+class CallbackDataError(ValueError):
+    """A value that cannot be encoded into callback_data."""
+    pass
+
+
+class Choice:
+    """One of a fixed set of strings, packed as one character."""
+
+    def __init__(self, *values: str):
+        self.values = values
+        self._index = {value: _ALPHABET[i] for i, value in enumerate(values)}
+
+    def encode(self, value: Any) -> str:
+        try:
+            return self._index[value]
+        except KeyError:
+            raise CallbackDataError(f"{value!r} is not one of {self.values}") from None
+
+    async def decode(self, text: str) -> Optional[str]:
+        index = _ALPHABET.find(text)
+        return self.values[index] if len(text) == 1 and 0 <= index < len(self.values) else None
+
+    async def decode_legacy(self, text: str) -> Optional[str]:
+        return text if text in self._index else None
+
+
+class Uuid:
+    """A UUID, packed as 22 characters of unpadded base64."""
+
+    def encode(self, value: Any) -> str:
+        try:
+            raw = uuid.UUID(str(value)).bytes
+        except ValueError:
+            raise CallbackDataError(f"{value!r} is not a UUID") from None
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    async def decode(self, text: str) -> Optional[str]:
+        try:
+            return str(uuid.UUID(bytes=base64.urlsafe_b64decode(text + "==")))
+        except ValueError:
+            return None
+
+    async def decode_legacy(self, text: str) -> Optional[str]:
+        return text or None
+
+
+class Entity:
+    """A district or politician name, packed as a 6-character hash of the name."""
+
+    def __init__(self, kind: str, load_names: Callable[[], Awaitable[Iterable[str]]],
+                 min_reload_interval: float = MIN_RELOAD_INTERVAL):
+        self.kind = kind
+        self._load_names = load_names
+        self._names: Dict[str, str] = {}
+        self.min_reload_interval = min_reload_interval
+        self._loaded_at: Optional[float] = None
+
+    @staticmethod
+    def key(name: str) -> str:
+        digest = hashlib.blake2b(name.encode("utf-8"), digest_size=4).digest()
+        return base64.urlsafe_b64encode(digest).decode("ascii").rstrip("=")
+
+    def intern(self, name: str) -> str:
+        key = self.key(name)
+        known = self._names.setdefault(key, name)
+        if known != name:
+            raise CallbackDataError(f"{self.kind} names {known!r} and {name!r} share the id {key}")
+        return key
+
+    def encode(self, value: Any) -> str:
+        return self.intern(str(value))
+
+    def preload(self, names: Iterable[str]) -> int:
+        """Add known names, e.g. the whole catalog at startup. Returns the number of ids known."""
+        for name in names:
+            self._names.setdefault(self.key(name), name)
+        return len(self._names)
+
+    async def load(self) -> int:
+        """Add the current names from the database."""
+        self._loaded_at = time.monotonic()
+        return self.preload(await self._load_names() or ())
+
+    async def decode(self, text: str) -> Optional[str]:
+        name = self._names.get(text)
+        if name is None and (self._loaded_at is None
+                             or time.monotonic() - self._loaded_at >= self.min_reload_interval):
+            # Built before a restart: look the name up among the current ones. Stale or forged
+            # ids don't get a query each; they wait for the next reload
+            await self.load()
+            name = self._names.get(text)
+        return name
+
+    async def decode_legacy(self, text: str) -> Optional[str]:
+        return text or None
+
+
+class Route(NamedTuple):
+    name: str
+    id: str
+    params: Tuple[Any, ...]
+    legacy_prefix: str
+
+
+async def _district_names() -> List[str]:
+    return [district.get("name") for district in await get_districts() or () if district.get("name")]
+
+
+DISTRICT = Entity("district", _district_names)
+POLITICIAN = Entity("politician", get_politician_names)
+POLITICIAN_ACTIONS = ("influence", "attack", "displace", "request")
+
+
+class CallbackCodec:
+    """Routes by name and one-character id, with encoding and decoding of their arguments."""
+
+    def __init__(self):
+        self._routes: Dict[str, Route] = {}
+        self._by_id: Dict[str, Route] = {}
+
+    def register(self, name: str, route_id: str, *params: Any, legacy_prefix: Optional[str] = None) -> Route:
+        """Register a route. Ids are part of the wire format: never reuse or renumber them."""
+        if len(route_id) != 1 or route_id not in _ALPHABET:
+            raise ValueError(f"Route id must be one character of {_ALPHABET!r}")
+        if route_id in self._by_id and self._by_id[route_id].name != name:
+            raise ValueError(f"Route id {route_id!r} is already used by {self._by_id[route_id].name}")
+        route = Route(name, route_id, params, legacy_prefix if legacy_prefix is not None else f"{name}:")
+        self._routes[name] = route
+        self._by_id[route_id] = route
+        return route
+
+    def encode(self, name: str, *args: Any) -> str:
+        """Pack a route and its arguments into callback_data."""
+        route = self._routes[name]
+        if len(args) != len(route.params):
+            raise CallbackDataError(f"Route {name} takes {len(route.params)} arguments, got {len(args)}")
+        data = PREFIX + route.id + SEPARATOR.join(param.encode(arg) for param, arg in zip(route.params, args))
+        if len(data.encode("utf-8")) > MAX_CALLBACK_DATA_BYTES:
+            raise CallbackDataError(f"callback_data for {name} is longer than {MAX_CALLBACK_DATA_BYTES} bytes")
+        return data
+
+    def pattern(self, name: str) -> str:
+        """Handler pattern matching a route in both the packed and the legacy form."""
+        route = self._routes[name]
+        return f"^({re.escape(PREFIX + route.id)}|{re.escape(route.legacy_prefix)})"
+
+    def prefixes(self, name: str) -> Tuple[str, ...]:
+        """Prefixes of a route's callback_data in the packed and the legacy form."""
+        route = self._routes[name]
+        return tuple(prefix for prefix in (PREFIX + route.id, route.legacy_prefix) if prefix)
+
+    async def decode(self, data: str) -> Optional[Tuple[str, List[Any]]]:
+        """Route name and decoded arguments of callback_data, or None if it is stale or malformed."""
+        if data.startswith(MARKER):
+            if not data.startswith(PREFIX) or len(data) < len(PREFIX) + 1:
+                return None
+            route = self._by_id.get(data[len(PREFIX)])
+            if route is None:
+                return None
+            parts = data[len(PREFIX) + 1:].split(SEPARATOR) if route.params else []
+            decoders = [param.decode for param in route.params]
+        else:
+            route = next((route for route in self._routes.values()
+                          if route.legacy_prefix and data.startswith(route.legacy_prefix)), None)
+            if route is None:
+                return None
+            rest = data[len(route.legacy_prefix):]
+            parts = rest.split(":", len(route.params) - 1) if route.params else []
+            decoders = [param.decode_legacy for param in route.params]
+
+        if len(parts) != len(route.params):
+            return None
+        args = []
+        for decode, part in zip(decoders, parts):
+            value = await decode(part)
+            if value is None:
+                return None
+            args.append(value)
+        return route.name, args
+
+    async def args(self, data: Optional[str], name: str) -> Optional[List[Any]]:
+        """Decoded arguments of callback_data for a route, or None if it is for another route or stale."""
+        decoded = await self.decode(data or "")
+        if decoded is None or decoded[0] != name:
+            logger.debug(f"Could not decode callback_data {data!r} for route {name}")
+            return None
+        return decoded[1]
+
+
+# Global codec
+codec = CallbackCodec()
+codec.register("district", "d", DISTRICT)
+codec.register("politician", "p", POLITICIAN)
+codec.register("politician_action", "a", Choice(*POLITICIAN_ACTIONS), POLITICIAN)
+codec.register("join_collective_action", "j", Uuid())
+
+
+def encode(name: str, *args: Any) -> str:
+    """Pack a route and its arguments into callback_data."""
+    return codec.encode(name, *args)
+
+
+def pattern(name: str) -> str:
+    """Handler pattern for a route."""
+    return codec.pattern(name)
+
+
+def prefixes(name: str) -> Tuple[str, ...]:
+    """Callback router prefixes for a route."""
+    return codec.prefixes(name)
+
+
+async def callback_args(data: Optional[str], name: str) -> Optional[List[Any]]:
+    """Decoded arguments of a route's callback_data."""
+    return await codec.args(data, name)
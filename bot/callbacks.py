@@ -7,15 +7,13 @@ Callback query handlers for the Meta Game bot.
 
 import logging
 
-from telegram import Update, InlineKeyboardMarkup, InlineKeyboardButton
-from telegram.ext import ContextTypes, CallbackQueryHandler, ConversationHandler
+from telegram import Update
+from telegram.ext import ContextTypes, ConversationHandler
 
+from bot.callback_data import callback_args, prefixes
 from bot.constants import ACTION_SELECT_RESOURCE, JOIN_ACTION_RESOURCE
 from bot.keyboards import (
-    get_start_keyboard,
-    get_help_keyboard,
     get_status_keyboard,
-    get_map_keyboard,
     get_action_keyboard,
     get_quick_action_keyboard,
     get_districts_keyboard,
@@ -23,32 +21,32 @@ from bot.keyboards import (
     get_politician_interaction_keyboard,
     get_resource_type_keyboard,
     get_back_keyboard,
-    get_resources_keyboard,
-    get_language_keyboard
+    get_resources_keyboard
 )
+from bot.map_view import get_map_screen
+from bot.pagination import show_page
+from bot.screens import get_screen, screens
 from db import (
     get_player,
     get_district_info,
-    get_map_data,
     check_income,
     get_politicians,
     get_politician_status,
     submit_action,
-    get_latest_news,
-    get_active_collective_actions,
     get_cycle_info
 )
+from game.model import STRONG_CONTROL_POINTS
 from utils.formatting import (
     format_player_status,
     format_district_info,
     format_income_info,
     format_politicians_list,
     format_politician_info,
-    format_time,
-    format_news
+    format_time
 )
 from utils.i18n import _, get_user_language, set_user_language
 from utils.error_handling import require_registration, handle_error
+from utils.markdown import MessageBuilder
 from utils.message_utils import send_message, edit_or_reply, answer_callback
 from utils.context_manager import get_user_data, set_user_data, clear_user_data
 
@@ -67,22 +65,12 @@ async def general_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -
 
     if callback_data == "back_to_menu":
         # Return to main menu
-        await edit_or_reply(
-            update,
-            _("Main Menu", language),
-            keyboard=get_start_keyboard(language)
-        )
+        screen = get_screen("main_menu", language)
+        await edit_or_reply(update, screen.text, keyboard=screen.keyboard)
     elif callback_data == "help":
         # Show help menu
-        help_text = _(
-            "Welcome to Novi-Sad! What would you like to learn about?",
-            language
-        )
-        await edit_or_reply(
-            update,
-            help_text,
-            keyboard=get_help_keyboard(language)
-        )
+        screen = get_screen("help_menu", language)
+        await edit_or_reply(update, screen.text, keyboard=screen.keyboard)
     elif callback_data.startswith("help:"):
         # Show specific help section
         section = callback_data.split(":", 1)[1]
@@ -134,50 +122,21 @@ async def map_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         return
 
     try:
-        # Get map data
-        map_data = await get_map_data(language)
+        # Rendered once per cycle and language, shared by everyone
+        screen = await get_map_screen(language)
 
-        if not map_data:
+        if not screen:
             await edit_or_reply(
                 update,
                 _("Error retrieving map data. Please try again later.", language)
             )
             return
 
-        # Format and build map message
-        districts = map_data.get("districts", [])
-        game_date = map_data.get("game_date", "Unknown")
-        cycle = map_data.get("cycle", "Unknown")
-
-        map_text = _(
-            "*Current Map of Novi-Sad*\n"
-            "Date: {date}, {cycle} cycle\n\n"
-            "District Control:\n",
-            language
-        ).format(date=game_date, cycle=cycle)
-
-        for district in districts:
-            name = district.get("name", "Unknown")
-            controlling_player = district.get("controlling_player", _("None", language))
-            control_level = district.get("control_level", "neutral")
-
-            control_symbol = "🔴" if control_level == "strong" else "🟠" if control_level == "controlled" else "🟡" if control_level == "contested" else "⚪"
-
-            map_text += f"{control_symbol} *{name}*: "
-            if controlling_player != _("None", language):
-                map_text += _("Controlled by {player}", language).format(player=controlling_player)
-            else:
-                map_text += _("No clear control", language)
-            map_text += "\n"
-
-        # Add map link if available
-        map_text += "\n" + _("For a visual map, use the button below:", language)
-
         await edit_or_reply(
             update,
-            map_text,
-            keyboard=get_map_keyboard(language),
-            parse_mode="Markdown"
+            screen.text,
+            keyboard=screen.keyboard,
+            parse_mode=screen.parse_mode
         )
     except Exception as e:
         await handle_error(update, language, e, "map_callback")
@@ -194,68 +153,7 @@ async def news_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         return
 
     try:
-        # Get page number from context or initialize
-        page = context.user_data.get("news_page", 0)
-
-        # Extract page action if there is one
-        if update.callback_query.data.startswith("news_page:"):
-            action = update.callback_query.data.split(":", 1)[1]
-            if action == "next":
-                page += 1
-            elif action == "prev" and page > 0:
-                page -= 1
-            context.user_data["news_page"] = page
-
-        # Get news with pagination (5 per page)
-        news_count = 5
-        news_offset = page * news_count
-
-        news_data = await get_latest_news(telegram_id, count=news_count + 1,
-                                          language=language)  # +1 to check if there's more
-
-        if not news_data:
-            await edit_or_reply(
-                update,
-                _("Error retrieving news. Please try again later.", language)
-            )
-            return
-
-        # Format and build news message
-        news_text = await format_news(news_data, language)
-
-        # Create pagination buttons
-        buttons = []
-
-        # Add navigation row
-        navigation_row = []
-
-        # Previous page button if not on first page
-        if page > 0:
-            navigation_row.append(InlineKeyboardButton("◀️ " + _("Previous", language), callback_data="news_page:prev"))
-
-        # Next page button if there are more news
-        public_news = news_data.get("public", [])
-        faction_news = news_data.get("faction", [])
-        has_more = (len(public_news) > news_count or len(faction_news) > news_count)
-
-        if has_more:
-            navigation_row.append(InlineKeyboardButton(_("Next", language) + " ▶️", callback_data="news_page:next"))
-
-        if navigation_row:
-            buttons.append(navigation_row)
-
-        # Add back to menu button
-        buttons.append([InlineKeyboardButton(_("Back to Menu", language), callback_data="back_to_menu")])
-
-        # Create keyboard
-        keyboard = InlineKeyboardMarkup(buttons)
-
-        await edit_or_reply(
-            update,
-            news_text,
-            keyboard=keyboard,
-            parse_mode="Markdown"
-        )
+        await show_page(update, context, "news")
     except Exception as e:
         await handle_error(update, language, e, "news_callback")
 
@@ -268,8 +166,9 @@ async def district_info_callback(update: Update, context: ContextTypes.DEFAULT_T
         await answer_callback(update)
 
         # Extract district name if not provided
-        if not district_name and query.data.startswith("district:"):
-            district_name = query.data.split(":", 1)[1]
+        if not district_name:
+            args = await callback_args(query.data, "district")
+            district_name = args[0] if args else None
 
     telegram_id = str(update.effective_user.id)
     language = await get_user_language(telegram_id)
@@ -277,6 +176,10 @@ async def district_info_callback(update: Update, context: ContextTypes.DEFAULT_T
     if query and not await require_registration(update, language):
         return
 
+    if not district_name:
+        await edit_or_reply(update, _("This button has expired. Please open the menu again.", language))
+        return
+
     try:
         # Get district info
         district_data = await get_district_info(telegram_id, district_name, language)
@@ -460,7 +363,7 @@ async def controlled_districts_callback(update: Update, context: ContextTypes.DE
             return
 
         # Format controlled districts message
-        districts_text = _("*Your Controlled Districts*\n\n", language)
+        message = MessageBuilder().markup(_("*Your Controlled Districts*\n\n", language))
 
         for district in controlled_districts:
             name = district.get("district_name", "Unknown")
@@ -470,10 +373,10 @@ async def controlled_districts_callback(update: Update, context: ContextTypes.DE
             information = district.get("resource_information", 0)
             force = district.get("resource_force", 0)
 
-            control_level = "🔴 " if control_points >= 80 else "🟠 "
+            control_level = "🔴 " if control_points >= STRONG_CONTROL_POINTS else "🟠 "
 
-            districts_text += f"{control_level}*{name}*: {control_points} CP\n"
-            districts_text += _("Resources per cycle: ", language)
+            message.text(control_level).bold(name).text(f": {control_points} CP").line()
+            message.markup(_("Resources per cycle: ", language))
 
             resources = []
             if influence > 0:
@@ -485,12 +388,11 @@ async def controlled_districts_callback(update: Update, context: ContextTypes.DE
             if force > 0:
                 resources.append(f"{force} {_('Force', language)}")
 
-            districts_text += ", ".join(resources)
-            districts_text += "\n\n"
+            message.text(", ".join(resources)).line().line()
 
         await edit_or_reply(
             update,
-            districts_text,
+            message.build(),
             keyboard=get_back_keyboard(language),
             parse_mode="Markdown"
         )
@@ -510,16 +412,15 @@ async def politician_action_handler(update: Update, context: ContextTypes.DEFAUL
 
     try:
         # Extract action details
-        action_data = update.callback_query.data.split(":", 2)
-        if len(action_data) < 3:
+        args = await callback_args(update.callback_query.data, "politician_action")
+        if not args:
             await edit_or_reply(
                 update,
                 _("Invalid action format. Please try again.", language)
             )
             return
 
-        action_type = action_data[1]
-        politician_name = action_data[2]
+        action_type, politician_name = args
 
         # Store action info in user context
         user_data = get_user_data(telegram_id, context)
@@ -627,15 +528,15 @@ async def join_collective_action_callback(update: Update, context: ContextTypes.
 
     try:
         # Extract action ID
-        action_data = update.callback_query.data.split(":", 1)
-        if len(action_data) < 2:
+        args = await callback_args(update.callback_query.data, "join_collective_action")
+        if not args:
             await edit_or_reply(
                 update,
                 _("Invalid action format. Please try again.", language)
             )
             return ConversationHandler.END
 
-        action_id = action_data[1]
+        action_id = args[0]
 
         # Store action ID in user context
         set_user_data(telegram_id, "join_action_id", action_id, context)
@@ -699,132 +600,21 @@ async def help_section_callback(update: Update, context: ContextTypes.DEFAULT_TY
     language = await get_user_language(telegram_id)
 
     try:
-        help_text = ""
-
-        if section == "actions":
-            help_text = _(
-                "*Actions Guide*\n\n"
-                "Each game cycle, you can submit:\n"
-                "• 1 Main Action (ОЗ)\n"
-                "• 2 Quick Actions (БЗ)\n\n"
-
-                "*Main Actions*\n"
-                "• *Influence* - Increase your control in a district (+10 CP)\n"
-                "• *Attack* - Reduce enemy control and gain control points\n"
-                "• *Defense* - Defend against attacks\n"
-                "• *Politician Influence* - Improve relations with a politician\n"
-                "• *Politician Attack* - Damage a politician's reputation\n"
-                "• *Politician Displacement* - Reduce a politician's influence\n\n"
-
-                "*Quick Actions*\n"
-                "• *Reconnaissance* - Get information about a district\n"
-                "• *Information Spread* - Publish news or propaganda\n"
-                "• *Support* - Small control boost in a district (+5 CP)\n"
-                "• *Kompromat Search* - Find compromising information\n\n"
-
-                "*Physical Presence*\n"
-                "Being physically present during an action gives +20 control points.",
-                language
-            )
-        elif section == "resources":
-            help_text = _(
-                "*Resources Guide*\n\n"
-                "There are 4 types of resources:\n\n"
-
-                "• *Influence* - Political capital and soft power\n"
-                "  - Used for political actions and diplomacy\n"
-                "  - Can be converted to additional actions\n\n"
-
-                "• *Money* - Financial resources\n"
-                "  - Used for economic actions and bribes\n"
-                "  - Can be converted to other resources (2:1 ratio)\n\n"
-
-                "• *Information* - Intelligence and secrets\n"
-                "  - Used for reconnaissance and propaganda\n"
-                "  - Provides insights into districts and opponents\n\n"
-
-                "• *Force* - Military and security capabilities\n"
-                "  - Used for attacks and defense\n"
-                "  - Provides protection and offensive capabilities\n\n"
-
-                "*Resource Exchange*\n"
-                "You can convert resources at a 2:1 ratio. Example:\n"
-                "2 Money → 1 Influence",
-                language
-            )
-        elif section == "districts":
-            help_text = _(
-                "*Districts Guide*\n\n"
-                "Control Points (CP) determine district control:\n"
-                "• 0-59 CP - No control\n"
-                "• 60+ CP - District controlled\n"
-                "• 80+ CP - Strong control (bonus resources)\n\n"
-
-                "*Resource Income Breakdown*\n"
-                "• 75-100 CP = 120% resources\n"
-                "• 50-74 CP = 100% resources\n"
-                "• 35-49 CP = 80% resources\n"
-                "• 20-34 CP = 60% resources\n"
-                "• <20 CP = 40% resources\n\n"
-
-                "*District Decay*\n"
-                "If you don't perform actions in a district, your control will decay by 5 CP per cycle.",
-                language
-            )
-        elif section == "politicians":
-            help_text = _(
-                "*Politicians Guide*\n\n"
-                "Politicians have influence in specific districts and ideological leanings from -5 (reformist) to +5 (conservative).\n\n"
-
-                "*Politician Friendliness*\n"
-                "• 0-30: Hostile - May work against you\n"
-                "• 30-70: Neutral - Limited interaction\n"
-                "• 70-100: Friendly - Provides resources and support\n\n"
-
-                "*Ideological Compatibility*\n"
-                "When your ideology aligns with a politician:\n"
-                "• Small difference (0-2): +2 CP per cycle\n"
-                "• Large alignment (3+ difference): -5 CP per cycle\n\n"
-
-                "*International Politicians*\n"
-                "International figures can impose sanctions, provide support, or influence the game in various ways.",
-                language
-            )
-        elif section == "rules":
-            help_text = _(
-                "*Game Rules*\n\n"
-                "The game takes place in Novi-Sad, Yugoslavia, in September 1999.\n\n"
-
-                "*Game Cycles*\n"
-                "• Each day has two cycles: Morning and Evening\n"
-                "• Morning deadlines: 12:00, results at 13:00\n"
-                "• Evening deadlines: 18:00, results at 19:00\n\n"
-
-                "*Ideology*\n"
-                "Your ideology ranges from -5 (reformist) to +5 (conservative) and affects your interactions with politicians and districts.\n\n"
-
-                "*Winning Strategy*\n"
-                "Control districts to gain resources, build alliances with politicians, and expand your influence across the city.\n\n"
-
-                "*Cooperative Actions*\n"
-                "Players can join forces for collective attacks or defense using the command /collective.",
-                language
-            )
-        else:
-            help_text = _("Help section not found.", language)
+        name = f"help:{section}"
+        screen = get_screen(name if name in screens else "help:not_found", language)
 
         await edit_or_reply(
             update,
-            help_text,
-            keyboard=get_back_keyboard(language, "help"),
-            parse_mode="Markdown"
+            screen.text,
+            keyboard=screen.keyboard,
+            parse_mode=screen.parse_mode
         )
     except Exception as e:
         await handle_error(update, language, e, "help_section_callback")
 
 
-async def news_page_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handle news pagination navigation."""
+async def page_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle Next/Prev buttons of paginated lists."""
     await answer_callback(update)
 
     telegram_id = str(update.effective_user.id)
@@ -834,25 +624,12 @@ async def news_page_callback(update: Update, context: ContextTypes.DEFAULT_TYPE)
         return
 
     try:
-        # Extract page action (next/prev)
-        action = update.callback_query.data.split(":", 1)[1]
-
-        # Get current page or initialize
-        page = context.user_data.get("news_page", 0)
-
-        # Update page based on action
-        if action == "next":
-            page += 1
-        elif action == "prev" and page > 0:
-            page -= 1
-
-        # Store updated page
-        context.user_data["news_page"] = page
-
-        # Forward to main news handler with updated page
-        await news_callback(update, context)
+        # page:<source>:<direction>, or news_page:<direction> on messages sent before pagination
+        parts = update.callback_query.data.split(":")
+        source, direction = ("news", parts[1]) if parts[0] == "news_page" else (parts[1], parts[2])
+        await show_page(update, context, source, direction)
     except Exception as e:
-        await handle_error(update, language, e, "news_page_callback")
+        await handle_error(update, language, e, "page_callback")
 
 async def language_setting_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle language setting callbacks."""
@@ -900,26 +677,12 @@ async def settings_menu_callback(update: Update, context: ContextTypes.DEFAULT_T
     language = await get_user_language(telegram_id)
 
     try:
-        # Create settings menu
-        settings_text = _("*Settings*\n\nHere you can change your preferences.", language)
-
-        # Create settings keyboard
-        keyboard = [
-            [
-                InlineKeyboardButton(_("Language", language), callback_data="settings:language")
-            ],
-            [
-                InlineKeyboardButton(_("Back to Menu", language), callback_data="back_to_menu")
-            ]
-        ]
-
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
+        screen = get_screen("settings", language)
         await edit_or_reply(
             update,
-            settings_text,
-            keyboard=reply_markup,
-            parse_mode="Markdown"
+            screen.text,
+            keyboard=screen.keyboard,
+            parse_mode=screen.parse_mode
         )
     except Exception as e:
         await handle_error(update, language, e, "settings_menu_callback")
@@ -933,11 +696,8 @@ async def language_menu_callback(update: Update, context: ContextTypes.DEFAULT_T
     language = await get_user_language(telegram_id)
 
     try:
-        await edit_or_reply(
-            update,
-            _("Select your preferred language:", language),
-            keyboard=get_language_keyboard()
-        )
+        screen = get_screen("language_menu", language)
+        await edit_or_reply(update, screen.text, keyboard=screen.keyboard)
     except Exception as e:
         await handle_error(update, language, e, "language_menu_callback")
 
@@ -999,8 +759,9 @@ async def politician_info_callback(update: Update, context: ContextTypes.DEFAULT
         await answer_callback(update)
 
         # Extract politician name if not provided
-        if not politician_name and query.data.startswith("politician:"):
-            politician_name = query.data.split(":", 1)[1]
+        if not politician_name:
+            args = await callback_args(query.data, "politician")
+            politician_name = args[0] if args else None
 
     telegram_id = str(update.effective_user.id)
     language = await get_user_language(telegram_id)
@@ -1008,6 +769,10 @@ async def politician_info_callback(update: Update, context: ContextTypes.DEFAULT
     if query and not await require_registration(update, language):
         return
 
+    if not politician_name:
+        await edit_or_reply(update, _("This button has expired. Please open the menu again.", language))
+        return
+
     try:
         # Get politician info
         politician_data = await get_politician_status(telegram_id, politician_name, language)
@@ -1162,63 +927,7 @@ async def view_collective_actions_callback(update: Update, context: ContextTypes
         return
 
     try:
-        # Get active collective actions
-        active_actions = await get_active_collective_actions()
-
-        if not active_actions:
-            await edit_or_reply(
-                update,
-                _("There are no active collective actions at the moment.", language),
-                keyboard=get_back_keyboard(language)
-            )
-            return
-
-        # Format and display active actions
-        actions_text = _("*Active Collective Actions*\n\n", language)
-
-        for action in active_actions:
-            action_id = action.get("collective_action_id", "unknown")
-            action_type = action.get("action_type", "unknown")
-            district = action.get("district_id", {}).get("name", "unknown")
-            initiator = action.get("initiator_player_id", {}).get("name", "unknown")
-
-            actions_text += _(
-                "*Action ID:* {id}\n"
-                "*Type:* {type}\n"
-                "*District:* {district}\n"
-                "*Initiated by:* {initiator}\n"
-                "*Join Command:* `/join {id}`\n\n",
-                language
-            ).format(
-                id=action_id,
-                type=_(action_type, language),
-                district=district,
-                initiator=initiator
-            )
-
-        # Add button to join a collective action
-        buttons = []
-        for action in active_actions[:3]:  # Limit to first 3 for cleaner UI
-            action_id = action.get("collective_action_id", "unknown")
-            action_type = action.get("action_type", "unknown")
-            district = action.get("district_id", {}).get("name", "unknown")
-
-            button_text = f"{_(action_type, language)} in {district}"
-            buttons.append([InlineKeyboardButton(button_text, callback_data=f"join_collective_action:{action_id}")])
-
-        # Add back button
-        buttons.append([InlineKeyboardButton(_("Back", language), callback_data="back_to_menu")])
-
-        # Create keyboard with join buttons
-        keyboard = InlineKeyboardMarkup(buttons)
-
-        # Send message with formatted text and join buttons
-        await edit_or_reply(
-            update,
-            actions_text,
-            keyboard=keyboard,
-            parse_mode="Markdown"
-        )
+        await show_page(update, context, "collective_actions")
     except Exception as e:
         await handle_error(update, language, e, "view_collective_actions_callback")
 
@@ -1296,60 +1005,57 @@ async def cancel_selection_callback(update: Update, context: ContextTypes.DEFAUL
         await handle_error(update, language, e, "cancel_selection_callback")
 
 
-# Register these additional callbacks in register_callbacks function:
-def register_additional_callbacks(application) -> None:
-    """Register additional callback handlers."""
-    # News pagination
-    application.add_handler(CallbackQueryHandler(news_page_callback, pattern=r"^news_page:"))
+def _register_route(registry, name: str, handler) -> None:
+    """Register a handler for every form of a packed route's callback_data."""
+    for prefix in prefixes(name):
+        registry.register_callback(prefix, handler, prefix=True)
 
-    # Settings and language
-    application.add_handler(CallbackQueryHandler(settings_menu_callback, pattern=r"^settings$"))
-    application.add_handler(CallbackQueryHandler(language_menu_callback, pattern=r"^settings:language$"))
-    application.add_handler(CallbackQueryHandler(language_setting_callback, pattern=r"^language:"))
 
 def register_callbacks(registry) -> None:
     """Register all callback query handlers."""
     # Main menu callbacks
-    registry.register_callback("^status$", status_callback)
-    registry.register_callback("^map$", map_callback)
-    registry.register_callback("^news$", news_callback)
-    registry.register_callback("^resources$", resources_callback)
-    registry.register_callback("^action$", action_button_callback)
-    registry.register_callback("^quick_action$", quick_action_button_callback)
-    registry.register_callback("^politicians$", politicians_button_callback)
+    registry.register_callback("status", status_callback)
+    registry.register_callback("map", map_callback)
+    registry.register_callback("news", news_callback)
+    registry.register_callback("resources", resources_callback)
+    registry.register_callback("action", action_button_callback)
+    registry.register_callback("quick_action", quick_action_button_callback)
+    registry.register_callback("politicians", politicians_button_callback)
 
     # Secondary menu callbacks
-    registry.register_callback("^actions_left$", actions_left_callback)
-    registry.register_callback("^controlled_districts$", controlled_districts_callback)
-    registry.register_callback("^check_income$", check_income_callback)
-    registry.register_callback("^select_district$", select_district_callback)
-    registry.register_callback("^view_collective_actions$", view_collective_actions_callback)
+    registry.register_callback("actions_left", actions_left_callback)
+    registry.register_callback("controlled_districts", controlled_districts_callback)
+    registry.register_callback("check_income", check_income_callback)
+    registry.register_callback("select_district", select_district_callback)
+    registry.register_callback("view_collective_actions", view_collective_actions_callback)
 
     # Information callbacks
-    registry.register_callback("^district:", district_info_callback)
-    registry.register_callback("^back_to_politicians$", back_to_politicians_callback)
-    registry.register_callback("^politicians:", politicians_type_callback)
-    registry.register_callback("^politician:", politician_info_callback)
+    _register_route(registry, "district", district_info_callback)
+    registry.register_callback("back_to_politicians", back_to_politicians_callback)
+    registry.register_callback("politicians:", politicians_type_callback, prefix=True)
+    _register_route(registry, "politician", politician_info_callback)
 
     # Action callbacks
-    registry.register_callback("^exchange_resources$", exchange_resources_callback)
-    registry.register_callback("^politician_action:", politician_action_handler)
-    registry.register_callback("^join_collective_action:", join_collective_action_callback)
-    registry.register_callback("^cancel_selection$", cancel_selection_callback)
+    registry.register_callback("exchange_resources", exchange_resources_callback)
+    _register_route(registry, "politician_action", politician_action_handler)
+    _register_route(registry, "join_collective_action", join_collective_action_callback)
+    registry.register_callback("cancel_selection", cancel_selection_callback)
 
     # Help callbacks
-    registry.register_callback("^help:", help_section_callback_wrapper)
+    registry.register_callback("help:", help_section_callback_wrapper, prefix=True)
 
     # Navigation callbacks
-    registry.register_callback("^(back_to_menu|help)$", general_callback)
+    registry.register_callback("back_to_menu", general_callback)
+    registry.register_callback("help", general_callback)
 
-    # News pagination
-    registry.register_callback("^news_page:", news_page_callback)
+    # List pagination
+    registry.register_callback("page:", page_callback, prefix=True)
+    registry.register_callback("news_page:", page_callback, prefix=True)
 
     # Settings and language
-    registry.register_callback("^settings$", settings_menu_callback)
-    registry.register_callback("^settings:language$", language_menu_callback)
-    registry.register_callback("^language:", language_setting_callback)
+    registry.register_callback("settings", settings_menu_callback)
+    registry.register_callback("settings:language", language_menu_callback)
+    registry.register_callback("language:", language_setting_callback, prefix=True)
 
-    # Register catch-all handler for any remaining patterns
-    registry.register_other_handler(CallbackQueryHandler(general_callback))
+    # Anything else, including callback_data of removed buttons
+    registry.register_callback_fallback(general_callback)
@@ -12,35 +12,33 @@ from telegram.ext import ContextTypes, CommandHandler, ConversationHandler
 
 from bot.keyboards import (
     get_start_keyboard,
-    get_help_keyboard,
     get_status_keyboard,
-    get_map_keyboard,
     get_action_keyboard,
     get_quick_action_keyboard,
     get_districts_keyboard,
     get_resources_keyboard,
     get_politicians_keyboard,
-    get_back_keyboard
+    get_back_keyboard,
+    invalidate_districts
 )
+from bot.map_view import get_map_screen, invalidate_map
+from bot.pagination import show_page
+from bot.screens import get_screen
 from bot.states import NAME_ENTRY, resource_conversion_start
 from db import (
     player_exists,
     get_player,
     get_cycle_info,
-    get_latest_news,
     cancel_latest_action,
-    get_map_data,
     check_income,
     get_politicians,
     get_politician_status,
-    get_active_collective_actions,
     get_district_info
 )
 from utils.formatting import (
     format_player_status,
     format_time,
     format_cycle_info,
-    format_news,
     format_district_info,
     format_income_info,
     format_politicians_list,
@@ -48,6 +46,7 @@ from utils.formatting import (
 )
 from utils.i18n import _, get_user_language, set_user_language
 from utils.error_handling import require_registration, handle_error
+from utils.markdown import MessageBuilder
 from utils.message_utils import send_message, edit_or_reply
 from utils.context_manager import get_user_data, set_user_data, clear_user_data
 
@@ -94,45 +93,13 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     telegram_id = str(update.effective_user.id)
     language = await get_user_language(telegram_id)
 
-    help_text = _(
-        "*Here are the available commands:*\n\n"
-        "*Basic Commands*\n"
-        "/start - Start the game, register as a player\n"
-        "/help - Show this help message\n"
-        "/status - Show your current status (resources, districts)\n"
-        "/map - Show the current map of district control\n"
-        "/time - Show current game cycle information\n"
-        "/news - Show the latest news\n\n"
-
-        "*Action Commands*\n"
-        "/action - Submit a main action\n"
-        "/quick_action - Submit a quick action\n"
-        "/cancel_action - Cancel your last action\n"
-        "/actions_left - Check remaining actions\n"
-        "/view_district - View district information\n\n"
-
-        "*Resource Commands*\n"
-        "/resources - View your current resources\n"
-        "/convert_resource - Convert resources\n"
-        "/check_income - Check expected resource income\n\n"
-
-        "*Politicians Commands*\n"
-        "/politicians - List available politicians\n"
-        "/politician_status - Information about a politician\n"
-        "/international - Information about international politicians\n\n"
-
-        "*Collective Action Commands*\n"
-        "/collective - Initiate a collective action\n"
-        "/join - Join a collective action\n"
-        "/active_actions - View all active collective actions",
-        language
-    )
+    screen = get_screen("help", language)
 
     await send_message(
         update,
-        help_text,
-        keyboard=get_help_keyboard(language),
-        parse_mode="Markdown",
+        screen.text,
+        keyboard=screen.keyboard,
+        parse_mode=screen.parse_mode,
         context=context
     )
 
@@ -180,10 +147,10 @@ async def map_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         return
 
     try:
-        # Get map data
-        map_data = await get_map_data(language)
+        # Rendered once per cycle and language, shared by everyone
+        screen = await get_map_screen(language)
 
-        if not map_data:
+        if not screen:
             await send_message(
                 update,
                 _("Error retrieving map data. Please try again later.", language),
@@ -191,40 +158,11 @@ async def map_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
             )
             return
 
-        # Format and build map message
-        districts = map_data.get("districts", [])
-        game_date = map_data.get("game_date", "Unknown")
-        cycle = map_data.get("cycle", "Unknown")
-
-        map_text = _(
-            "*Current Map of Novi-Sad*\n"
-            "Date: {date}, {cycle} cycle\n\n"
-            "District Control:\n",
-            language
-        ).format(date=game_date, cycle=cycle)
-
-        for district in districts:
-            name = district.get("name", "Unknown")
-            controlling_player = district.get("controlling_player", _("None", language))
-            control_level = district.get("control_level", "neutral")
-
-            control_symbol = "🔴" if control_level == "strong" else "🟠" if control_level == "controlled" else "🟡" if control_level == "contested" else "⚪"
-
-            map_text += f"{control_symbol} *{name}*: "
-            if controlling_player != _("None", language):
-                map_text += _("Controlled by {player}", language).format(player=controlling_player)
-            else:
-                map_text += _("No clear control", language)
-            map_text += "\n"
-
-        # Add map link if available
-        map_text += "\n" + _("For a visual map, use the button below:", language)
-
         await send_message(
             update,
-            map_text,
-            keyboard=get_map_keyboard(language),
-            parse_mode="Markdown",
+            screen.text,
+            keyboard=screen.keyboard,
+            parse_mode=screen.parse_mode,
             context=context
         )
     except Exception as e:
@@ -279,71 +217,7 @@ async def active_collective_actions_command(update: Update, context: ContextType
         return
 
     try:
-        # Get active collective actions
-        active_actions = await get_active_collective_actions()
-
-        if not active_actions:
-            await send_message(
-                update,
-                _("There are no active collective actions at the moment.", language),
-                keyboard=get_back_keyboard(language),
-                context=context
-            )
-            return
-
-        # Format and display active actions
-        actions_text = _("*Active Collective Actions*\n\n", language)
-
-        for action in active_actions:
-            action_id = action.get("collective_action_id", "unknown")
-            action_type = action.get("action_type", "unknown")
-            district = action.get("district_id", {}).get("name", "unknown")
-            initiator = action.get("initiator_player_id", {}).get("name", "unknown")
-
-            actions_text += _(
-                "*Action ID:* {id}\n"
-                "*Type:* {type}\n"
-                "*District:* {district}\n"
-                "*Initiated by:* {initiator}\n"
-                "*Join Command:* `/join {id}`\n\n",
-                language
-            ).format(
-                id=action_id,
-                type=_(action_type, language),
-                district=district,
-                initiator=initiator
-            )
-
-        # Create keyboard with join buttons for first 3 actions
-        buttons = []
-        for action in active_actions[:3]:  # Limit to first 3 for cleaner UI
-            action_id = action.get("collective_action_id", "unknown")
-            action_type = action.get("action_type", "unknown")
-            district = action.get("district_id", {}).get("name", "unknown")
-
-            button_text = f"{_(action_type, language)} in {district}"
-            buttons.append([{"text": button_text, "callback_data": f"join_collective_action:{action_id}"}])
-
-        # Add back button
-        buttons.append([{"text": _("Back", language), "callback_data": "back_to_menu"}])
-
-        # Create keyboard markup
-        from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-        keyboard = []
-        for row in buttons:
-            keyboard_row = []
-            for button in row:
-                keyboard_row.append(InlineKeyboardButton(button["text"], callback_data=button["callback_data"]))
-            keyboard.append(keyboard_row)
-
-        # Send message with formatted text and join buttons
-        await send_message(
-            update,
-            actions_text,
-            keyboard=InlineKeyboardMarkup(keyboard),
-            parse_mode="Markdown",
-            context=context
-        )
+        await show_page(update, context, "collective_actions")
     except Exception as e:
         await handle_error(update, language, e, "active_collective_actions_command")
 
@@ -389,49 +263,14 @@ async def news_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
     try:
         # Get count parameter if provided
-        count = 5
+        count = None
         if context.args and len(context.args) > 0:
             try:
                 count = int(context.args[0])
             except ValueError:
                 pass
 
-        # Get latest news
-        news_data = await get_latest_news(telegram_id, count=count, language=language)
-
-        if not news_data:
-            await send_message(
-                update,
-                _("Error retrieving news. Please try again later.", language),
-                context=context
-            )
-            return
-
-        # Format and send news
-        news_text = await format_news(news_data, language)
-
-        # Create pagination buttons for news
-        from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-        buttons = []
-
-        # Add navigation row if there's more news
-        if count <= 5:  # Only show "Next" if we're showing first 5
-            buttons.append([
-                InlineKeyboardButton(_("More News", language), callback_data="news_page:next")
-            ])
-
-        # Add back to menu button
-        buttons.append([
-            InlineKeyboardButton(_("Back to Menu", language), callback_data="back_to_menu")
-        ])
-
-        await send_message(
-            update,
-            news_text,
-            keyboard=InlineKeyboardMarkup(buttons),
-            parse_mode="Markdown",
-            context=context
-        )
+        await show_page(update, context, "news", limit=count)
     except Exception as e:
         await handle_error(update, language, e, "news_command")
 
@@ -927,6 +766,9 @@ async def admin_process_actions_command(update: Update, context: ContextTypes.DE
         result = await admin_process_actions(telegram_id)
 
         if result and result.get("success"):
+            # Processing changes district control and starts a new cycle
+            invalidate_map()
+            invalidate_districts()
             actions_processed = result.get("actions_processed", 0)
             collective_actions_processed = result.get("collective_actions_processed", 0)
 
@@ -979,19 +821,19 @@ async def admin_generate_effects_command(update: Update, context: ContextTypes.D
             effects_generated = result.get("effects_generated", 0)
             effects = result.get("effects", [])
 
-            effects_text = ""
+            message = MessageBuilder()
             for effect in effects:
                 politician = effect.get("politician", "Unknown")
                 effect_type = effect.get("effect_type", "Unknown")
                 description = effect.get("description", "No details")
 
-                effects_text += f"• {politician}: {effect_type}\n  {description}\n\n"
+                message.text(f"• {politician}: {effect_type}").line().text(f"  {description}").line().line()
 
             await send_message(
                 update,
                 _("Generated {count} international effects:\n\n{effects}", language).format(
                     count=effects_generated,
-                    effects=effects_text
+                    effects=message.build()
                 ),
                 context=context
             )
@@ -1010,6 +852,44 @@ async def admin_generate_effects_command(update: Update, context: ContextTypes.D
         )
 
 
+async def admin_reload_translations_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle the /admin_reload_translations command - reload translations without a restart (admin only)."""
+    telegram_id = str(update.effective_user.id)
+    language = await get_user_language(telegram_id)
+
+    from bot.middleware import is_admin
+    from utils.i18n import reload_translations
+
+    if not is_admin(update.effective_user.id):
+        await send_message(update, _("This command is only available to administrators.", language), context=context)
+        return
+
+    try:
+        counts = await reload_translations()
+
+        # The reply is rendered from the new catalogs
+        language = await get_user_language(telegram_id)
+        await send_message(
+            update,
+            _("Translations reloaded:\n\n"
+              "English: {en_count} keys\n"
+              "Russian: {ru_count} keys\n"
+              "From database: {db_count}", language).format(
+                en_count=counts.get("en_US", 0),
+                ru_count=counts.get("ru_RU", 0),
+                db_count=counts.get("database", 0)
+            ),
+            context=context
+        )
+    except Exception as e:
+        logger.error(f"Error in admin_reload_translations: {str(e)}")
+        await send_message(
+            update,
+            _("An error occurred while reloading translations: {error}", language).format(error=str(e)),
+            context=context
+        )
+
+
 def register_commands(registry) -> None:
     """Register all command handlers."""
     registry.register_command("help", help_command)
@@ -1033,4 +913,5 @@ def register_commands(registry) -> None:
     registry.register_command("collective", collective_command)
     registry.register_command("join", join_command)
     registry.register_command("admin_process", admin_process_actions_command)
-    registry.register_command("admin_generate", admin_generate_effects_command)
\ No newline at end of file
+    registry.register_command("admin_generate", admin_generate_effects_command)
+    registry.register_command("admin_reload_translations", admin_reload_translations_command)
\ No newline at end of file
@@ -4,10 +4,16 @@
 """
 Unified handler registration for the Meta Game bot.
 This module centralizes command and callback registration logic.
+
+Callback queries outside conversations go through a single handler: the
+CallbackRouter looks callback_data up in an exact-match table, then walks a
+prefix trie for the longest registered prefix, instead of PTB trying one
+regex per handler. Hits and handler latency are counted per route.
 """
 
 import logging
-from typing import Dict, List, Callable, Any, Optional
+import time
+from typing import Dict, List, Callable, Any, Optional, Tuple
 
 from telegram.ext import (
     Application,
@@ -22,12 +28,132 @@ from telegram.ext import (
 logger = logging.getLogger(__name__)
 
 
+class _TrieNode:
+    __slots__ = ("children", "route", "handler")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.route: Optional[str] = None
+        self.handler: Optional[Callable] = None
+
+
+class CallbackRouter:
+    """Routes callback_data by exact match, then by the longest registered prefix."""
+
+    FALLBACK_ROUTE = "*"
+
+    def __init__(self):
+        self._exact: Dict[str, Callable] = {}
+        self._prefixes: Dict[str, Callable] = {}
+        self._root = _TrieNode()
+        self.fallback: Optional[Callable] = None
+        # route -> [hits, total seconds, slowest seconds]
+        self._stats: Dict[str, List[float]] = {}
+
+    def add(self, route: str, handler: Callable, prefix: bool = False) -> None:
+        """Add a route. A route registered twice for different handlers is a conflict."""
+        table = self._prefixes if prefix else self._exact
+        existing = table.get(route)
+        if existing is not None:
+            if existing is handler:
+                logger.warning(f"Duplicate callback route {route!r} for {handler.__name__}")
+                return
+            raise ValueError(
+                f"Callback route {route!r} registered for both {existing.__name__} and {handler.__name__}"
+            )
+        table[route] = handler
+
+        if prefix:
+            node = self._root
+            for char in route:
+                node = node.children.setdefault(char, _TrieNode())
+            node.route = route
+            node.handler = handler
+
+    def _longest_prefix(self, data: str, limit: Optional[int] = None) -> Tuple[Optional[str], Optional[Callable]]:
+        route, handler = None, None
+        node = self._root
+        for char in data[:limit]:
+            node = node.children.get(char)
+            if node is None:
+                break
+            if node.handler is not None:
+                route, handler = node.route, node.handler
+        return route, handler
+
+    def resolve(self, data: str) -> Tuple[str, Optional[Callable]]:
+        """Route name and handler for callback_data; the fallback if nothing matches."""
+        handler = self._exact.get(data)
+        if handler is not None:
+            return data, handler
+        route, handler = self._longest_prefix(data)
+        if handler is not None:
+            return route, handler
+        return self.FALLBACK_ROUTE, self.fallback
+
+    def check(self) -> List[str]:
+        """Describe routes that hide others; run once the routes are registered."""
+        problems = []
+        for route, handler in self._exact.items():
+            shadowed, other = self._longest_prefix(route)
+            if other is not None and other is not handler:
+                problems.append(f"exact route {route!r} ({handler.__name__}) takes precedence over "
+                                f"prefix {shadowed!r} ({other.__name__})")
+        for route, handler in self._prefixes.items():
+            shorter, other = self._longest_prefix(route, len(route) - 1)
+            if other is not None and other is not handler:
+                problems.append(f"prefix {route!r} ({handler.__name__}) narrows "
+                                f"prefix {shorter!r} ({other.__name__})")
+        for problem in problems:
+            logger.warning(f"Callback routes overlap: {problem}")
+        return problems
+
+    async def dispatch(self, update: Any, context: Any) -> Any:
+        """The single CallbackQueryHandler callback."""
+        route, handler = self.resolve(update.callback_query.data or "")
+        if handler is None:
+            logger.warning(f"No callback route for {update.callback_query.data!r}")
+            return None
+
+        start = time.perf_counter()
+        try:
+            return await handler(update, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = self._stats.get(route)
+            if stats is None:
+                stats = self._stats[route] = [0, 0.0, 0.0]
+            stats[0] += 1
+            stats[1] += elapsed
+            if elapsed > stats[2]:
+                stats[2] = elapsed
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Hits and handler latency per route."""
+        return {
+            route: {"hits": hits, "avg_ms": total * 1000 / hits, "max_ms": slowest * 1000}
+            for route, (hits, total, slowest) in self._stats.items()
+        }
+
+    def log_stats(self) -> None:
+        """Log the busiest routes."""
+        busiest = sorted(self.stats().items(), key=lambda item: item[1]["hits"], reverse=True)[:10]
+        if busiest:
+            logger.info("Callback routes: " + ", ".join(
+                f"{route} {values['hits']} hits, {values['avg_ms']:.1f} ms avg, {values['max_ms']:.1f} ms max"
+                for route, values in busiest
+            ))
+
+    def __len__(self) -> int:
+        return len(self._exact) + len(self._prefixes)
+
+
 class HandlerRegistry:
     """Central registry for all bot handlers."""
 
     def __init__(self):
         self.command_handlers: Dict[str, Callable] = {}
-        self.callback_handlers: Dict[str, Callable] = {}
+        self.callback_router = CallbackRouter()
         self.conversation_handlers: List[ConversationHandler] = []
         self.message_handlers: List[MessageHandler] = []
         self.other_handlers: List[Any] = []
@@ -38,10 +164,14 @@ class HandlerRegistry:
         self.command_handlers[command] = handler
         logger.debug(f"Registered command handler: /{command}")
 
-    def register_callback(self, pattern: str, handler: Callable) -> None:
-        """Register a callback query handler with regex pattern."""
-        self.callback_handlers[pattern] = handler
-        logger.debug(f"Registered callback handler with pattern: {pattern}")
+    def register_callback(self, route: str, handler: Callable, prefix: bool = False) -> None:
+        """Register a callback query handler for exact callback_data, or for a prefix of it."""
+        self.callback_router.add(route, handler, prefix)
+        logger.debug(f"Registered callback handler for {'prefix' if prefix else 'route'} {route!r}")
+
+    def register_callback_fallback(self, handler: Callable) -> None:
+        """Register the handler for callback_data no route matches."""
+        self.callback_router.fallback = handler
 
     def register_conversation(self, conversation_handler: ConversationHandler) -> None:
         """Register a conversation handler."""
@@ -75,9 +205,9 @@ class HandlerRegistry:
             if command not in self._added_commands:
                 application.add_handler(CommandHandler(command, handler))
 
-        # Add callback handlers
-        for pattern, handler in self.callback_handlers.items():
-            application.add_handler(CallbackQueryHandler(handler, pattern=pattern))
+        # One handler routes every callback query outside conversations
+        self.callback_router.check()
+        application.add_handler(CallbackQueryHandler(self.callback_router.dispatch))
 
         # Add message handlers
         for handler in self.message_handlers:
@@ -88,7 +218,7 @@ class HandlerRegistry:
             application.add_handler(handler)
 
         logger.info(
-            f"Applied {len(self.command_handlers)} commands, {len(self.callback_handlers)} callbacks, "
+            f"Applied {len(self.command_handlers)} commands, {len(self.callback_router)} callback routes, "
             f"{len(self.conversation_handlers)} conversations, {len(self.message_handlers)} message handlers, "
             f"and {len(self.other_handlers)} other handlers"
         )
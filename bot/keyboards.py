@@ -3,20 +3,78 @@
 
 """
 Keyboard layouts and builders for the Meta Game bot.
+
+Most keyboards depend only on the language and a few parameters. Those
+builders are memoized on (name, language, params): keyboards are immutable
+Telegram objects, so every user is sent the same instance. The cache is
+prebuilt at startup and dropped when translations are reloaded.
 """
 
+import functools
 import logging
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
+from bot.callback_data import encode
 from db import get_districts
-from utils.i18n import _
+from utils.i18n import _, SUPPORTED_LANGUAGES
+from utils.i18n_core import add_reload_listener
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+_keyboard_cache: Dict[Tuple[Any, ...], InlineKeyboardMarkup] = {}
+# Builders prebuilt for every language at startup, with their default parameters
+_prebuilt: List[Callable[..., InlineKeyboardMarkup]] = []
+
+
+def cached_keyboard(builder: Callable[..., InlineKeyboardMarkup]) -> Callable[..., InlineKeyboardMarkup]:
+    """Memoize a keyboard builder whose output depends only on its (hashable) arguments."""
+    name = builder.__name__
+
+    @functools.wraps(builder)
+    def wrapper(*args, **kwargs) -> InlineKeyboardMarkup:
+        key = (name, args, tuple(sorted(kwargs.items()))) if kwargs else (name, args)
+        keyboard = _keyboard_cache.get(key)
+        if keyboard is None:
+            keyboard = _keyboard_cache[key] = builder(*args, **kwargs)
+        return keyboard
+
+    return wrapper
+
+
+def prebuilt_keyboard(builder: Callable[..., InlineKeyboardMarkup]) -> Callable[..., InlineKeyboardMarkup]:
+    """cached_keyboard for a builder taking just the language, which is also built at startup."""
+    cached = cached_keyboard(builder)
+    _prebuilt.append(cached)
+    return cached
+
 
+def prebuild_keyboards() -> int:
+    """Build the language-only keyboards for every language. Returns the number built."""
+    for builder in _prebuilt:
+        for language in SUPPORTED_LANGUAGES:
+            try:
+                builder(language)
+            except Exception as e:
+                logger.error(f"Error building keyboard {builder.__name__} for {language}: {e}")
+    logger.info(f"Prebuilt {len(_keyboard_cache)} keyboards")
+    return len(_keyboard_cache)
+
+
+def clear_keyboards() -> None:
+    """Drop cached keyboards, e.g. after translations changed, and build the common ones again."""
+    _keyboard_cache.clear()
+    _districts_keyboards.clear()
+    prebuild_keyboards()
+
+
+# Registered on import, so it runs before the screen registry re-renders with these keyboards
+add_reload_listener(clear_keyboards)
+
+
+@prebuilt_keyboard
 def get_start_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get the welcome keyboard for returning players."""
     keyboard = [
@@ -41,6 +99,7 @@ def get_start_keyboard(language: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@prebuilt_keyboard
 def get_ideology_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get keyboard for ideology selection."""
     keyboard = [
@@ -63,6 +122,7 @@ def get_ideology_keyboard(language: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@prebuilt_keyboard
 def get_help_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get keyboard for help menu."""
     keyboard = [
@@ -84,6 +144,7 @@ def get_help_keyboard(language: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@prebuilt_keyboard
 def get_status_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get keyboard for status menu."""
     keyboard = [
@@ -102,6 +163,7 @@ def get_status_keyboard(language: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@prebuilt_keyboard
 def get_map_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get keyboard for map view."""
     from utils.config import get_config
@@ -127,7 +189,7 @@ def get_collective_action_info_keyboard(action_id: str, language: str) -> Inline
         [
             InlineKeyboardButton(
                 _("Join Action", language),
-                callback_data=f"join_collective_action:{action_id}"
+                callback_data=encode("join_collective_action", action_id)
             )
         ],
         [
@@ -137,6 +199,7 @@ def get_collective_action_info_keyboard(action_id: str, language: str) -> Inline
     return InlineKeyboardMarkup(keyboard)
 
 
+@prebuilt_keyboard
 def get_action_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get keyboard for main action selection."""
     keyboard = [
@@ -164,6 +227,7 @@ def get_action_keyboard(language: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@prebuilt_keyboard
 def get_quick_action_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get keyboard for quick action selection."""
     keyboard = [
@@ -182,21 +246,68 @@ def get_quick_action_keyboard(language: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+# District names the districts keyboards are built from; None until fetched or after invalidate_districts()
+_district_names: Optional[Tuple[str, ...]] = None
+# Bumped whenever the district names change
+_districts_version = 0
+# Districts keyboard per language, with the catalog version it was built from
+_districts_keyboards: Dict[str, Tuple[int, InlineKeyboardMarkup]] = {}
+
+
 async def get_districts_keyboard(language: str) -> InlineKeyboardMarkup:
-    """Get keyboard with all districts."""
-    districts = await get_districts()
+    """Get keyboard with all districts; the district list is only fetched when not known yet."""
+    if _district_names is None:
+        districts = await get_districts()
+        if not districts:
+            # Nothing to cache when the database is unavailable
+            return _build_districts_keyboard((), language)
+        _set_districts(districts)
+    return _districts_keyboard(language)
+
+
+def prebuild_districts_keyboards(districts: List[Dict[str, Any]]) -> int:
+    """Build the districts keyboard for every language from an already fetched district list."""
+    _set_districts(districts)
+    for language in SUPPORTED_LANGUAGES:
+        _districts_keyboard(language)
+    return len(_districts_keyboards)
+
+
+def invalidate_districts() -> None:
+    """Report that the districts table changed; the next districts keyboard fetches it again."""
+    global _district_names
+    _district_names = None
+
+
+def _set_districts(districts: List[Dict[str, Any]]) -> None:
+    global _district_names, _districts_version
+    names = tuple(district.get("name", "Unknown") for district in districts)
+    if names != _district_names:
+        _districts_version += 1
+    _district_names = names
 
+
+def _districts_keyboard(language: str) -> InlineKeyboardMarkup:
+    cached = _districts_keyboards.get(language)
+    if cached is not None and cached[0] == _districts_version:
+        return cached[1]
+
+    keyboard = _build_districts_keyboard(_district_names or (), language)
+    _districts_keyboards[language] = (_districts_version, keyboard)
+    return keyboard
+
+
+def _build_districts_keyboard(names: Tuple[str, ...], language: str) -> InlineKeyboardMarkup:
     # Group districts into rows of 2
     keyboard = []
     row = []
 
-    for district in districts:
-        district_name = district.get("name", "Unknown")
+    for district_name in names:
         if len(row) < 2:
-            row.append(InlineKeyboardButton(district_name, callback_data=f"district:{district_name}"))
+            row.append(InlineKeyboardButton(district_name, callback_data=encode("district", district_name)))
         else:
             keyboard.append(row)
-            row = [InlineKeyboardButton(district_name, callback_data=f"district:{district_name}")]
+            row = [InlineKeyboardButton(district_name, callback_data=encode("district", district_name))]
 
     if row:  # Add any remaining items
         keyboard.append(row)
@@ -207,6 +318,7 @@ async def get_districts_keyboard(language: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@prebuilt_keyboard
 def get_resources_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get keyboard for resource management."""
     keyboard = [
@@ -221,6 +333,7 @@ def get_resources_keyboard(language: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@cached_keyboard
 def get_resource_type_keyboard(language: str, exclude_type: str = None) -> InlineKeyboardMarkup:
     """Get keyboard for selecting resource type, optionally excluding one type."""
     keyboard = []
@@ -256,10 +369,14 @@ def get_resource_type_keyboard(language: str, exclude_type: str = None) -> Inlin
 
 def get_resource_amount_keyboard(language: str, max_amount: int = 5) -> InlineKeyboardMarkup:
     """Get keyboard for selecting resource amount."""
-    keyboard = []
+    # Buttons for amounts 1-5 (or max_amount), so only six keyboards per language
+    return _resource_amount_keyboard(language, max(0, min(max_amount, 5)))
+
 
-    # Create buttons for amounts 1-5 (or max_amount)
-    amounts = list(range(1, min(max_amount + 1, 6)))
+@cached_keyboard
+def _resource_amount_keyboard(language: str, max_amount: int) -> InlineKeyboardMarkup:
+    keyboard = []
+    amounts = list(range(1, max_amount + 1))
 
     # Group into rows of 3
     for i in range(0, len(amounts), 3):
@@ -274,6 +391,7 @@ def get_resource_amount_keyboard(language: str, max_amount: int = 5) -> InlineKe
     return InlineKeyboardMarkup(keyboard)
 
 
+@prebuilt_keyboard
 def get_politicians_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get keyboard for politician type selection."""
     keyboard = [
@@ -303,25 +421,25 @@ def get_politician_interaction_keyboard(language: str, politician_data: Dict[str
     if possible_actions.get("influence", False):
         actions.append(InlineKeyboardButton(
             _("Increase Influence", language),
-            callback_data=f"politician_action:influence:{politician_data.get('name')}"
+            callback_data=encode("politician_action", "influence", politician_data.get("name"))
         ))
 
     if possible_actions.get("attack_reputation", False):
         actions.append(InlineKeyboardButton(
             _("Attack Reputation", language),
-            callback_data=f"politician_action:attack:{politician_data.get('name')}"
+            callback_data=encode("politician_action", "attack", politician_data.get("name"))
         ))
 
     if possible_actions.get("displacement", False):
         actions.append(InlineKeyboardButton(
             _("Displacement", language),
-            callback_data=f"politician_action:displace:{politician_data.get('name')}"
+            callback_data=encode("politician_action", "displace", politician_data.get("name"))
         ))
 
     if possible_actions.get("request_resources", False):
         actions.append(InlineKeyboardButton(
             _("Request Resources", language),
-            callback_data=f"politician_action:request:{politician_data.get('name')}"
+            callback_data=encode("politician_action", "request", politician_data.get("name"))
         ))
 
     # Group actions into rows of 2
@@ -335,6 +453,7 @@ def get_politician_interaction_keyboard(language: str, politician_data: Dict[str
     return InlineKeyboardMarkup(keyboard)
 
 
+@prebuilt_keyboard
 def get_confirmation_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get keyboard for confirmation dialogs."""
     keyboard = [
@@ -346,6 +465,7 @@ def get_confirmation_keyboard(language: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@prebuilt_keyboard
 def get_yes_no_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get keyboard with Yes/No options."""
     keyboard = [
@@ -357,6 +477,7 @@ def get_yes_no_keyboard(language: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@prebuilt_keyboard
 def get_physical_presence_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get keyboard for physical presence selection."""
     keyboard = [
@@ -368,6 +489,7 @@ def get_physical_presence_keyboard(language: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@cached_keyboard
 def get_back_keyboard(language: str, callback_data: str = "back_to_menu") -> InlineKeyboardMarkup:
     """Get a simple back button keyboard."""
     keyboard = [
@@ -378,6 +500,7 @@ def get_back_keyboard(language: str, callback_data: str = "back_to_menu") -> Inl
     return InlineKeyboardMarkup(keyboard)
 
 
+@cached_keyboard
 def get_language_keyboard() -> InlineKeyboardMarkup:
     """Get keyboard for language selection."""
     keyboard = [
@@ -389,6 +512,7 @@ def get_language_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@prebuilt_keyboard
 def get_collective_action_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get keyboard for collective action type selection."""
     keyboard = [
@@ -408,6 +532,7 @@ def setup_i18n():
     logger.info("Initializing internationalization system")
 
 
+@prebuilt_keyboard
 def get_settings_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get keyboard for settings menu."""
     keyboard = [
@@ -422,18 +547,19 @@ def get_settings_keyboard(language: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
-def get_news_keyboard(language: str, page: int = 0, has_next: bool = False) -> InlineKeyboardMarkup:
-    """Get keyboard for news display with pagination."""
-    buttons = []
+def get_pagination_keyboard(language: str, source: str, has_prev: bool = False, has_next: bool = False,
+                            rows: Optional[List[List[InlineKeyboardButton]]] = None) -> InlineKeyboardMarkup:
+    """Get keyboard for a page of a paginated list, below the page's own buttons."""
+    buttons = list(rows or [])
 
     # Add pagination buttons if needed
     navigation_row = []
 
-    if page > 0:
-        navigation_row.append(InlineKeyboardButton("◀️ " + _("Previous", language), callback_data="news_page:prev"))
+    if has_prev:
+        navigation_row.append(InlineKeyboardButton("◀️ " + _("Previous", language), callback_data=f"page:{source}:prev"))
 
     if has_next:
-        navigation_row.append(InlineKeyboardButton(_("Next", language) + " ▶️", callback_data="news_page:next"))
+        navigation_row.append(InlineKeyboardButton(_("Next", language) + " ▶️", callback_data=f"page:{source}:next"))
 
     if navigation_row:
         buttons.append(navigation_row)
@@ -446,6 +572,7 @@ def get_news_keyboard(language: str, page: int = 0, has_next: bool = False) -> I
     return InlineKeyboardMarkup(buttons)
 
 
+@prebuilt_keyboard
 def get_cancel_button(language: str) -> InlineKeyboardMarkup:
     """Get a simple cancel button keyboard."""
     keyboard = [
@@ -456,6 +583,7 @@ def get_cancel_button(language: str) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@prebuilt_keyboard
 def get_yes_no_cancel_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get keyboard with Yes/No/Cancel options."""
     keyboard = [
@@ -474,7 +602,7 @@ def get_join_collective_action_keyboard(action_id: str, language: str) -> Inline
     """Get keyboard for joining a specific collective action."""
     keyboard = [
         [
-            InlineKeyboardButton(_("Join", language), callback_data=f"join_collective_action:{action_id}")
+            InlineKeyboardButton(_("Join", language), callback_data=encode("join_collective_action", action_id))
         ],
         [
             InlineKeyboardButton(_("Back", language), callback_data="back_to_menu")
@@ -484,6 +612,7 @@ def get_join_collective_action_keyboard(action_id: str, language: str) -> Inline
 
 
 
+@prebuilt_keyboard
 def get_extended_start_keyboard(language: str) -> InlineKeyboardMarkup:
     """Get an extended version of the welcome keyboard with more options."""
     keyboard = [
@@ -528,24 +657,11 @@ async def create_standard_keyboard(
     """Create standard keyboards with proper translations."""
 
     if keyboard_type == "yes_no":
-        return InlineKeyboardMarkup([
-            [
-                InlineKeyboardButton(_("Yes", language), callback_data="yes"),
-                InlineKeyboardButton(_("No", language), callback_data="no")
-            ]
-        ])
+        return get_yes_no_keyboard(language)
     elif keyboard_type == "confirmation":
-        return InlineKeyboardMarkup([
-            [
-                InlineKeyboardButton(_("Confirm", language), callback_data="confirm"),
-                InlineKeyboardButton(_("Cancel", language), callback_data="cancel_selection")
-            ]
-        ])
+        return get_confirmation_keyboard(language)
     elif keyboard_type == "back":
-        callback = kwargs.get("callback_data", "back_to_menu")
-        return InlineKeyboardMarkup([
-            [InlineKeyboardButton(_("Back", language), callback_data=callback)]
-        ])
+        return get_back_keyboard(language, kwargs.get("callback_data", "back_to_menu"))
 
     # Default back button
     return get_back_keyboard(language)
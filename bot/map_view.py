@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Shared map view for the Meta Game bot.
+
+The district control map only changes when a cycle's results are processed,
+and looks the same for every user of a language. The map data is fetched
+once per (cycle, map version), each language's text and keyboard are
+rendered on first use, and everyone is served the same Screen until the
+cycle rolls over or invalidate_map() reports a change.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from bot.keyboards import get_map_keyboard
+from bot.screens import Screen
+from db import get_cycle_info, get_map_data
+from utils.formatting import format_map
+from utils.handoff import register_state
+from utils.i18n import SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE
+from utils.i18n_core import add_reload_listener
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# How long to keep a map when the cycle's results time is unknown or already past
+FALLBACK_TTL_SECONDS = 60
+
+
+def _results_timestamp(cycle_info: Dict[str, Any]) -> Optional[float]:
+    """Wall-clock time of the current cycle's results, if cycle info has a full timestamp."""
+    results_time = cycle_info.get("results_time")
+    if not isinstance(results_time, str):
+        return None
+    try:
+        return datetime.fromisoformat(results_time.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+class MapView:
+    """Map screens shared by all users, keyed by (cycle, language, map version)."""
+
+    def __init__(self):
+        self.version = 0
+        self._cycle: Optional[Tuple[Any, Any]] = None
+        self._data: Optional[Dict[str, Any]] = None
+        self._expires_at = 0.0
+        self._screens: Dict[Tuple[Any, str, int], Screen] = {}
+        self._lock = asyncio.Lock()
+
+    def _is_current(self) -> bool:
+        return self._data is not None and time.time() < self._expires_at
+
+    def invalidate(self) -> None:
+        """Drop the map after control changed; the next request fetches it again."""
+        self.version += 1
+        self._data = None
+        self._screens = {}
+
+    def clear_rendered(self) -> None:
+        """Drop rendered screens but keep the map data, e.g. after translations changed."""
+        self._screens = {}
+
+    async def _refresh(self) -> None:
+        # Concurrent requests for a stale map wait for the one fetch in flight
+        async with self._lock:
+            if self._is_current():
+                return
+            version = self.version
+            map_data, cycle_info = await asyncio.gather(
+                get_map_data(DEFAULT_LANGUAGE),
+                get_cycle_info(DEFAULT_LANGUAGE)
+            )
+            # get_map_data returns an empty map when the database fails; don't keep that around
+            if not map_data or not map_data.get("districts"):
+                return
+            if version != self.version:
+                # Invalidated while fetching: this data may predate the change
+                return
+
+            now = time.time()
+            results_at = _results_timestamp(cycle_info or {})
+            if results_at is None or results_at <= now:
+                results_at = now + FALLBACK_TTL_SECONDS
+
+            self._cycle = (map_data.get("game_date"), map_data.get("cycle"))
+            self._data = map_data
+            self._expires_at = results_at
+            self._screens = {}
+            logger.debug(f"Map view refreshed for cycle {self._cycle}, version {version}")
+
+    def snapshot(self) -> Optional[Dict[str, Any]]:
+        """The current map data, for the handoff snapshot; rendered screens are rebuilt on use."""
+        if not self._is_current():
+            return None
+        return {"data": self._data, "cycle": list(self._cycle), "expires_at": self._expires_at}
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """Take over the previous process's map, unless its cycle has rolled over since."""
+        if self._data is not None or time.time() >= state["expires_at"]:
+            return
+        self._cycle = tuple(state["cycle"])
+        self._data = state["data"]
+        self._expires_at = state["expires_at"]
+        self._screens = {}
+
+    async def get(self, language: str = DEFAULT_LANGUAGE) -> Optional[Screen]:
+        """Return the map screen for a language, or None if the map is unavailable."""
+        if language not in SUPPORTED_LANGUAGES:
+            language = DEFAULT_LANGUAGE
+        if not self._is_current():
+            await self._refresh()
+            if self._data is None:
+                return None
+
+        key = (self._cycle, language, self.version)
+        screen = self._screens.get(key)
+        if screen is None:
+            screen = Screen(await format_map(self._data, language), get_map_keyboard(language))
+            self._screens[key] = screen
+        return screen
+
+
+# Global map view
+map_view = MapView()
+add_reload_listener(map_view.clear_rendered)
+register_state("map", map_view.snapshot, map_view.restore)
+
+
+async def get_map_screen(language: str = DEFAULT_LANGUAGE) -> Optional[Screen]:
+    """Return the shared map screen for a language."""
+    return await map_view.get(language)
+
+
+def invalidate_map() -> None:
+    """Report that district control changed."""
+    map_view.invalidate()
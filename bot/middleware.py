@@ -3,6 +3,12 @@
 
 """
 Middleware implementation for the Meta Game bot with improved error handling.
+
+The chain runs in handler group -1, inside the per-user lock of
+PerUserUpdateProcessor, so a user's rate limit counters are never updated by
+two of their updates at once. An update the chain rejects (rate limited,
+blocked, not allowed) stops there and never reaches the handlers in group 0;
+a middleware that fails is only logged.
 """
 
 import logging
@@ -10,14 +16,22 @@ import time
 from typing import Dict, Set, List, Any, Callable, Awaitable, Optional
 
 from telegram import Update
-from telegram.ext import ContextTypes, Application, MessageHandler, CallbackQueryHandler, filters
+from telegram.ext import ContextTypes, Application, ApplicationHandlerStop, MessageHandler, CallbackQueryHandler, filters
 
 from db import player_exists, get_player
+from utils.config import get_config
+from utils.context_manager import context_manager
+from utils.handoff import register_state
 from utils.i18n import _, get_user_language
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Rate limiting window and defaults for the "bot" config section
+RATE_LIMIT_WINDOW = 60  # seconds
+DEFAULT_REQUESTS_PER_MINUTE = 15
+DEFAULT_WARNING_THRESHOLD = 3
+
 # Rate limiting storage
 rate_limit_data: Dict[int, Dict[str, Any]] = {}
 blocked_users: Set[int] = set()
@@ -29,7 +43,13 @@ MiddlewareFunc = Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[Optiona
 
 async def apply_middleware_chain(update: Update, context: ContextTypes.DEFAULT_TYPE,
                                  middleware_funcs: List[MiddlewareFunc]) -> bool:
-    """Apply a chain of middleware functions, stopping if any returns False."""
+    """
+    Apply a chain of middleware functions, stopping if any returns False.
+
+    Only an explicit rejection stops the chain. A middleware that raises, e.g.
+    on a transient database error while loading the player, is logged and
+    skipped, and the update still reaches the handlers.
+    """
     for func in middleware_funcs:
         try:
             result = await func(update, context)
@@ -37,11 +57,26 @@ async def apply_middleware_chain(update: Update, context: ContextTypes.DEFAULT_T
                 return False
         except Exception as e:
             logger.error(f"Error in middleware function {func.__name__}: {e}")
-            await error_handler_middleware(update, context, e)
-            return False
     return True
 
 
+async def _notify_rejected(update: Update, text: Optional[str] = None) -> None:
+    """
+    Tell the user their update was rejected.
+
+    A rejected button press is always answered, with the notice if there is
+    one, or the client keeps its spinner until Telegram times out the query.
+    """
+    try:
+        if update.callback_query:
+            await update.callback_query.answer(text, show_alert=text is not None)
+        elif text and update.message:
+            await update.message.reply_text(text)
+    except Exception as e:
+        # The update is rejected all the same
+        logger.error(f"Failed to notify user of a rejected update: {e}")
+
+
 async def log_middleware(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Log all updates for debugging and monitoring."""
     user = update.effective_user
@@ -108,60 +143,95 @@ async def rate_limit_middleware(update: Update, context: ContextTypes.DEFAULT_TY
     # Check if user is blocked
     if user_id in blocked_users:
         logger.warning(f"Blocked user {user_id} attempted to use the bot")
+        await _notify_rejected(update)
         return False
 
     # Check rate limiting
     current_time = time.time()
+    max_requests = get_config("bot", "rate_limit_requests_per_minute") or DEFAULT_REQUESTS_PER_MINUTE
+    max_warnings = get_config("bot", "rate_limit_warning_threshold") or DEFAULT_WARNING_THRESHOLD
 
-    if user_id not in rate_limit_data:
-        rate_limit_data[user_id] = {
+    data = rate_limit_data.get(user_id)
+    if data is None:
+        data = rate_limit_data[user_id] = {
+            "window_start": current_time,
             "last_request": current_time,
             "request_count": 1,
             "warning_count": 0
         }
     else:
-        # Reset counter if more than 60 seconds since last request
-        if current_time - rate_limit_data[user_id]["last_request"] > 60:
-            rate_limit_data[user_id] = {
-                "last_request": current_time,
-                "request_count": 1,
-                "warning_count": rate_limit_data[user_id].get("warning_count", 0)
-            }
-        else:
-            # Increment counter
-            rate_limit_data[user_id]["last_request"] = current_time
-            rate_limit_data[user_id]["request_count"] += 1
-
-    # Check if user is sending too many requests (more than 15 per minute)
-    if rate_limit_data[user_id]["request_count"] > 15:
-        rate_limit_data[user_id]["warning_count"] += 1
-        rate_limit_data[user_id]["request_count"] = 0
+        # Count requests per fixed window, so steady use never adds up to a warning
+        if current_time - data.get("window_start", 0) > RATE_LIMIT_WINDOW:
+            data["window_start"] = current_time
+            data["request_count"] = 0
+        data["last_request"] = current_time
+        data["request_count"] += 1
+
+    # Check if user is sending too many requests
+    if data["request_count"] > max_requests:
+        data["warning_count"] += 1
+        data["request_count"] = 0
 
         language = await get_user_language(str(user_id))
 
         # Block user if they've received too many warnings
-        if rate_limit_data[user_id]["warning_count"] >= 3:
+        if data["warning_count"] >= max_warnings:
             blocked_users.add(user_id)
             logger.warning(f"User {user_id} blocked for excessive requests")
-            if update.message:
-                await update.message.reply_text(
-                    _("You have been blocked for sending too many requests. Please contact an administrator.", language)
-                )
+            await _notify_rejected(
+                update, _("You have been blocked for sending too many requests. Please contact an administrator.", language)
+            )
             return False
 
         # Warn user
-        if update.message:
-            await update.message.reply_text(
-                _("You are sending too many requests. Please slow down. Warning {count}/3.", language).format(
-                    count=rate_limit_data[user_id]["warning_count"]
-                )
+        await _notify_rejected(
+            update, _("You are sending too many requests. Please slow down. Warning {count}/{limit}.", language).format(
+                count=data["warning_count"],
+                limit=max_warnings
             )
-
+        )
         return False
 
     return True
 
 
+def is_admin(user_id: int) -> bool:
+    """Check whether a Telegram user is one of the configured admins."""
+    return user_id in admin_ids
+
+
+def prune_rate_limit_data() -> int:
+    """Forget rate limit counters idle for over a minute. Returns the number removed."""
+    cutoff = time.time() - RATE_LIMIT_WINDOW
+    stale = [
+        user_id for user_id, data in rate_limit_data.items()
+        if data["last_request"] < cutoff and data.get("warning_count", 0) == 0
+    ]
+    for user_id in stale:
+        del rate_limit_data[user_id]
+    return len(stale)
+
+
+def export_rate_limits() -> Dict[str, Any]:
+    """Rate limit counters and blocked users, for the handoff snapshot."""
+    prune_rate_limit_data()
+    # JSON object keys are strings
+    return {
+        "counters": {str(user_id): data for user_id, data in rate_limit_data.items()},
+        "blocked": sorted(blocked_users),
+    }
+
+
+def restore_rate_limits(state: Dict[str, Any]) -> None:
+    """Restore rate limit counters and blocked users handed over by the previous process."""
+    for user_id, data in state.get("counters", {}).items():
+        rate_limit_data.setdefault(int(user_id), data)
+    blocked_users.update(int(user_id) for user_id in state.get("blocked", ()))
+
+
+register_state("rate_limits", export_rate_limits, restore_rate_limits)
+
+
 async def error_handler_middleware(update: Update, context: ContextTypes.DEFAULT_TYPE, error: Exception) -> None:
     """Handle errors that occur during request processing."""
     logger.error(f"Exception while handling an update: {error}")
@@ -185,11 +255,10 @@ async def error_handler_middleware(update: Update, context: ContextTypes.DEFAULT
 
 
 async def language_middleware(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Store user's language preference in context for easy access."""
+    """Make sure the user's language preference is cached in the user context."""
     if update.effective_user:
-        telegram_id = str(update.effective_user.id)
-        language = await get_user_language(telegram_id)
-        context.user_data["language"] = language
+        # get_user_language caches the result in context_manager
+        await get_user_language(str(update.effective_user.id))
 
 
 async def game_state_middleware(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -202,11 +271,8 @@ async def game_state_middleware(update: Update, context: ContextTypes.DEFAULT_TY
         if registered:
             player_data = await get_player(telegram_id)
             if player_data:
-                # Store relevant game state in context.user_data for easy access
-                context.user_data["player_data"] = player_data
-                context.user_data["resources"] = player_data.get("resources", {})
-                context.user_data["actions_remaining"] = player_data.get("actions_remaining", 0)
-                context.user_data["quick_actions_remaining"] = player_data.get("quick_actions_remaining", 0)
+                # Keep one snapshot of the player; resources and action counts live inside it
+                context_manager.set(telegram_id, "player_data", player_data)
 
 
 async def combined_middleware_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -219,7 +285,16 @@ async def combined_middleware_handler(update: Update, context: ContextTypes.DEFA
         game_state_middleware
     ]
 
-    await apply_middleware_chain(update, context, middleware_funcs)
+    # Fetch the user's context in one round trip, off the event loop, for the chain and the handlers
+    if update.effective_user:
+        try:
+            await context_manager.prefetch(str(update.effective_user.id))
+        except Exception as e:
+            logger.error(f"Error prefetching user context: {e}")
+
+    if not await apply_middleware_chain(update, context, middleware_funcs):
+        # Rejected (rate limited, blocked or not allowed): don't run the handlers
+        raise ApplicationHandlerStop
 
 
 def setup_middleware(application: Application, admin_user_ids: List[int]) -> None:
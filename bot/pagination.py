@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Paginated lists for the Meta Game bot.
+
+News and collective actions are shown a page at a time. Each user's position
+in a list is a small cursor kept server-side in user_data, so the Next and
+Prev buttons only carry "page:<source>:<direction>" and each press fetches
+just the slice for the new page from the database.
+"""
+
+import logging
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+from telegram import InlineKeyboardButton, Update
+from telegram.ext import ContextTypes
+
+from bot.callback_data import encode
+from bot.keyboards import get_pagination_keyboard
+from db import get_active_collective_actions, get_latest_news
+from utils.config import get_config
+from utils.formatting import format_collective_actions, format_news
+from utils.i18n import _, get_user_language
+from utils.message_utils import send_message
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 5
+MAX_PAGE_SIZE = 20
+
+
+class Page(NamedTuple):
+    """One rendered page of a list, with buttons for its items."""
+    text: str
+    rows: List[List[InlineKeyboardButton]]
+    has_next: bool
+
+
+# Page sources: (telegram_id, language, offset, limit) -> Page, or None if the data is unavailable
+PageSource = Callable[[str, str, int, int], Awaitable[Optional[Page]]]
+_sources: Dict[str, PageSource] = {}
+
+
+def register_source(name: str, source: PageSource) -> None:
+    """Register a paginated list under the name used in its callback data."""
+    _sources[name] = source
+
+
+def page_size() -> int:
+    """Configured number of items per page."""
+    return max(1, min(int(get_config("bot", "page_size") or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE))
+
+
+async def show_page(update: Update, context: ContextTypes.DEFAULT_TYPE, source: str,
+                    direction: Optional[str] = None, limit: Optional[int] = None) -> None:
+    """Show the first page of a list, or move the user's cursor one page in a direction."""
+    telegram_id = str(update.effective_user.id)
+    language = await get_user_language(telegram_id)
+
+    cursors = context.user_data.get("page_cursors") or {}
+    cursor = cursors.get(source) if direction else None
+    if cursor is None:
+        cursor = {"offset": 0, "limit": max(1, min(limit or page_size(), MAX_PAGE_SIZE))}
+
+    offset = cursor["offset"]
+    if direction == "next":
+        offset += cursor["limit"]
+    elif direction == "prev":
+        offset = max(0, offset - cursor["limit"])
+
+    page = await _sources[source](telegram_id, language, offset, cursor["limit"])
+    if page is None:
+        await send_message(
+            update,
+            _("Error retrieving data. Please try again later.", language),
+            context=context
+        )
+        return
+
+    # Assigned back rather than changed in place, so the context backend sees the write
+    context.user_data["page_cursors"] = {**cursors, source: {"offset": offset, "limit": cursor["limit"]}}
+    await send_message(
+        update,
+        page.text,
+        keyboard=get_pagination_keyboard(language, source, offset > 0, page.has_next, page.rows),
+        parse_mode="Markdown",
+        context=context
+    )
+
+
+async def news_page(telegram_id: str, language: str, offset: int, limit: int) -> Optional[Page]:
+    """Public and faction news, a page of each."""
+    # One extra item of each kind tells whether there is a next page
+    news_data = await get_latest_news(telegram_id, count=limit + 1, language=language, offset=offset)
+    if not news_data:
+        return None
+
+    public_news = news_data.get("public") or []
+    faction_news = news_data.get("faction") or []
+    text = await format_news({"public": public_news[:limit], "faction": faction_news[:limit]}, language)
+    return Page(text, [], len(public_news) > limit or len(faction_news) > limit)
+
+
+async def collective_actions_page(telegram_id: str, language: str, offset: int, limit: int) -> Optional[Page]:
+    """Active collective actions with a join button for each."""
+    actions = await get_active_collective_actions(limit=limit + 1, offset=offset)
+    if actions is None:
+        return None
+    if not actions and offset == 0:
+        return Page(_("There are no active collective actions at the moment.", language), [], False)
+
+    page_actions = actions[:limit]
+    rows = []
+    for action in page_actions:
+        action_id = action.get("collective_action_id")
+        if not action_id:
+            continue
+        district = action.get("district_id")
+        district = district.get("name", "unknown") if isinstance(district, dict) else district or "unknown"
+        button_text = f"{_(action.get('action_type', 'unknown'), language)} in {district}"
+        rows.append([InlineKeyboardButton(button_text, callback_data=encode("join_collective_action", action_id))])
+
+    return Page(await format_collective_actions(page_actions, language), rows, len(actions) > limit)
+
+
+register_source("news", news_page)
+register_source("collective_actions", collective_actions_page)
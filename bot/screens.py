@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Pre-rendered static screens for the Meta Game bot.
+
+Help pages, menus and pickers look the same for every user of a language, so
+they are rendered once per language at startup (and again after translations
+are reloaded) and handlers send the ready-made text and keyboard.
+"""
+
+import logging
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+from bot.keyboards import (
+    get_back_keyboard,
+    get_help_keyboard,
+    get_ideology_keyboard,
+    get_language_keyboard,
+    get_start_keyboard,
+)
+from utils.i18n import _, SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE
+from utils.i18n_core import add_reload_listener
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+class Screen(NamedTuple):
+    """Ready-to-send message text and keyboard."""
+    text: str
+    keyboard: Optional[InlineKeyboardMarkup] = None
+    parse_mode: Optional[str] = "Markdown"
+
+
+HELP_TEXT = (
+    "*Here are the available commands:*\n\n"
+    "*Basic Commands*\n"
+    "/start - Start the game, register as a player\n"
+    "/help - Show this help message\n"
+    "/status - Show your current status (resources, districts)\n"
+    "/map - Show the current map of district control\n"
+    "/time - Show current game cycle information\n"
+    "/news - Show the latest news\n\n"
+
+    "*Action Commands*\n"
+    "/action - Submit a main action\n"
+    "/quick_action - Submit a quick action\n"
+    "/cancel_action - Cancel your last action\n"
+    "/actions_left - Check remaining actions\n"
+    "/view_district - View district information\n\n"
+
+    "*Resource Commands*\n"
+    "/resources - View your current resources\n"
+    "/convert_resource - Convert resources\n"
+    "/check_income - Check expected resource income\n\n"
+
+    "*Politicians Commands*\n"
+    "/politicians - List available politicians\n"
+    "/politician_status - Information about a politician\n"
+    "/international - Information about international politicians\n\n"
+
+    "*Collective Action Commands*\n"
+    "/collective - Initiate a collective action\n"
+    "/join - Join a collective action\n"
+    "/active_actions - View all active collective actions"
+)
+
+HELP_SECTIONS = {
+    "actions": (
+        "*Actions Guide*\n\n"
+        "Each game cycle, you can submit:\n"
+        "• 1 Main Action (ОЗ)\n"
+        "• 2 Quick Actions (БЗ)\n\n"
+
+        "*Main Actions*\n"
+        "• *Influence* - Increase your control in a district (+10 CP)\n"
+        "• *Attack* - Reduce enemy control and gain control points\n"
+        "• *Defense* - Defend against attacks\n"
+        "• *Politician Influence* - Improve relations with a politician\n"
+        "• *Politician Attack* - Damage a politician's reputation\n"
+        "• *Politician Displacement* - Reduce a politician's influence\n\n"
+
+        "*Quick Actions*\n"
+        "• *Reconnaissance* - Get information about a district\n"
+        "• *Information Spread* - Publish news or propaganda\n"
+        "• *Support* - Small control boost in a district (+5 CP)\n"
+        "• *Kompromat Search* - Find compromising information\n\n"
+
+        "*Physical Presence*\n"
+        "Being physically present during an action gives +20 control points."
+    ),
+    "resources": (
+        "*Resources Guide*\n\n"
+        "There are 4 types of resources:\n\n"
+
+        "• *Influence* - Political capital and soft power\n"
+        "  - Used for political actions and diplomacy\n"
+        "  - Can be converted to additional actions\n\n"
+
+        "• *Money* - Financial resources\n"
+        "  - Used for economic actions and bribes\n"
+        "  - Can be converted to other resources (2:1 ratio)\n\n"
+
+        "• *Information* - Intelligence and secrets\n"
+        "  - Used for reconnaissance and propaganda\n"
+        "  - Provides insights into districts and opponents\n\n"
+
+        "• *Force* - Military and security capabilities\n"
+        "  - Used for attacks and defense\n"
+        "  - Provides protection and offensive capabilities\n\n"
+
+        "*Resource Exchange*\n"
+        "You can convert resources at a 2:1 ratio. Example:\n"
+        "2 Money → 1 Influence"
+    ),
+    "districts": (
+        "*Districts Guide*\n\n"
+        "Control Points (CP) determine district control:\n"
+        "• 0-59 CP - No control\n"
+        "• 60+ CP - District controlled\n"
+        "• 80+ CP - Strong control (bonus resources)\n\n"
+
+        "*Resource Income Breakdown*\n"
+        "• 75-100 CP = 120% resources\n"
+        "• 50-74 CP = 100% resources\n"
+        "• 35-49 CP = 80% resources\n"
+        "• 20-34 CP = 60% resources\n"
+        "• <20 CP = 40% resources\n\n"
+
+        "*District Decay*\n"
+        "If you don't perform actions in a district, your control will decay by 5 CP per cycle."
+    ),
+    "politicians": (
+        "*Politicians Guide*\n\n"
+        "Politicians have influence in specific districts and ideological leanings from -5 (reformist) to +5 (conservative).\n\n"
+
+        "*Politician Friendliness*\n"
+        "• 0-30: Hostile - May work against you\n"
+        "• 30-70: Neutral - Limited interaction\n"
+        "• 70-100: Friendly - Provides resources and support\n\n"
+
+        "*Ideological Compatibility*\n"
+        "When your ideology aligns with a politician:\n"
+        "• Small difference (0-2): +2 CP per cycle\n"
+        "• Large alignment (3+ difference): -5 CP per cycle\n\n"
+
+        "*International Politicians*\n"
+        "International figures can impose sanctions, provide support, or influence the game in various ways."
+    ),
+    "rules": (
+        "*Game Rules*\n\n"
+        "The game takes place in Novi-Sad, Yugoslavia, in September 1999.\n\n"
+
+        "*Game Cycles*\n"
+        "• Each day has two cycles: Morning and Evening\n"
+        "• Morning deadlines: 12:00, results at 13:00\n"
+        "• Evening deadlines: 18:00, results at 19:00\n\n"
+
+        "*Ideology*\n"
+        "Your ideology ranges from -5 (reformist) to +5 (conservative) and affects your interactions with politicians and districts.\n\n"
+
+        "*Winning Strategy*\n"
+        "Control districts to gain resources, build alliances with politicians, and expand your influence across the city.\n\n"
+
+        "*Cooperative Actions*\n"
+        "Players can join forces for collective attacks or defense using the command /collective."
+    ),
+}
+
+WELCOME_TEXT = (
+    "Welcome to Novi-Sad, a city at the crossroads of Yugoslavia's future! "
+    "Please select your preferred language:\n\n"
+    "Добро пожаловать в Нови-Сад, город на перекрестке будущего Югославии! "
+    "Пожалуйста, выберите предпочитаемый язык:"
+)
+
+
+class ScreenRegistry:
+    """Screen builders by name, with their output cached per language."""
+
+    def __init__(self):
+        self._builders: Dict[str, Callable[[str], Screen]] = {}
+        self._screens: Dict[Tuple[str, str], Screen] = {}
+
+    def register(self, name: str, builder: Callable[[str], Screen]) -> None:
+        """Register a builder producing the screen for a language."""
+        self._builders[name] = builder
+        self._screens = {key: screen for key, screen in self._screens.items() if key[0] != name}
+
+    def screen(self, name: str) -> Callable:
+        """Decorator form of register."""
+        def decorator(builder: Callable[[str], Screen]) -> Callable[[str], Screen]:
+            self.register(name, builder)
+            return builder
+        return decorator
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._builders
+
+    def get(self, name: str, language: str = DEFAULT_LANGUAGE) -> Screen:
+        """Return the rendered screen, rendering it now if it was not rendered yet."""
+        if language not in SUPPORTED_LANGUAGES:
+            language = DEFAULT_LANGUAGE
+        screen = self._screens.get((name, language))
+        if screen is None:
+            screen = self._builders[name](language)
+            self._screens[(name, language)] = screen
+        return screen
+
+    def render_all(self) -> int:
+        """Render every screen for every language. Returns the number rendered."""
+        screens = {}
+        for name, builder in self._builders.items():
+            for language in SUPPORTED_LANGUAGES:
+                try:
+                    screens[(name, language)] = builder(language)
+                except Exception as e:
+                    logger.error(f"Error rendering screen {name} for {language}: {e}")
+        # Swap in one step so handlers never see a half-rendered set
+        self._screens = screens
+        logger.info(f"Pre-rendered {len(screens)} static screens")
+        return len(screens)
+
+
+# Global registry
+screens = ScreenRegistry()
+
+
+@screens.screen("welcome")
+def _welcome_screen(language: str) -> Screen:
+    # Shown before the player has picked a language, so it carries both
+    return Screen(WELCOME_TEXT, get_language_keyboard(), None)
+
+
+@screens.screen("main_menu")
+def _main_menu_screen(language: str) -> Screen:
+    return Screen(_("Main Menu", language), get_start_keyboard(language))
+
+
+@screens.screen("help")
+def _help_screen(language: str) -> Screen:
+    return Screen(_(HELP_TEXT, language), get_help_keyboard(language))
+
+
+@screens.screen("help_menu")
+def _help_menu_screen(language: str) -> Screen:
+    return Screen(
+        _("Welcome to Novi-Sad! What would you like to learn about?", language),
+        get_help_keyboard(language)
+    )
+
+
+def _help_section_builder(section: str) -> Callable[[str], Screen]:
+    def build(language: str) -> Screen:
+        return Screen(_(HELP_SECTIONS[section], language), get_back_keyboard(language, "help"))
+    return build
+
+
+for _section in HELP_SECTIONS:
+    screens.register(f"help:{_section}", _help_section_builder(_section))
+
+
+@screens.screen("help:not_found")
+def _help_not_found_screen(language: str) -> Screen:
+    return Screen(_("Help section not found.", language), get_back_keyboard(language, "help"))
+
+
+@screens.screen("settings")
+def _settings_screen(language: str) -> Screen:
+    keyboard = [
+        [
+            InlineKeyboardButton(_("Language", language), callback_data="settings:language")
+        ],
+        [
+            InlineKeyboardButton(_("Back to Menu", language), callback_data="back_to_menu")
+        ]
+    ]
+    return Screen(
+        _("*Settings*\n\nHere you can change your preferences.", language),
+        InlineKeyboardMarkup(keyboard)
+    )
+
+
+@screens.screen("language_menu")
+def _language_menu_screen(language: str) -> Screen:
+    return Screen(_("Select your preferred language:", language), get_language_keyboard())
+
+
+@screens.screen("ideology_picker")
+def _ideology_picker_screen(language: str) -> Screen:
+    # The text still has a {name} field for the player's chosen name
+    return Screen(
+        _("Welcome, {name}! In this game, your ideological leaning will affect your interactions with politicians and districts.\n\n"
+          "Please choose your character's ideological position:", language),
+        get_ideology_keyboard(language),
+        None
+    )
+
+
+def get_screen(name: str, language: str = DEFAULT_LANGUAGE) -> Screen:
+    """Return a pre-rendered static screen."""
+    return screens.get(name, language)
+
+
+def prerender_screens() -> int:
+    """Render all static screens and keep them current across translation reloads."""
+    add_reload_listener(screens.render_all)
+    return screens.render_all()
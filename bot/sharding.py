@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Supervisor mode: one ingress, several worker processes sharded by user.
+
+Formatting, i18n and decoding updates all run on one core per process. With
+workers.count above 1, main.py becomes a supervisor: it receives updates
+(long polling or the webhook server) without handling them, and hands each
+raw update to a worker process chosen by its user id. Every worker runs the
+usual application, fed through a socket instead of polling, so a user's
+updates always reach the same process, in order, and its in-memory caches
+only hold that worker's shard of players.
+
+Workers are picked by rendezvous hashing over all the workers, so a user
+always reaches the worker holding their contexts and conversation state,
+and a change of the worker count only moves the users of the workers added
+or removed. While a worker restarts, its updates wait in its own bounded
+send queue and are delivered, in order, once it reports ready again; the
+other shards keep flowing. Updates are sent as one JSON object per line; a
+worker answers "ready" once its application is running.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from telegram import Bot, Update
+from telegram.error import NetworkError, TelegramError
+from telegram.ext import Application
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+READY = b"ready\n"
+# Largest update line accepted on a worker socket
+MAX_LINE_BYTES = 4 * 1024 * 1024
+DEFAULT_RESTART_DELAY = 1  # seconds
+DEFAULT_MAX_RESTART_DELAY = 30  # seconds
+# Updates waiting for one worker; routing only blocks once a worker is this far behind
+DEFAULT_QUEUE_SIZE = 10000
+# A worker that stayed up this long restarts without backoff
+STABLE_UPTIME = 60  # seconds
+POLL_TIMEOUT = 30  # seconds
+
+
+def update_key(data: Dict[str, Any]) -> int:
+    """Number an update is sharded by: its user id, else its chat id, else the update id."""
+    for key, value in data.items():
+        if key == "update_id" or not isinstance(value, dict):
+            continue
+        user = value.get("from") or value.get("user")
+        if isinstance(user, dict) and "id" in user:
+            return int(user["id"])
+        chat = value.get("chat")
+        if isinstance(chat, dict) and "id" in chat:
+            return int(chat["id"])
+    return int(data.get("update_id", 0))
+
+
+def _weight(key: int, index: int) -> int:
+    digest = hashlib.blake2b(f"{key}:{index}".encode("ascii"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def pick_worker(key: int, live: Sequence[int]) -> int:
+    """Worker index for a key among the live workers (rendezvous hashing)."""
+    return max(live, key=lambda index: _weight(key, index))
+
+
+def shard_path(path: str, index: int) -> str:
+    """Per-worker variant of a file path, e.g. data/meta_game.worker2.sqlite3."""
+    root, ext = os.path.splitext(path)
+    return f"{root}.worker{index}{ext}"
+
+
+async def serve_shard(sock: socket.socket, application: Application, on_close: Callable[[], None]) -> None:
+    """Worker side: feed updates from the supervisor into the application until the socket closes."""
+    reader, writer = await asyncio.open_unix_connection(sock=sock, limit=MAX_LINE_BYTES)
+    writer.write(READY)
+    await writer.drain()
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                update = Update.de_json(json.loads(line), application.bot)
+            except ValueError as e:
+                logger.error(f"Dropping malformed update from supervisor: {e}")
+                continue
+            await application.update_queue.put(update)
+    except (ConnectionError, asyncio.IncompleteReadError) as e:
+        logger.warning(f"Lost the connection to the supervisor: {e}")
+    finally:
+        writer.close()
+        logger.info("Supervisor closed the shard, stopping worker")
+        on_close()
+
+
+class _Worker:
+    """Supervisor's handle on one worker process."""
+
+    __slots__ = ("index", "process", "writer", "ready", "up", "started_at", "task", "queue", "sender")
+
+    def __init__(self, index: int, queue_size: int):
+        self.index = index
+        self.process: Optional[multiprocessing.Process] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.ready = False
+        # Set while the worker accepts updates
+        self.up = asyncio.Event()
+        self.started_at = 0.0
+        self.task: Optional[asyncio.Task] = None
+        # Encoded updates waiting to be sent to this worker
+        self.queue: asyncio.Queue = asyncio.Queue(max(1, queue_size))
+        self.sender: Optional[asyncio.Task] = None
+
+
+class Supervisor:
+    """Starts and restarts worker processes and routes updates to them by user."""
+
+    def __init__(self, count: int, target: Callable[[int, socket.socket], None],
+                 restart_delay: float = DEFAULT_RESTART_DELAY,
+                 max_restart_delay: float = DEFAULT_MAX_RESTART_DELAY,
+                 queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.target = target
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.routed = [0] * count
+        self._workers = [_Worker(index, queue_size) for index in range(count)]
+        self._all = list(range(count))
+        self._live: List[int] = []
+        # Next update id to ask Telegram for when polling
+        self.offset: Optional[int] = None
+        self._any_live = asyncio.Event()
+        self._stopping = False
+        # Workers are fresh interpreters: forking would copy the supervisor's running event loop
+        self._mp = multiprocessing.get_context("spawn")
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], target: Callable[[int, socket.socket], None]) -> "Supervisor":
+        """Build a supervisor from the workers section of the configuration."""
+        return cls(
+            config.get("count", 0),
+            target,
+            restart_delay=config.get("restart_delay_seconds", DEFAULT_RESTART_DELAY),
+            max_restart_delay=config.get("max_restart_delay_seconds", DEFAULT_MAX_RESTART_DELAY),
+            queue_size=config.get("queue_size", DEFAULT_QUEUE_SIZE)
+        )
+
+    @property
+    def live(self) -> List[int]:
+        """Indexes of the workers currently accepting updates."""
+        return list(self._live)
+
+    def _set_ready(self, worker: _Worker, ready: bool) -> None:
+        worker.ready = ready
+        if ready:
+            worker.up.set()
+        else:
+            worker.up.clear()
+        self._live = [w.index for w in self._workers if w.ready]
+        if self._live:
+            self._any_live.set()
+        else:
+            self._any_live.clear()
+        logger.info(f"Worker {worker.index} {'ready' if ready else 'down'}, "
+                    f"{len(self._live)}/{len(self._workers)} workers live")
+
+    async def _launch(self, worker: _Worker) -> asyncio.StreamReader:
+        parent, child = socket.socketpair()
+        process = self._mp.Process(target=self.target, args=(worker.index, child),
+                                   name=f"meta-game-worker-{worker.index}")
+        process.start()
+        child.close()
+        reader, writer = await asyncio.open_unix_connection(sock=parent, limit=MAX_LINE_BYTES)
+        worker.process, worker.writer, worker.started_at = process, writer, time.monotonic()
+        logger.info(f"Started worker {worker.index} (pid {process.pid})")
+        return reader
+
+    async def _watch(self, worker: _Worker, reader: asyncio.StreamReader) -> None:
+        delay = self.restart_delay
+        while True:
+            try:
+                while True:
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    if line == READY:
+                        self._set_ready(worker, True)
+            except ConnectionError:
+                pass
+
+            if worker.ready:
+                self._set_ready(worker, False)
+            await self._reap(worker)
+            if self._stopping:
+                return
+
+            if time.monotonic() - worker.started_at > STABLE_UPTIME:
+                delay = self.restart_delay
+            logger.warning(f"Worker {worker.index} exited with code {worker.process.exitcode}, "
+                           f"restarting in {delay:g}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_restart_delay)
+            if self._stopping:
+                return
+            reader = await self._launch(worker)
+
+    async def _reap(self, worker: _Worker, timeout: float = 10) -> None:
+        if worker.writer:
+            worker.writer.close()
+            worker.writer = None
+        process = worker.process
+        if process is None:
+            return
+        await asyncio.get_running_loop().run_in_executor(None, process.join, timeout)
+        if process.is_alive():
+            logger.warning(f"Worker {worker.index} did not stop, terminating it")
+            process.terminate()
+            await asyncio.get_running_loop().run_in_executor(None, process.join, timeout)
+
+    async def _send(self, worker: _Worker) -> None:
+        while True:
+            line = await worker.queue.get()
+            try:
+                while True:
+                    # A restarting worker's updates wait for it, in order
+                    await worker.up.wait()
+                    try:
+                        worker.writer.write(line)
+                        await worker.writer.drain()
+                    except (ConnectionError, AttributeError):
+                        # Died before taking it: its watcher restarts it, then we send it again
+                        if worker.ready:
+                            self._set_ready(worker, False)
+                        continue
+                    self.routed[worker.index] += 1
+                    break
+            finally:
+                worker.queue.task_done()
+
+    async def start(self) -> None:
+        """Start every worker and wait until at least one is ready."""
+        for worker in self._workers:
+            reader = await self._launch(worker)
+            worker.task = asyncio.create_task(self._watch(worker, reader))
+            worker.sender = asyncio.create_task(self._send(worker))
+        await self._any_live.wait()
+
+    async def route(self, data: Dict[str, Any]) -> None:
+        """Queue one raw update for the worker that owns its user."""
+        line = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+        worker = self._workers[pick_worker(update_key(data), self._all)]
+        # Only waits once this worker is queue_size updates behind; the ingress backs off meanwhile
+        await worker.queue.put(line)
+
+    async def poll(self, bot: Bot, stop_event: asyncio.Event) -> None:
+        """Long-poll Telegram and route every update until stop_event is set."""
+        await bot.delete_webhook()
+        while not stop_event.is_set():
+            try:
+                updates = await bot.get_updates(offset=self.offset, timeout=POLL_TIMEOUT,
+                                                allowed_updates=Update.ALL_TYPES)
+            except NetworkError as e:
+                logger.warning(f"Polling failed, retrying: {e}")
+                await asyncio.sleep(1)
+                continue
+            except TelegramError as e:
+                logger.error(f"Polling error: {e}")
+                await asyncio.sleep(5)
+                continue
+            for update in updates:
+                await self.route(update.to_dict())
+                self.offset = update.update_id + 1
+
+    async def acknowledge(self, bot: Bot) -> None:
+        """Mark every routed update as read, so the next process isn't sent them again."""
+        if self.offset is None:
+            return
+        try:
+            await bot.get_updates(offset=self.offset, timeout=0, limit=1)
+        except TelegramError as e:
+            logger.warning(f"Could not mark routed updates as read, they may be delivered again: {e}")
+
+    async def stop(self, drain_timeout: float = 10) -> None:
+        """Send what is queued, close every shard so the workers drain and exit, then wait for them."""
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(worker.queue.join() for worker in self._workers)), drain_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Dropping {sum(worker.queue.qsize() for worker in self._workers)} queued updates "
+                           f"for workers that are down")
+        for worker in self._workers:
+            if worker.sender:
+                worker.sender.cancel()
+        await asyncio.gather(*(worker.sender for worker in self._workers if worker.sender), return_exceptions=True)
+
+        self._stopping = True
+        for worker in self._workers:
+            if worker.writer:
+                worker.writer.close()
+        await asyncio.gather(*(worker.task for worker in self._workers if worker.task), return_exceptions=True)
+        logger.info(f"Workers stopped; updates routed per worker: {self.routed}")
@@ -1,16 +1,15 @@
 # bot/states.py - Improved conversation handling with better error handling
 
 import logging
-import functools
-from typing import Dict, Any, Optional, Callable, Awaitable, List
 
-from telegram import Update, InlineKeyboardMarkup, InlineKeyboardButton
+from telegram import Update
 from telegram.ext import CallbackQueryHandler, ConversationHandler, MessageHandler, filters, CommandHandler
 from telegram.ext import (
     ContextTypes,
 )
 
 # Import constants from constants.py for state definitions
+from bot.callback_data import callback_args, pattern
 from bot.constants import (
     NAME_ENTRY,
     IDEOLOGY_CHOICE,
@@ -39,7 +38,6 @@ from bot.constants import (
 
 # Import keyboard factories
 from bot.keyboards import (
-    get_ideology_keyboard,
     get_districts_keyboard,
     get_resource_type_keyboard,
     get_resource_amount_keyboard,
@@ -47,11 +45,9 @@ from bot.keyboards import (
     get_confirmation_keyboard,
     get_language_keyboard,
     get_collective_action_keyboard,
-    get_politicians_keyboard,
-    get_start_keyboard,
-    get_back_keyboard,
-    get_yes_no_keyboard
+    get_start_keyboard
 )
+from bot.screens import get_screen
 
 # Import database functionality
 from db import (
@@ -70,7 +66,7 @@ from db import (
 from utils.context_manager import get_user_data, set_user_data, clear_user_data
 from utils.error_handling import conversation_step, db_retry, DatabaseError
 from utils.i18n import _, get_user_language, set_user_language
-from utils.message_utils import send_message, edit_or_reply
+from utils.markdown import MessageBuilder
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -103,6 +99,27 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
                     reply_markup=get_start_keyboard(language)
                 )
                 return ConversationHandler.END
+            except Exception as e:
+                logger.error(f"Error getting player data: {e}")
+                # Continue with registration if we can't get player data
+
+        # New player, start registration
+        screen = get_screen("welcome", language)
+        await update.message.reply_text(screen.text, reply_markup=screen.keyboard)
+
+        return NAME_ENTRY
+
+    except Exception as e:
+        logger.error(f"Error checking if player exists: {e}")
+
+        # Fallback to language selection
+        await update.message.reply_text(
+            "Welcome to Novi-Sad! Let's start by selecting your language:",
+            reply_markup=get_language_keyboard()
+        )
+
+        return NAME_ENTRY
+
 
 
 # Helper function for registration checks
@@ -130,148 +147,6 @@ async def require_registration(update: Update, language: str) -> bool:
         # Fall through and allow access if we can't check
         return True
 
-
-# Create conversation handlers
-registration_handler = ConversationHandler(
-    entry_points=[CommandHandler("start", start_command)],
-    states={
-        NAME_ENTRY: [
-            CallbackQueryHandler(language_callback, pattern=r"^language:"),
-            MessageHandler(filters.TEXT & ~filters.COMMAND, name_entry)
-        ],
-        IDEOLOGY_CHOICE: [
-            CallbackQueryHandler(ideology_choice, pattern=r"^ideology:")
-        ]
-    },
-    fallbacks=[
-        CommandHandler("cancel", cancel_registration),
-        MessageHandler(filters.COMMAND, cancel_registration)
-    ]
-)
-
-action_handler = ConversationHandler(
-    entry_points=[
-        CallbackQueryHandler(action_select_district, pattern=r"^action:"),
-        CallbackQueryHandler(action_select_district, pattern=r"^quick_action:")
-    ],
-    states={
-        ACTION_SELECT_DISTRICT: [
-            CallbackQueryHandler(district_selected, pattern=r"^district:")
-        ],
-        ACTION_SELECT_TARGET: [
-            MessageHandler(filters.TEXT & ~filters.COMMAND, target_entry)
-        ],
-        ACTION_SELECT_RESOURCE: [
-            CallbackQueryHandler(resource_selected, pattern=r"^resource:")
-        ],
-        ACTION_SELECT_AMOUNT: [
-            CallbackQueryHandler(amount_selected, pattern=r"^amount:")
-        ],
-        ACTION_PHYSICAL_PRESENCE: [
-            CallbackQueryHandler(physical_presence_selected, pattern=r"^physical:")
-        ],
-        ACTION_CONFIRM: [
-            CallbackQueryHandler(action_confirm, pattern=r"^confirm$"),
-            CallbackQueryHandler(action_confirm, pattern=r"^cancel_selection$")
-        ]
-    },
-    fallbacks=[
-        CallbackQueryHandler(cancel_registration, pattern=r"^cancel_selection$")
-    ]
-)
-
-resource_conversion_handler = ConversationHandler(
-    entry_points=[
-        CommandHandler("convert_resource", resource_conversion_start),
-        CallbackQueryHandler(resource_conversion_start, pattern=r"^exchange_resources$")
-    ],
-    states={
-        CONVERT_FROM_RESOURCE: [
-            CallbackQueryHandler(convert_from_selected, pattern=r"^resource:")
-        ],
-        CONVERT_AMOUNT: [
-            CallbackQueryHandler(convert_amount_selected, pattern=r"^amount:"),
-            MessageHandler(filters.TEXT & ~filters.COMMAND, convert_amount_text_handler)
-        ],
-        CONVERT_TO_RESOURCE: [
-            CallbackQueryHandler(convert_to_selected, pattern=r"^resource:")
-        ],
-        CONVERT_CONFIRM: [
-            CallbackQueryHandler(convert_confirm, pattern=r"^confirm$"),
-            CallbackQueryHandler(convert_confirm, pattern=r"^cancel_selection$")
-        ]
-    },
-    fallbacks=[
-        CallbackQueryHandler(cancel_registration, pattern=r"^cancel_selection$")
-    ]
-)
-
-collective_action_handler = ConversationHandler(
-    entry_points=[CommandHandler("collective", collective_action_start)],
-    states={
-        COLLECTIVE_ACTION_TYPE: [
-            CallbackQueryHandler(collective_action_type_selected, pattern=r"^collective:")
-        ],
-        COLLECTIVE_ACTION_DISTRICT: [
-            CallbackQueryHandler(collective_action_district_selected, pattern=r"^district:")
-        ],
-        COLLECTIVE_ACTION_TARGET: [
-            MessageHandler(filters.TEXT & ~filters.COMMAND, collective_action_target_entry)
-        ],
-        COLLECTIVE_ACTION_RESOURCE: [
-            CallbackQueryHandler(collective_action_resource_selected, pattern=r"^resource:")
-        ],
-        COLLECTIVE_ACTION_AMOUNT: [
-            CallbackQueryHandler(collective_action_amount_selected, pattern=r"^amount:")
-        ],
-        COLLECTIVE_ACTION_PHYSICAL: [
-            CallbackQueryHandler(collective_action_physical_presence_selected, pattern=r"^physical:")
-        ],
-        COLLECTIVE_ACTION_CONFIRM: [
-            CallbackQueryHandler(collective_action_confirm, pattern=r"^confirm$"),
-            CallbackQueryHandler(collective_action_confirm, pattern=r"^cancel_selection$")
-        ]
-    },
-    fallbacks=[
-        CallbackQueryHandler(cancel_registration, pattern=r"^cancel_selection$")
-    ]
-)
-
-join_action_handler = ConversationHandler(
-    entry_points=[
-        CommandHandler("join", join_collective_action_start),
-        CallbackQueryHandler(join_collective_action_start, pattern=r"^join_collective_action:")
-    ],
-    states={
-        JOIN_ACTION_RESOURCE: [
-            CallbackQueryHandler(join_action_resource_selected, pattern=r"^resource:")
-        ],
-        JOIN_ACTION_AMOUNT: [
-            CallbackQueryHandler(join_action_amount_selected, pattern=r"^amount:")
-        ],
-        JOIN_ACTION_PHYSICAL: [
-            CallbackQueryHandler(join_action_physical_presence_selected, pattern=r"^physical:")
-        ],
-        JOIN_ACTION_CONFIRM: [
-            CallbackQueryHandler(join_action_confirm, pattern=r"^confirm$"),
-            CallbackQueryHandler(join_action_confirm, pattern=r"^cancel_selection$")
-        ]
-    },
-    fallbacks=[
-        CallbackQueryHandler(cancel_registration, pattern=r"^cancel_selection$")
-    ]
-)
-
-# Export conversation handlers
-conversation_handlers = [
-    registration_handler,
-    action_handler,
-    resource_conversion_handler,
-    collective_action_handler,
-    join_action_handler
-]
-
-
 @conversation_step
 async def join_action_resource_selected(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Handle resource selection for joining collective action."""
@@ -429,9 +304,6 @@ async def join_action_confirm(update: Update, context: ContextTypes.DEFAULT_TYPE
             )
 
             if result and result.get("success"):
-                # Success message
-                success_message = result.get("message", _("Successfully joined collective action!", language))
-
                 await query.edit_message_text(
                     _(
                         "You have successfully joined the collective action!\n\n"
@@ -572,30 +444,6 @@ async def join_collective_action_start(update: Update, context: ContextTypes.DEF
             )
             return ConversationHandler.END
 
-            except Exception as e:
-            logger.error(f"Error getting player data: {e}")
-            # Continue with registration if we can't get player data
-
-    # New player, start registration
-    await update.message.reply_text(
-        "Welcome to Novi-Sad, a city at the crossroads of Yugoslavia's future! "
-        "Please select your preferred language:",
-        reply_markup=get_language_keyboard()
-    )
-
-    return NAME_ENTRY
-
-except Exception as e:
-logger.error(f"Error checking if player exists: {e}")
-
-# Fallback to language selection
-await update.message.reply_text(
-    "Welcome to Novi-Sad! Let's start by selecting your language:",
-    reply_markup=get_language_keyboard()
-)
-
-return NAME_ENTRY
-
 
 @conversation_step
 async def language_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
@@ -637,11 +485,8 @@ async def name_entry(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     set_user_data(telegram_id, "player_name", user_input, context)
 
     # Prompt for ideology selection
-    await update.message.reply_text(
-        _("Welcome, {name}! In this game, your ideological leaning will affect your interactions with politicians and districts.\n\n"
-          "Please choose your character's ideological position:", language).format(name=user_input),
-        reply_markup=get_ideology_keyboard(language)
-    )
+    screen = get_screen("ideology_picker", language)
+    await update.message.reply_text(screen.text.format(name=user_input), reply_markup=screen.keyboard)
 
     return IDEOLOGY_CHOICE
 
@@ -678,7 +523,7 @@ async def ideology_choice(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
     try:
         # Register player
-        result = await register_player(telegram_id, player_name, ideology_value, language)
+        await register_player(telegram_id, player_name, ideology_value, language)
 
         # Determine ideology description
         ideology_text = _("Neutral", language) if ideology_value == 0 else \
@@ -746,9 +591,9 @@ async def district_selected(update: Update, context: ContextTypes.DEFAULT_TYPE)
     language = await get_user_language(telegram_id)
 
     # Extract district name
-    district_data = query.data.split(":", 1)
-    if len(district_data) > 1:
-        district_name = district_data[1]
+    args = await callback_args(query.data, "district")
+    if args:
+        district_name = args[0]
 
         # Store district in user data
         set_user_data(telegram_id, "district_name", district_name, context)
@@ -889,7 +734,6 @@ async def physical_presence_selected(update: Update, context: ContextTypes.DEFAU
         # Collect all action details for confirmation
         user_data = get_user_data(telegram_id, context)
         action_type = user_data.get("action_type", "unknown")
-        is_quick = user_data.get("is_quick_action", False)
         district_name = user_data.get("district_name", "unknown")
         resource_type = user_data.get("resource_type", "unknown")
         resource_amount = user_data.get("resource_amount", 0)
@@ -967,10 +811,8 @@ async def action_confirm(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                 success_message = result.get("message", _("Action submitted successfully!", language))
                 title = result.get("title", _("Action Submitted", language))
 
-                await query.edit_message_text(
-                    f"*{title}*\n\n{success_message}",
-                    parse_mode="Markdown"
-                )
+                message = MessageBuilder().bold(title).line().line().text(success_message)
+                await query.edit_message_text(message.build(), parse_mode=message.parse_mode)
             else:
                 # Error message
                 await query.edit_message_text(
@@ -1015,9 +857,6 @@ async def resource_conversion_start(update: Update, context: ContextTypes.DEFAUL
     telegram_id = str(update.effective_user.id)
     language = await get_user_language(telegram_id)
 
-    # Initialize user data
-    user_data = get_user_data(telegram_id, context)
-
     # If from_resource is provided (direct command usage)
     if from_resource:
         set_user_data(telegram_id, "from_resource", from_resource, context)
@@ -1352,9 +1191,9 @@ async def collective_action_district_selected(update: Update, context: ContextTy
     language = await get_user_language(telegram_id)
 
     # Extract district name
-    district_data = query.data.split(":", 1)
-    if len(district_data) > 1:
-        district_name = district_data[1]
+    args = await callback_args(query.data, "district")
+    if args:
+        district_name = args[0]
 
         # Store district in user data
         set_user_data(telegram_id, "collective_district_name", district_name, context)
@@ -1558,8 +1397,6 @@ async def collective_action_confirm(update: Update, context: ContextTypes.DEFAUL
             )
 
             if result and result.get("success"):
-                # Success message
-                success_message = result.get("message", _("Collective action initiated successfully!", language))
                 action_id = result.get("collective_action_id", "unknown")
                 join_command = result.get("join_command", f"/join {action_id}")
 
@@ -1600,4 +1437,155 @@ async def collective_action_confirm(update: Update, context: ContextTypes.DEFAUL
     # Clean up context
     clear_user_data(telegram_id, context)
 
-    return ConversationHandler.END
\ No newline at end of file
+    return ConversationHandler.END
+
+
+# Create conversation handlers
+registration_handler = ConversationHandler(
+    entry_points=[CommandHandler("start", start_command)],
+    states={
+        NAME_ENTRY: [
+            CallbackQueryHandler(language_callback, pattern=r"^language:"),
+            MessageHandler(filters.TEXT & ~filters.COMMAND, name_entry)
+        ],
+        IDEOLOGY_CHOICE: [
+            CallbackQueryHandler(ideology_choice, pattern=r"^ideology:")
+        ]
+    },
+    fallbacks=[
+        CommandHandler("cancel", cancel_registration),
+        MessageHandler(filters.COMMAND, cancel_registration)
+    ],
+    name="registration",
+    persistent=True
+)
+
+action_handler = ConversationHandler(
+    entry_points=[
+        CallbackQueryHandler(action_select_district, pattern=r"^action:"),
+        CallbackQueryHandler(action_select_district, pattern=r"^quick_action:")
+    ],
+    states={
+        ACTION_SELECT_DISTRICT: [
+            CallbackQueryHandler(district_selected, pattern=pattern("district"))
+        ],
+        ACTION_SELECT_TARGET: [
+            MessageHandler(filters.TEXT & ~filters.COMMAND, target_entry)
+        ],
+        ACTION_SELECT_RESOURCE: [
+            CallbackQueryHandler(resource_selected, pattern=r"^resource:")
+        ],
+        ACTION_SELECT_AMOUNT: [
+            CallbackQueryHandler(amount_selected, pattern=r"^amount:")
+        ],
+        ACTION_PHYSICAL_PRESENCE: [
+            CallbackQueryHandler(physical_presence_selected, pattern=r"^physical:")
+        ],
+        ACTION_CONFIRM: [
+            CallbackQueryHandler(action_confirm, pattern=r"^confirm$"),
+            CallbackQueryHandler(action_confirm, pattern=r"^cancel_selection$")
+        ]
+    },
+    fallbacks=[
+        CallbackQueryHandler(cancel_registration, pattern=r"^cancel_selection$")
+    ],
+    name="action",
+    persistent=True
+)
+
+resource_conversion_handler = ConversationHandler(
+    entry_points=[
+        CommandHandler("convert_resource", resource_conversion_start),
+        CallbackQueryHandler(resource_conversion_start, pattern=r"^exchange_resources$")
+    ],
+    states={
+        CONVERT_FROM_RESOURCE: [
+            CallbackQueryHandler(convert_from_selected, pattern=r"^resource:")
+        ],
+        CONVERT_AMOUNT: [
+            CallbackQueryHandler(convert_amount_selected, pattern=r"^amount:"),
+            MessageHandler(filters.TEXT & ~filters.COMMAND, convert_amount_text_handler)
+        ],
+        CONVERT_TO_RESOURCE: [
+            CallbackQueryHandler(convert_to_selected, pattern=r"^resource:")
+        ],
+        CONVERT_CONFIRM: [
+            CallbackQueryHandler(convert_confirm, pattern=r"^confirm$"),
+            CallbackQueryHandler(convert_confirm, pattern=r"^cancel_selection$")
+        ]
+    },
+    fallbacks=[
+        CallbackQueryHandler(cancel_registration, pattern=r"^cancel_selection$")
+    ],
+    name="resource_conversion",
+    persistent=True
+)
+
+collective_action_handler = ConversationHandler(
+    entry_points=[CommandHandler("collective", collective_action_start)],
+    states={
+        COLLECTIVE_ACTION_TYPE: [
+            CallbackQueryHandler(collective_action_type_selected, pattern=r"^collective:")
+        ],
+        COLLECTIVE_ACTION_DISTRICT: [
+            CallbackQueryHandler(collective_action_district_selected, pattern=pattern("district"))
+        ],
+        COLLECTIVE_ACTION_TARGET: [
+            MessageHandler(filters.TEXT & ~filters.COMMAND, collective_action_target_entry)
+        ],
+        COLLECTIVE_ACTION_RESOURCE: [
+            CallbackQueryHandler(collective_action_resource_selected, pattern=r"^resource:")
+        ],
+        COLLECTIVE_ACTION_AMOUNT: [
+            CallbackQueryHandler(collective_action_amount_selected, pattern=r"^amount:")
+        ],
+        COLLECTIVE_ACTION_PHYSICAL: [
+            CallbackQueryHandler(collective_action_physical_presence_selected, pattern=r"^physical:")
+        ],
+        COLLECTIVE_ACTION_CONFIRM: [
+            CallbackQueryHandler(collective_action_confirm, pattern=r"^confirm$"),
+            CallbackQueryHandler(collective_action_confirm, pattern=r"^cancel_selection$")
+        ]
+    },
+    fallbacks=[
+        CallbackQueryHandler(cancel_registration, pattern=r"^cancel_selection$")
+    ],
+    name="collective_action",
+    persistent=True
+)
+
+join_action_handler = ConversationHandler(
+    entry_points=[
+        CommandHandler("join", join_collective_action_start),
+        CallbackQueryHandler(join_collective_action_start, pattern=pattern("join_collective_action"))
+    ],
+    states={
+        JOIN_ACTION_RESOURCE: [
+            CallbackQueryHandler(join_action_resource_selected, pattern=r"^resource:")
+        ],
+        JOIN_ACTION_AMOUNT: [
+            CallbackQueryHandler(join_action_amount_selected, pattern=r"^amount:")
+        ],
+        JOIN_ACTION_PHYSICAL: [
+            CallbackQueryHandler(join_action_physical_presence_selected, pattern=r"^physical:")
+        ],
+        JOIN_ACTION_CONFIRM: [
+            CallbackQueryHandler(join_action_confirm, pattern=r"^confirm$"),
+            CallbackQueryHandler(join_action_confirm, pattern=r"^cancel_selection$")
+        ]
+    },
+    fallbacks=[
+        CallbackQueryHandler(cancel_registration, pattern=r"^cancel_selection$")
+    ],
+    name="join_action",
+    persistent=True
+)
+
+# Export conversation handlers
+conversation_handlers = [
+    registration_handler,
+    action_handler,
+    resource_conversion_handler,
+    collective_action_handler,
+    join_action_handler
+]
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Cache warm-up before the bot accepts updates.
+
+Right after a deploy every cache is cold, and the first minutes of traffic
+pay for it: each user's registration and language, the district and
+politician catalogs behind buttons, the map and its cycle. The warm-up
+loads all of those in a few bulk queries, concurrently, and logs how long it
+took and how much it loaded. Each part fails on its own: a part that can't
+be loaded is filled lazily on first use, as without the warm-up. Whatever
+the previous process handed over (see utils.handoff) is not loaded again.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from bot.callback_data import DISTRICT, POLITICIAN
+from bot.keyboards import prebuild_districts_keyboards
+from bot.map_view import map_view
+from bot.sharding import pick_worker
+from db import get_districts
+from db.player_directory import DEFAULT_PAGE_SIZE, players
+from utils.handoff import register_state
+from utils.i18n import SUPPORTED_LANGUAGES
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# The directory is the one bulk load a restart can skip
+register_state("players", players.snapshot, players.restore)
+
+
+async def _players(page_size: int, shard: Optional[Tuple[int, int]]) -> str:
+    if players.loaded:
+        # Handed over by the previous process
+        return f"{len(players)} players from the handoff snapshot"
+    keep = None
+    if shard is not None:
+        index, count = shard
+        workers = range(count)
+
+        def in_shard(telegram_id: str) -> bool:
+            # A worker only holds the players routed to it
+            return pick_worker(int(telegram_id), workers) == index
+
+        keep = in_shard
+    rows, pages = await players.load(page_size, keep)
+    return f"{len(players)} of {rows} players in {pages} pages"
+
+
+async def _districts() -> str:
+    districts = await get_districts() or []
+    DISTRICT.preload(district.get("name") for district in districts if district.get("name"))
+    keyboards = prebuild_districts_keyboards(districts)
+    return f"{len(districts)} districts ({keyboards} keyboards)"
+
+
+async def _politicians() -> str:
+    return f"{await POLITICIAN.load()} politicians"
+
+
+async def _map() -> str:
+    # One fetch of the map and the current cycle, then the screen for each language
+    rendered = 0
+    for language in SUPPORTED_LANGUAGES:
+        if await map_view.get(language) is not None:
+            rendered += 1
+    return f"map and cycle for {rendered} languages"
+
+
+async def warm_up(page_size: int = DEFAULT_PAGE_SIZE, shard: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+    """
+    Load the caches the first updates would otherwise fill one by one.
+
+    In a worker, shard is its (index, worker count), and only its own players are loaded.
+    """
+    start = time.perf_counter()
+    parts = {
+        "players": _players(page_size, shard),
+        "districts": _districts(),
+        "politicians": _politicians(),
+        "map": _map(),
+    }
+    results = await asyncio.gather(*parts.values(), return_exceptions=True)
+
+    summary = {}
+    for name, result in zip(parts, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Warm-up of {name} failed, it will load on first use: {result}")
+            summary[name] = None
+        else:
+            summary[name] = result
+    elapsed = (time.perf_counter() - start) * 1000
+    logger.info(f"Warm-up done in {elapsed:.0f} ms: " + ", ".join(
+        result for result in summary.values() if result is not None
+    ))
+    return summary
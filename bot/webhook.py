@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Webhook serving mode for the Meta Game bot.
+
+Telegram POSTs each update to an embedded aiohttp server instead of the bot
+long-polling for them. The request handler only checks the secret token and
+puts the raw update on a bounded queue, so Telegram gets its 200 straight
+away; a fixed number of workers decode queued updates and run them through
+the application's update processor (and so the per-user ordering of
+PerUserUpdateProcessor). When the queue is full the server answers 429 with
+Retry-After and Telegram delivers the update again later.
+
+GET /healthz answers while the process is up, GET /readyz only while updates
+are being accepted and the queue has room.
+
+In supervisor mode (see bot.sharding) the server has no application of its
+own and hands each raw update to a process callback instead.
+"""
+
+import asyncio
+import hmac
+import logging
+import secrets
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from aiohttp import web
+from telegram import Bot, Update
+from telegram.ext import Application
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_MAX_BODY_BYTES = 1024 * 1024
+DEFAULT_RETRY_AFTER = 1  # seconds
+
+
+class WebhookServer:
+    """aiohttp front end that queues incoming updates for a PTB application."""
+
+    def __init__(
+        self,
+        application: Optional[Application],
+        path: str = "/telegram",
+        secret_token: Optional[str] = None,
+        listen: str = "0.0.0.0",
+        port: int = 8443,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        workers: Optional[int] = None,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        retry_after: int = DEFAULT_RETRY_AFTER,
+        bot: Optional[Bot] = None,
+        process: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+    ):
+        self.application = application
+        self.bot = bot or application.bot
+        self.process = process or self._process_update
+        self.path = "/" + path.lstrip("/")
+        self.secret_token = secret_token
+        self.listen = listen
+        self.port = port
+        self.queue: asyncio.Queue = asyncio.Queue(max(1, queue_size))
+        # One worker per update the processor lets in, so a user queued behind their own
+        # earlier updates doesn't hold up the others
+        self.workers = workers or (application.update_processor.max_concurrent_updates if application else 1)
+        self.max_body_bytes = max_body_bytes
+        self.retry_after = retry_after
+
+        self.accepting = False
+        self.received = 0
+        self.rejected = 0
+        self._runner: Optional[web.AppRunner] = None
+        self._worker_tasks: List[asyncio.Task] = []
+
+    @classmethod
+    def from_config(cls, application: Optional[Application], config: Dict[str, Any],
+                    secret_token: Optional[str] = None, **kwargs: Any) -> "WebhookServer":
+        """Build a server from the webhook section of the configuration; keyword arguments override it."""
+        settings = dict(
+            path=config.get("path", "/telegram"),
+            secret_token=secret_token or config.get("secret_token") or None,
+            listen=config.get("listen", "0.0.0.0"),
+            port=config.get("port", 8443),
+            queue_size=config.get("queue_size", DEFAULT_QUEUE_SIZE),
+            workers=config.get("workers"),
+            max_body_bytes=config.get("max_body_bytes", DEFAULT_MAX_BODY_BYTES),
+            retry_after=config.get("retry_after_seconds", DEFAULT_RETRY_AFTER),
+        )
+        settings.update(kwargs)
+        return cls(application, **settings)
+
+    def build_app(self) -> web.Application:
+        """The aiohttp application with the update, health and readiness routes."""
+        app = web.Application(client_max_size=self.max_body_bytes)
+        app.router.add_post(self.path, self.handle_update)
+        app.router.add_get("/healthz", self.handle_health)
+        app.router.add_get("/readyz", self.handle_ready)
+        return app
+
+    async def handle_update(self, request: web.Request) -> web.Response:
+        """Queue one update from Telegram."""
+        if self.secret_token and not hmac.compare_digest(
+                request.headers.get(SECRET_TOKEN_HEADER, ""), self.secret_token):
+            logger.warning(f"Rejected webhook request from {request.remote} with a wrong secret token")
+            return web.Response(status=403)
+        if not self.accepting:
+            return web.Response(status=503, headers={"Retry-After": str(self.retry_after)})
+
+        try:
+            data = await request.json()
+        except ValueError:
+            return web.Response(status=400, text="Invalid JSON")
+        if not isinstance(data, dict):
+            return web.Response(status=400, text="Expected an update object")
+
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            # Telegram keeps the update and retries it
+            self.rejected += 1
+            return web.Response(status=429, headers={"Retry-After": str(self.retry_after)})
+        self.received += 1
+        return web.Response()
+
+    async def handle_health(self, request: web.Request) -> web.Response:
+        """Liveness: the process serves requests."""
+        return web.json_response({"status": "ok"})
+
+    async def handle_ready(self, request: web.Request) -> web.Response:
+        """Readiness: updates are accepted and there is room to queue them."""
+        running = self.application.running if self.application else True
+        ready = self.accepting and running and not self.queue.full()
+        return web.json_response(
+            {
+                "ready": ready,
+                "queued": self.queue.qsize(),
+                "queue_size": self.queue.maxsize,
+                "received": self.received,
+                "rejected": self.rejected,
+            },
+            status=200 if ready else 503
+        )
+
+    async def _process_update(self, data: Dict[str, Any]) -> None:
+        application = self.application
+        update = Update.de_json(data, application.bot)
+        await application.update_processor.process_update(update, application.process_update(update))
+
+    async def _worker(self) -> None:
+        while True:
+            data = await self.queue.get()
+            try:
+                await self.process(data)
+            except Exception as e:
+                logger.error(f"Error processing webhook update {data.get('update_id')}: {e}")
+            finally:
+                self.queue.task_done()
+
+    async def start(self, webhook_url: Optional[str] = None, drop_pending_updates: bool = False) -> None:
+        """Start the workers and the server, then point Telegram at webhook_url if one is given."""
+        if not self.secret_token:
+            if webhook_url:
+                # We register the webhook, so we can pick the token Telegram sends back on every request
+                self.secret_token = secrets.token_urlsafe(32)
+            else:
+                logger.warning("No webhook secret token configured: requests to the webhook are not authenticated. "
+                               "Set TELEGRAM_WEBHOOK_SECRET to the secret the webhook was registered with")
+
+        self._worker_tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+        self._runner = web.AppRunner(self.build_app(), access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.listen, self.port).start()
+        self.accepting = True
+        logger.info(f"Webhook server listening on {self.listen}:{self.port}{self.path} "
+                    f"with {self.workers} workers and a queue of {self.queue.maxsize}")
+
+        if webhook_url:
+            await self.bot.set_webhook(
+                webhook_url.rstrip("/") + self.path,
+                allowed_updates=Update.ALL_TYPES,
+                secret_token=self.secret_token,
+                drop_pending_updates=drop_pending_updates
+            )
+            logger.info("Webhook registered with Telegram")
+
+    async def stop(self, drain_timeout: float = 10) -> None:
+        """Stop accepting updates, let the workers finish the queue, then stop the server."""
+        self.accepting = False
+        try:
+            await asyncio.wait_for(self.queue.join(), drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Dropping {self.queue.qsize()} queued webhook updates on shutdown")
+
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+        logger.info("Webhook server stopped")
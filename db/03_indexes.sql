@@ -64,6 +64,7 @@ CREATE INDEX IF NOT EXISTS idx_news_created ON news(created_at);
 
 -- Translations indexes
 CREATE INDEX IF NOT EXISTS idx_translations_key ON translations(translation_key);
+CREATE INDEX IF NOT EXISTS idx_translations_updated_at ON translations(updated_at);
 
 -- International effects indexes
 CREATE INDEX IF NOT EXISTS idx_international_effects_politician ON international_effects(politician_id);
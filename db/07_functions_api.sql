@@ -772,11 +772,13 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
--- Get latest news
+-- Get latest news, one page of each kind at a time
+DROP FUNCTION IF EXISTS api_get_latest_news(TEXT, INTEGER, TEXT);
 CREATE OR REPLACE FUNCTION api_get_latest_news(
     p_telegram_id TEXT,
     p_count INTEGER DEFAULT 5,
-    p_language TEXT DEFAULT 'en_US'
+    p_language TEXT DEFAULT 'en_US',
+    p_offset INTEGER DEFAULT 0
 )
 RETURNS JSON AS $$
 DECLARE
@@ -806,12 +808,14 @@ BEGIN
                 SELECT name FROM districts WHERE district_id = n.related_district_id
             ),
             'created_at', n.created_at
-        )
+        ) ORDER BY n.created_at DESC
     ) INTO public_news
-    FROM news n
-    WHERE news_type = 'public'
-    ORDER BY created_at DESC
-    LIMIT p_count;
+    FROM (
+        SELECT * FROM news
+        WHERE news_type = 'public'
+        ORDER BY created_at DESC
+        LIMIT p_count OFFSET p_offset
+    ) n;
 
     -- Get latest faction news for this player
     SELECT json_agg(
@@ -828,12 +832,14 @@ BEGIN
                 SELECT name FROM districts WHERE district_id = n.related_district_id
             ),
             'created_at', n.created_at
-        )
+        ) ORDER BY n.created_at DESC
     ) INTO faction_news
-    FROM news n
-    WHERE news_type = 'faction' AND target_player_id = player_rec.player_id
-    ORDER BY created_at DESC
-    LIMIT p_count;
+    FROM (
+        SELECT * FROM news
+        WHERE news_type = 'faction' AND target_player_id = player_rec.player_id
+        ORDER BY created_at DESC
+        LIMIT p_count OFFSET p_offset
+    ) n;
 
     -- Handle NULLs
     IF public_news IS NULL THEN
@@ -21,6 +21,7 @@ from db.supabase_client import (
     execute_sql,
     check_schema_exists
 )
+from db.player_directory import players
 
 # Type variable for generic return type
 T = TypeVar('T')
@@ -70,6 +71,8 @@ async def player_exists(telegram_id: str) -> bool:
     from utils.context_manager import context_manager
     if context_manager.get(telegram_id, "is_registered", False):
         return True
+    if telegram_id in players:
+        return True
 
     # Then try database
     try:
@@ -136,13 +139,15 @@ async def register_player(telegram_id: str, name: str, ideology_score: int, lang
 
     # Store in memory first for resilience
     from utils.context_manager import context_manager
-    context_manager.set(telegram_id, "is_registered", True)
-    context_manager.set(telegram_id, "language", language)
-    context_manager.set(telegram_id, "player_data", {
-        "player_name": name,
-        "ideology_score": ideology_score,
+    context_manager.set_many(telegram_id, {
+        "is_registered": True,
         "language": language,
-        "resources": {"influence": 5, "money": 10, "information": 3, "force": 2}
+        "player_data": {
+            "player_name": name,
+            "ideology_score": ideology_score,
+            "language": language,
+            "resources": {"influence": 5, "money": 10, "information": 3, "force": 2}
+        }
     })
 
     try:
@@ -158,6 +163,8 @@ async def register_player(telegram_id: str, name: str, ideology_score: int, lang
         response = client.table("players").insert(player_data).execute()
 
         if response and hasattr(response, 'data') and response.data:
+            # Only a player the database has is known to the directory
+            players.add(telegram_id, language)
             return response.data[0]
         return context_manager.get(telegram_id, "player_data")
     except Exception as e:
@@ -173,6 +180,9 @@ async def get_player_language(telegram_id: str) -> str:
     cached_language = context_manager.get(telegram_id, "language")
     if cached_language in ["en_US", "ru_RU"]:
         return cached_language
+    known_language = players.language(telegram_id)
+    if known_language in ["en_US", "ru_RU"]:
+        return known_language
 
     # Try database as fallback
     try:
@@ -212,6 +222,7 @@ async def set_player_language(telegram_id: str, language: str) -> bool:
             update_query = client.table("players").update({"language": language})
             update_query = update_query.eq("telegram_id", telegram_id)
             update_query.execute()
+            players.add(telegram_id, language)
             return True
     except Exception as e:
         logger.warning(f"Database language update failed: {e}")
@@ -411,12 +422,14 @@ async def check_income(telegram_id: str, language: str = "en_US") -> Optional[Di
 
 # News and information functions
 @db_retry
-async def get_latest_news(telegram_id: str, count: int = 5, language: str = "en_US") -> Optional[Dict[str, Any]]:
-    """Get latest news items."""
+async def get_latest_news(telegram_id: str, count: int = 5, language: str = "en_US",
+                          offset: int = 0) -> Optional[Dict[str, Any]]:
+    """Get latest news items, skipping the newest `offset` of each kind."""
     params = {
         "p_telegram_id": telegram_id,
         "p_count": count,
-        "p_language": language
+        "p_language": language,
+        "p_offset": offset
     }
 
     try:
@@ -443,6 +456,20 @@ async def get_politicians(telegram_id: str, type_filter: str = "all", language:
         return {"politicians": []}
 
 
+@db_retry
+async def get_politician_names() -> List[str]:
+    """Get the names of all politicians."""
+    try:
+        client = get_supabase()
+        response = client.table("politicians").select("name").execute()
+        if hasattr(response, 'data') and response.data:
+            return [row["name"] for row in response.data]
+    except Exception as e:
+        logger.error(f"Error getting politician names: {e}")
+
+    return []
+
+
 @db_retry
 async def get_politician_status(telegram_id: str, politician_name: str, language: str = "en_US") -> Optional[Dict[str, Any]]:
     """Get detailed information about a politician."""
@@ -522,17 +549,14 @@ async def join_collective_action(
 
 
 @db_retry
-async def get_active_collective_actions() -> List[Dict[str, Any]]:
-    """Get all active collective actions."""
+async def get_active_collective_actions(limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+    """Get active collective actions, newest first, optionally one slice at a time."""
     try:
-        result = await execute_sql("SELECT * FROM collective_actions WHERE status = 'active' ORDER BY created_at DESC")
-        if result and isinstance(result, list):
-            return result
-
-        # Try fetching via client
         client = get_supabase()
         response = client.table("collective_actions").select("*")
-        response = response.eq("status", "active").order("created_at", ascending=False)
+        response = response.eq("status", "active").order("created_at", desc=True)
+        if limit is not None:
+            response = response.range(offset, offset + limit - 1)
         data = response.execute().data
 
         if data:
@@ -619,6 +643,7 @@ def initialize_db():
         'check_income': check_income,
         'get_latest_news': get_latest_news,
         'get_politicians': get_politicians,
+        'get_politician_names': get_politician_names,
         'get_politician_status': get_politician_status,
         'initiate_collective_action': initiate_collective_action,
         'join_collective_action': join_collective_action,
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Directory of registered players and their languages.
+
+Every update checks whether its user is registered and in which language to
+answer, and with cold caches each of those is a database round trip. The
+directory holds every registered telegram_id with its language, loaded in a
+few paged queries at startup and kept current as players register or change
+language in this process. An entry is one string key and an interned
+language code, a fraction of a full user context.
+
+A hit is authoritative; a miss may be a player registered elsewhere (another
+worker, the admin tools), so callers still ask the database then.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from db.supabase_client import get_supabase
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# PostgREST returns at most this many rows per request by default
+DEFAULT_PAGE_SIZE = 1000
+# A directory handed over from process to process misses changes made elsewhere,
+# so one loaded longer ago than this is loaded from the database again
+DEFAULT_MAX_AGE = 3600  # seconds
+
+
+class PlayerDirectory:
+    """Registered telegram_ids with their languages."""
+
+    def __init__(self):
+        self._languages: Dict[str, str] = {}
+        # One string object per language code
+        self._codes: Dict[str, str] = {}
+        self.loaded = False
+        # When the directory was last loaded from the database
+        self.loaded_at = 0.0
+
+    def add(self, telegram_id: str, language: Optional[str]) -> None:
+        """Record a registered player, or a registered player's new language."""
+        language = language or ""
+        self._languages[str(telegram_id)] = self._codes.setdefault(language, language)
+
+    def language(self, telegram_id: str) -> Optional[str]:
+        """A registered player's language, or None if the player isn't known here or has none."""
+        return self._languages.get(telegram_id) or None
+
+    def __contains__(self, telegram_id: str) -> bool:
+        return telegram_id in self._languages
+
+    def __len__(self) -> int:
+        return len(self._languages)
+
+    async def load(self, page_size: int = DEFAULT_PAGE_SIZE,
+                   keep: Optional[Callable[[str], bool]] = None) -> Tuple[int, int]:
+        """
+        Load every player in pages of page_size, or with keep only the players it accepts
+        (e.g. a worker's shard). Returns the number of rows read and pages.
+        """
+        client = get_supabase()
+        rows = pages = 0
+        while True:
+            query = (client.table("players").select("telegram_id,language")
+                     .order("telegram_id").range(rows, rows + page_size - 1))
+            # The client blocks, so each page is fetched off the event loop
+            response = await asyncio.to_thread(query.execute)
+            data = getattr(response, "data", None) or []
+            pages += 1
+            for row in data:
+                telegram_id = row.get("telegram_id")
+                if telegram_id and (keep is None or keep(str(telegram_id))):
+                    self.add(telegram_id, row.get("language"))
+            rows += len(data)
+            if len(data) < page_size:
+                break
+
+        self.loaded = True
+        self.loaded_at = time.time()
+        return rows, pages
+
+    def snapshot(self) -> Optional[Dict[str, Any]]:
+        """Every player's language, for the handoff snapshot; None until the directory is loaded."""
+        if not self.loaded:
+            return None
+        return {"loaded_at": self.loaded_at, "languages": dict(self._languages)}
+
+    def restore(self, state: Dict[str, Any], max_age: float = DEFAULT_MAX_AGE) -> bool:
+        """
+        Load the directory handed over by the previous process instead of querying every page.
+
+        A directory first loaded more than max_age ago is not restored, so it is
+        loaded from the database again. Returns whether it was restored.
+        """
+        loaded_at = state.get("loaded_at", 0.0)
+        if time.time() - loaded_at > max_age:
+            logger.info("Player directory in the handoff snapshot is too old, it will be loaded again")
+            return False
+        for telegram_id, language in state.get("languages", {}).items():
+            if telegram_id not in self._languages:
+                self.add(telegram_id, language)
+        self.loaded = True
+        self.loaded_at = loaded_at
+        return True
+
+
+# Global directory
+players = PlayerDirectory()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Game rules module for the Meta Game bot.
+"""
+
+from game.model import (
+    RESOURCE_TYPES,
+    CONTROL_LEVELS,
+    STRONG_CONTROL_POINTS,
+    ControlModel,
+    income_tier,
+    income_percent,
+    control_level,
+    income_tiers,
+    control_levels,
+    district_income,
+    resource_row
+)
+
+__all__ = [
+    'RESOURCE_TYPES',
+    'CONTROL_LEVELS',
+    'STRONG_CONTROL_POINTS',
+    'ControlModel',
+    'income_tier',
+    'income_percent',
+    'control_level',
+    'income_tiers',
+    'control_levels',
+    'district_income',
+    'resource_row'
+]
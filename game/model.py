@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Control and income model for the Meta Game.
+
+The control-point tiers, income multipliers and control levels live here
+once, matching the database functions (calculate_district_resources,
+api_check_income, api_get_map_data). Control is held as a players x districts
+array, so income, tiers and control status for every player and district
+come out of one vectorized pass instead of per-district Python loops.
+"""
+
+import bisect
+import logging
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+RESOURCE_TYPES = ("influence", "money", "information", "force")
+
+# Income tiers as (lowest control points, percent of the district's resources).
+# Percentages stay integral so income is floored exactly like the DECIMAL
+# arithmetic in the database.
+INCOME_TIERS = ((0, 40), (20, 60), (35, 80), (50, 100), (75, 120))
+TIER_THRESHOLDS = np.array([points for points, _percent in INCOME_TIERS[1:]])
+TIER_PERCENTS = np.array([percent for _points, percent in INCOME_TIERS])
+
+# Control levels shown on the map, from the highest control in a district
+CONTESTED_CONTROL_POINTS = 30
+CONTROL_POINTS = 60
+STRONG_CONTROL_POINTS = 80
+CONTROL_LEVELS = ("neutral", "contested", "controlled", "strong")
+LEVEL_THRESHOLDS = np.array([CONTESTED_CONTROL_POINTS, CONTROL_POINTS, STRONG_CONTROL_POINTS])
+
+# Plain lists for single lookups, where NumPy's call overhead would dominate
+_TIER_THRESHOLDS = TIER_THRESHOLDS.tolist()
+_LEVEL_THRESHOLDS = LEVEL_THRESHOLDS.tolist()
+
+
+def income_tier(control_points: int) -> int:
+    """Income tier (0-4) of a control point value."""
+    return bisect.bisect_right(_TIER_THRESHOLDS, control_points)
+
+
+def income_percent(control_points: int) -> int:
+    """Percentage of district resources received at a control point value."""
+    return INCOME_TIERS[income_tier(control_points)][1]
+
+
+def control_level(control_points: int) -> str:
+    """Control level name of a district's highest control point value."""
+    return CONTROL_LEVELS[bisect.bisect_right(_LEVEL_THRESHOLDS, control_points)]
+
+
+def income_tiers(control_points: Any) -> np.ndarray:
+    """Vectorized income_tier."""
+    return np.searchsorted(TIER_THRESHOLDS, control_points, side="right")
+
+
+def control_levels(control_points: Any) -> np.ndarray:
+    """Vectorized control level, as an index into CONTROL_LEVELS."""
+    return np.searchsorted(LEVEL_THRESHOLDS, control_points, side="right")
+
+
+def district_income(control_points: Any, resources: Any) -> np.ndarray:
+    """Income from districts: control points (..., n) and base resources (..., n, 4) -> (..., n, 4)."""
+    percent = TIER_PERCENTS[income_tiers(control_points)]
+    return np.asarray(resources, dtype=np.int64) * percent[..., None] // 100
+
+
+def resource_row(values: Mapping[str, Any], prefix: str = "") -> List[int]:
+    """The four resource amounts of a mapping, e.g. prefix "resource_" for player district rows."""
+    return [int(values.get(prefix + resource) or 0) for resource in RESOURCE_TYPES]
+
+
+class ControlModel:
+    """Control of every player over every district, with the income it yields.
+
+    control is a (players, districts) array of control points; has_control
+    marks the pairs with a control record, since only those yield income
+    (a record at 0 CP still gives the lowest tier).
+    """
+
+    def __init__(self, district_ids: Sequence[Any], resources: Any,
+                 player_ids: Sequence[Any], control: Any, has_control: Optional[Any] = None):
+        self.district_ids = list(district_ids)
+        self.player_ids = list(player_ids)
+        self.resources = np.asarray(resources, dtype=np.int64).reshape(len(self.district_ids), len(RESOURCE_TYPES))
+        self.control = np.asarray(control, dtype=np.int64).reshape(len(self.player_ids), len(self.district_ids))
+        self.has_control = self.control > 0 if has_control is None else np.asarray(has_control, dtype=bool)
+        self._player_index = {player_id: i for i, player_id in enumerate(self.player_ids)}
+
+    @classmethod
+    def from_rows(cls, districts: Iterable[Mapping[str, Any]],
+                  control_rows: Iterable[Mapping[str, Any]]) -> "ControlModel":
+        """Build from districts rows and district_control rows as the database returns them."""
+        districts = list(districts)
+        district_ids = [district["district_id"] for district in districts]
+        resources = [[int(district.get(f"{resource}_resource") or 0) for resource in RESOURCE_TYPES]
+                     for district in districts]
+        district_index = {district_id: i for i, district_id in enumerate(district_ids)}
+
+        player_index: Dict[Any, int] = {}
+        cells: List[Tuple[int, int, int]] = []
+        for row in control_rows:
+            district = district_index.get(row["district_id"])
+            if district is None:
+                logger.warning(f"Control row for unknown district {row['district_id']}")
+                continue
+            player = player_index.setdefault(row["player_id"], len(player_index))
+            cells.append((player, district, int(row.get("control_points") or 0)))
+
+        control = np.zeros((len(player_index), len(district_ids)), dtype=np.int64)
+        has_control = np.zeros(control.shape, dtype=bool)
+        if cells:
+            players, columns, points = np.array(cells).T
+            control[players, columns] = points
+            has_control[players, columns] = True
+        return cls(district_ids, resources, list(player_index), control, has_control)
+
+    def tiers(self) -> np.ndarray:
+        """(players, districts) income tier, 0-4."""
+        return income_tiers(self.control)
+
+    def income(self) -> np.ndarray:
+        """(players, districts, resources) income per cycle; 0 where a player has no control."""
+        income = district_income(self.control, self.resources)
+        income[~self.has_control] = 0
+        return income
+
+    def player_income(self) -> np.ndarray:
+        """(players, resources) total income per cycle."""
+        return self.income().sum(axis=1)
+
+    def strong_control(self) -> np.ndarray:
+        """(players, districts) whether the player strongly controls the district."""
+        return self.control >= STRONG_CONTROL_POINTS
+
+    def district_levels(self) -> np.ndarray:
+        """(districts,) index into CONTROL_LEVELS from the highest control in each district."""
+        if not self.player_ids:
+            return np.zeros(len(self.district_ids), dtype=np.int64)
+        return control_levels(self.control.max(axis=0))
+
+    def controllers(self) -> List[Optional[Any]]:
+        """Controlling player of each district (highest control at CONTROL_POINTS or above), or None."""
+        if not self.player_ids:
+            return [None] * len(self.district_ids)
+        leaders = self.control.argmax(axis=0)
+        points = self.control[leaders, np.arange(len(self.district_ids))]
+        return [self.player_ids[leader] if held else None
+                for leader, held in zip(leaders.tolist(), (points >= CONTROL_POINTS).tolist())]
+
+    def player_summary(self, player_id: Any) -> Dict[str, Any]:
+        """Income per resource and controlled districts of one player."""
+        row = self._player_index[player_id]
+        income = self.income()[row]
+        return {
+            "income": dict(zip(RESOURCE_TYPES, income.sum(axis=0).tolist())),
+            "districts": [self.district_ids[i] for i in np.flatnonzero(self.has_control[row]).tolist()],
+            "strong_control": [self.district_ids[i] for i in np.flatnonzero(self.strong_control()[row]).tolist()],
+        }
@@ -1,11 +1,20 @@
 # Updated main.py with improved initialization and error handling
 
 import asyncio
+import multiprocessing
 import os
+import signal
+import socket
+import time
 import traceback
 import sys
+
+# Cold-start timing counts the imports below
+STARTED_AT = time.perf_counter()
+
+from typing import Optional
 from dotenv import load_dotenv
-from telegram import Update
+from telegram import Bot, Update
 from telegram.ext import (
     Application,
     ContextTypes,
@@ -18,9 +27,12 @@ load_dotenv()
 os.makedirs("logs", exist_ok=True)
 
 # Setup logging before anything else
-from utils.logger import setup_logger, configure_telegram_logger, configure_supabase_logger
+from utils.logger import add_log_file, setup_logger, configure_telegram_logger, configure_supabase_logger
 
-logger = setup_logger(name="meta_game", level="INFO", log_file="logs/meta_log")
+LOG_FILE = "logs/meta_log"
+# Worker processes in supervisor mode import this module too; they log to a file of their own (see run_worker)
+IS_WORKER_PROCESS = multiprocessing.parent_process() is not None
+logger = setup_logger(name="meta_game", level="INFO", log_file=None if IS_WORKER_PROCESS else LOG_FILE)
 configure_telegram_logger()
 configure_supabase_logger()
 
@@ -29,12 +41,33 @@ from db.supabase_client import init_supabase, get_supabase
 from db import initialize_db
 
 # Import core components
-from bot.handlers import register_all_handlers
-from bot.middleware import setup_middleware
+from bot.handlers import handler_registry, register_all_handlers
+from bot.keyboards import prebuild_keyboards
+from bot.middleware import setup_middleware, prune_rate_limit_data
+from bot.screens import prerender_screens
+from bot.sharding import Supervisor, serve_shard, shard_path
+from bot.warmup import warm_up
 from utils.config import load_config
-from utils.i18n import load_translations_safely, init_i18n
+from utils.i18n import (
+    load_translations_safely,
+    init_i18n,
+    watch_translation_files,
+    flush_missing_translations_task,
+    translation_sync_task,
+    save_missing_translations,
+)
 from utils.error_handling import handle_error
-from utils.context_manager import context_manager
+from utils.context_manager import (
+    context_manager,
+    InMemoryContextBackend,
+    GAME_CONTEXT_TYPES,
+    MAX_CONTEXTS,
+    USER_CONTEXT_TIMEOUT,
+)
+from utils.handoff import DEFAULT_MAX_AGE, DEFAULT_SNAPSHOT_PATH, load_snapshot, write_snapshot
+from utils.persistence import ContextStore, SQLitePersistence, flush_task
+from utils.startup import StartupGraph, track_first_update
+from utils.user_locks import PerUserUpdateProcessor
 
 
 async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -80,9 +113,9 @@ async def init_database_with_retry(max_attempts=3):
             client = init_supabase()
             logger.info("Supabase client initialized")
 
-            # Check if tables exist by trying to access them
+            # Check if tables exist by trying to access them (the client blocks, so off the event loop)
             try:
-                response = client.table("players").select("count").limit(1).execute()
+                await asyncio.to_thread(client.table("players").select("count").limit(1).execute)
                 logger.info("Database tables verified")
                 return True
             except Exception as e:
@@ -109,12 +142,67 @@ async def cleanup_task():
             cleaned = context_manager.cleanup_expired()
             if cleaned > 0:
                 logger.info(f"Cleaned up {cleaned} expired user contexts")
+            prune_rate_limit_data()
+            handler_registry.callback_router.log_stats()
         except Exception as e:
             logger.error(f"Error in cleanup task: {e}")
         await asyncio.sleep(300)  # Run every 5 minutes
 
 
-async def main():
+async def run_supervisor(token: str, config: dict) -> None:
+    """Receive updates and route them to worker processes by user."""
+    supervisor = Supervisor.from_config(config.get('workers', {}), run_worker)
+    bot = Bot(token)
+    await bot.initialize()
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    logger.info("Starting worker processes...")
+    await supervisor.start()
+
+    webhook_config = config.get('webhook', {})
+    webhook_server = None
+    poll_job = None
+    try:
+        if webhook_config.get('enabled', False):
+            from bot.webhook import WebhookServer
+
+            # One queue worker keeps the arrival order the shards rely on
+            webhook_server = WebhookServer.from_config(
+                None, webhook_config, secret_token=os.getenv("TELEGRAM_WEBHOOK_SECRET"),
+                bot=bot, process=supervisor.route, workers=1
+            )
+            await webhook_server.start(os.getenv("TELEGRAM_WEBHOOK_URL") or webhook_config.get('url'))
+        else:
+            poll_job = asyncio.create_task(supervisor.poll(bot, stop_event))
+        logger.info("Supervisor is running!")
+        await stop_event.wait()
+    finally:
+        logger.info("Stopping supervisor...")
+        if poll_job and not poll_job.done():
+            poll_job.cancel()
+            # Telegram refuses a second get_updates while the long poll is still open
+            await asyncio.gather(poll_job, return_exceptions=True)
+            await supervisor.acknowledge(bot)
+        if webhook_server and webhook_server.accepting:
+            await webhook_server.stop()
+        await supervisor.stop()
+        await bot.shutdown()
+
+
+def run_worker(index: int, shard: socket.socket) -> None:
+    """Entry point of a worker process in supervisor mode."""
+    # Ctrl+C reaches the whole process group; workers stop when the supervisor closes their shard
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    add_log_file(logger, shard_path(LOG_FILE, index))
+    logger.info(f"Worker {index} starting (pid {os.getpid()})")
+    asyncio.run(main(worker_index=index, shard=shard))
+
+
+async def main(worker_index: Optional[int] = None, shard: Optional[socket.socket] = None):
     """Initialize and start the bot."""
     # Load bot token
     token = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -133,108 +221,233 @@ async def main():
         del config['bot']['proxy']
         logger.info("Removed proxy configuration as it's not supported with this version")
 
-    # Initialize the Application with better error handling
-    application = Application.builder().token(token).build()
-
-    # Register error handler first so it can catch initialization errors
-    application.add_error_handler(error_handler)
-
-    # Start initialization tasks
-    logger.info("Initializing Supabase client and database...")
-    db_init_success = await init_database_with_retry()
-    if not db_init_success:
-        logger.warning("Bot will continue but database functionality may be limited")
+    # Supervisor mode: receive updates here and leave handling to worker processes
+    if shard is None and config.get('workers', {}).get('count', 0) > 1:
+        await run_supervisor(token, config)
+        return
 
-    # Initialize db module and get functions
-    db_functions = initialize_db()
+    # Use a shared context backend when several workers serve the same bot
+    context_config = config.get('context', {})
+    shared_context = context_config.get('backend', 'memory') == 'redis'
+    if shared_context:
+        from utils.resp_backend import RespContextBackend
+        context_manager.set_backend(RespContextBackend.from_url(
+            context_config.get('redis_url', 'redis://localhost:6379/0'),
+            key_prefix=context_config.get('key_prefix', 'meta_game:ctx:'),
+            ttl=USER_CONTEXT_TIMEOUT,
+            near_cache_ttl=context_config.get('near_cache_ttl_seconds', 5.0)
+        ))
+        logger.info("Using shared Redis context backend")
+    else:
+        context_manager.set_backend(InMemoryContextBackend(
+            max_contexts=context_config.get('max_contexts', MAX_CONTEXTS)
+        ))
+
+    # Set up the disk-backed store so wizard state survives restarts
+    persistence_config = config.get('persistence', {})
+    context_store = None
+    # Process users in parallel, but each user's updates strictly in order
+    # GameContext makes context.user_data a view of context_manager
+    builder = Application.builder().token(token).context_types(GAME_CONTEXT_TYPES).concurrent_updates(
+        PerUserUpdateProcessor(
+            config.get('bot', {}).get('max_concurrent_updates', 64),
+            max_pending_updates=config.get('bot', {}).get('max_pending_updates')
+        )
+    )
+    # Telegram either pushes updates to our webhook server or the updater polls for them
+    webhook_config = config.get('webhook', {})
+    use_webhook = shard is None and webhook_config.get('enabled', False)
+    if use_webhook or shard is not None:
+        builder = builder.updater(None)
+    if persistence_config.get('enabled', False):
+        db_path = persistence_config.get('path', 'data/meta_game.sqlite3')
+        if worker_index is not None:
+            # Each worker only persists its own shard of users
+            db_path = shard_path(db_path, worker_index)
+        # A shared backend already outlives the process; only the local one needs a store
+        if not shared_context:
+            context_store = ContextStore(db_path, max_age=USER_CONTEXT_TIMEOUT)
+            context_manager.attach_store(context_store)
+        builder = builder.persistence(SQLitePersistence(
+            db_path,
+            update_interval=persistence_config.get('ptb_update_interval_seconds', 60)
+        ))
+        logger.info(f"Persistence enabled at {db_path}")
 
-    # Initialize i18n with correct dependencies
-    init_i18n(player_exists_func=db_functions['player_exists'], get_supabase_func=get_supabase)
+    # Initialize the Application with better error handling
+    application = builder.build()
+    webhook_server = None
+    if use_webhook:
+        # aiohttp is only needed in webhook mode
+        from bot.webhook import WebhookServer
 
-    # Asynchronously load translations
-    logger.info("Loading translations...")
-    await load_translations_safely()
+        webhook_server = WebhookServer.from_config(
+            application, webhook_config, secret_token=os.getenv("TELEGRAM_WEBHOOK_SECRET")
+        )
 
-    # Set up middleware FIRST
-    logger.info("Setting up middleware...")
-    setup_middleware(application, admin_ids)
+    # Register error handler first so it can catch initialization errors
+    application.add_error_handler(error_handler)
 
-    # Register all handlers using the unified handler registration system
-    logger.info("Registering handlers...")
+    # Initialization steps run as soon as what they need is ready
+    async def init_database() -> None:
+        logger.info("Initializing Supabase client and database...")
+        if not await init_database_with_retry():
+            logger.warning("Bot will continue but database functionality may be limited")
+
+    async def init_translations() -> None:
+        # Initialize i18n with the db module's functions, then load translations
+        db_functions = initialize_db()
+        init_i18n(player_exists_func=db_functions['player_exists'], get_supabase_func=get_supabase)
+        logger.info("Loading translations...")
+        await load_translations_safely()
+
+    async def warm_caches() -> None:
+        # Build the common keyboards, then render help pages and menus, once per language
+        prebuild_keyboards()
+        prerender_screens()
+
+    def register_handlers() -> None:
+        # Importing the handler modules is the slow part, so this runs in a thread
+        logger.info("Setting up middleware...")
+        setup_middleware(application, admin_ids)
+        logger.info("Registering handlers...")
+        try:
+            register_all_handlers(application)
+        except Exception as handler_error:
+            logger.error(f"Error registering handlers: {handler_error}")
+            raise
+        track_first_update(application, STARTED_AT)
+
+    startup = StartupGraph(STARTED_AT)
+    startup.add("database", init_database)
+    startup.add("translations", init_translations)
+    startup.add("caches", warm_caches, needs=["translations"])
+    startup.add("handlers", register_handlers, blocking=True)
+    handoff_config = config.get('handoff', {})
+    handoff_path = handoff_config.get('path', DEFAULT_SNAPSHOT_PATH)
+    if worker_index is not None:
+        handoff_path = shard_path(handoff_path, worker_index)
+
+    async def restore_state() -> None:
+        # The handler modules hold the rest of the state, so they are imported by now
+        if handoff_config.get('enabled', True):
+            load_snapshot(handoff_path, handoff_config.get('max_age_seconds', DEFAULT_MAX_AGE))
+
+    startup.add("handoff", restore_state, needs=["handlers"])
+    warmup_config = config.get('warmup', {})
+    if warmup_config.get('enabled', True):
+        async def warm_up_caches() -> None:
+            shard_of = None
+            if worker_index is not None:
+                shard_of = (worker_index, config.get('workers', {}).get('count', 0))
+            await warm_up(warmup_config.get('player_page_size', 1000), shard_of)
+
+        # Before any update is accepted, on top of the common keyboards and screens
+        startup.add("warmup", warm_up_caches, needs=["database", "caches", "handoff"])
+    # Connects to Telegram; persistent conversations have to be registered first
+    startup.add("application", application.initialize, needs=["handlers"])
     try:
-        register_all_handlers(application)
-    except Exception as handler_error:
-        logger.error(f"Error registering handlers: {handler_error}")
-        logger.critical("Cannot continue without handlers")
+        await startup.run()
+    except Exception as startup_error:
+        logger.critical(f"Cannot start the bot: {startup_error}")
         return
 
     # Start the bot
     logger.info("Starting Meta Game bot...")
 
-    # Set up graceful shutdown
-    import signal
-
-    # Define shutdown handler
-    async def shutdown(signal_number, frame):
-        """Shut down the bot gracefully on receiving a signal."""
-        logger.info(f"Received signal {signal_number}, shutting down...")
-
-        # Make sure updater is stopped first
-        if application.updater and application.updater.running:
-            try:
-                await application.updater.stop()
-            except Exception as e:
-                logger.error(f"Error stopping updater: {e}")
-
-        # Then stop the application
+    # Set when the bot should stop: on SIGINT/SIGTERM, or in a worker when the supervisor closes the shard
+    stop_event = asyncio.Event()
+    # Register signal handlers with proper error handling (workers are stopped by the supervisor)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM) if shard is None else ():
         try:
-            if application.running:
-                await application.stop()
-        except Exception as e:
-            logger.error(f"Error stopping application: {e}")
-
-        # Finally, shutdown the application
-        try:
-            await application.shutdown()
-        except Exception as e:
-            logger.error(f"Error during application shutdown: {e}")
-
-    # Register signal handlers with proper error handling
-    try:
-        for sig in (signal.SIGINT, signal.SIGTERM):
-            try:
-                signal.signal(sig, lambda s, f: asyncio.create_task(shutdown(s, f)))
-            except Exception as signal_error:
-                logger.error(f"Error setting up signal handler for {sig}: {signal_error}")
-    except Exception as e:
-        logger.error(f"Error setting up signal handlers: {e}")
+            loop.add_signal_handler(sig, stop_event.set)
+        except Exception as signal_error:
+            logger.error(f"Error setting up signal handler for {sig}: {signal_error}")
 
     # Start the bot with error handling
     try:
-        await application.initialize()
         await application.start()
-        await application.updater.start_polling(allowed_updates=Update.ALL_TYPES)
+        shard_job = None
+        if shard is not None:
+            shard_job = asyncio.create_task(serve_shard(shard, application, stop_event.set))
+        elif webhook_server:
+            await webhook_server.start(os.getenv("TELEGRAM_WEBHOOK_URL") or webhook_config.get('url'))
+        else:
+            await application.updater.start_polling(allowed_updates=Update.ALL_TYPES)
         logger.info("Bot is running!")
 
         # Start cleanup task as a background task
         cleanup_job = asyncio.create_task(cleanup_task())
+        flush_job = None
+        if context_store:
+            flush_job = asyncio.create_task(
+                flush_task(context_store, persistence_config.get('flush_interval_seconds', 5))
+            )
+        elif shared_context:
+            # Other workers see a user's writes once they are sent
+            flush_job = asyncio.create_task(
+                flush_task(context_manager.backend, context_config.get('flush_interval_seconds', 0.1))
+            )
+
+        # Pick up edited translation files without a restart
+        i18n_config = config.get('i18n', {})
+        missing_job = asyncio.create_task(
+            flush_missing_translations_task(i18n_config.get('missing_flush_interval_seconds', 300))
+        )
+        watch_job = None
+        sync_job = None
+        if i18n_config.get('db_sync_interval_seconds', 60) > 0:
+            # The first pass loads the translations table, later ones only edited rows
+            sync_job = asyncio.create_task(
+                translation_sync_task(i18n_config.get('db_sync_interval_seconds', 60))
+            )
+        if i18n_config.get('watch_files', False):
+            watch_job = asyncio.create_task(
+                watch_translation_files(i18n_config.get('watch_interval_seconds', 5))
+            )
 
         # Run the bot until stopped
         try:
-            # Use asyncio.Event() to keep the task running indefinitely
-            stop_event = asyncio.Event()
             await stop_event.wait()
         except asyncio.CancelledError:
             # Bot is being shut down
             logger.info("Main task cancelled, shutting down...")
         finally:
-            # Clean up
+            # Drain: no new updates first, then finish the ones in flight
+            logger.info("Draining updates...")
+            if shard_job and not shard_job.done():
+                shard_job.cancel()
+            if application.updater and application.updater.running:
+                # Also marks every fetched update as read with Telegram
+                await application.updater.stop()
+            if webhook_server and webhook_server.accepting:
+                await webhook_server.stop()
+            await application.stop()
+
+            # Then flush the write-behind queues
             if 'cleanup_job' in locals() and not cleanup_job.done():
                 cleanup_job.cancel()
-
-            # Ensure the bot is properly shut down
-            await application.updater.stop()
-            await application.stop()
+            if flush_job and not flush_job.done():
+                flush_job.cancel()
+            if watch_job and not watch_job.done():
+                watch_job.cancel()
+            if sync_job and not sync_job.done():
+                sync_job.cancel()
+            if not missing_job.done():
+                missing_job.cancel()
+            save_missing_translations()
+            if context_store:
+                context_store.close()
+            if shared_context:
+                context_manager.backend.close()
+
+            # And hand what's left in memory over to the next process
+            if handoff_config.get('enabled', True):
+                try:
+                    write_snapshot(handoff_path)
+                except Exception as e:
+                    logger.error(f"Error writing handoff snapshot: {e}")
             await application.shutdown()
 
         logger.info("Bot stopped")
@@ -0,0 +1,57 @@
+import asyncio
+import re
+import unittest
+import uuid
+
+from bot.callback_data import CallbackCodec, CallbackDataError, Choice, Entity, Uuid, codec, encode, pattern
+
+
+class TestCallbackCodec(unittest.TestCase):
+    def test_packed_payloads_are_bounded_and_round_trip(self):
+        name = "Политик с очень длинным именем, который не влезает в шестьдесят четыре байта"
+        action_id = str(uuid.uuid4())
+        for route, args in (("politician_action", ["displace", name]), ("district", ["Liman"]),
+                            ("join_collective_action", [action_id])):
+            data = encode(route, *args)
+            self.assertLessEqual(len(data.encode("utf-8")), 64, data)
+            self.assertTrue(re.match(pattern(route), data))
+            self.assertEqual(asyncio.run(codec.decode(data)), (route, args))
+
+        self.assertEqual(len(encode("join_collective_action", action_id)), 3 + 22)
+        with self.assertRaises(CallbackDataError):
+            encode("join_collective_action", "unknown")
+
+    def test_legacy_and_stale_payloads(self):
+        self.assertEqual(asyncio.run(codec.decode("politician_action:attack:Ana: the Elder")),
+                         ("politician_action", ["attack", "Ana: the Elder"]))
+        self.assertEqual(asyncio.run(codec.decode("district:Liman")), ("district", ["Liman"]))
+        self.assertTrue(re.match(pattern("district"), "district:Liman"))
+        for data in ("politician_action:fly:Ana", "~9dxxxx", "~1zabc", "unrelated:1"):
+            self.assertIsNone(asyncio.run(codec.decode(data)), data)
+
+    def test_names_reloaded_after_restart(self):
+        names = ["Liman", "Podbara"]
+        loads = []
+
+        async def load_names():
+            loads.append(1)
+            return names
+
+        routes = CallbackCodec()
+        routes.register("district", "d", Entity("district", load_names))
+        routes.register("vote", "v", Choice("yes", "no"), Uuid())
+        data = encode("district", "Podbara")
+
+        # A fresh table knows no names until it looks them up
+        self.assertEqual(asyncio.run(routes.args(data, "district")), ["Podbara"])
+        self.assertEqual(len(loads), 1)
+        self.assertIsNone(asyncio.run(routes.args(encode("district", "Gone"), "district")))
+        # Unknown ids don't reload the names again right away
+        self.assertEqual(len(loads), 1)
+        self.assertIsNone(asyncio.run(routes.args(data, "vote")))
+        with self.assertRaises(ValueError):
+            routes.register("other", "d")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from bot.callback_data import encode
+from bot.handlers import CallbackRouter, HandlerRegistry
+
+
+def make_handler(name, calls):
+    async def handler(update, context):
+        calls.append((name, update.callback_query.data))
+    handler.__name__ = name
+    return handler
+
+
+def query(data):
+    return SimpleNamespace(callback_query=SimpleNamespace(data=data))
+
+
+class TestCallbackRouter(unittest.TestCase):
+    def test_exact_then_longest_prefix_then_fallback(self):
+        calls = []
+        router = CallbackRouter()
+        router.add("settings", make_handler("settings", calls))
+        router.add("settings:language", make_handler("language_menu", calls))
+        router.add("politician:", make_handler("politician", calls), prefix=True)
+        router.add("politician_action:", make_handler("politician_action", calls), prefix=True)
+        router.fallback = make_handler("general", calls)
+
+        async def run():
+            for data in ("settings", "settings:language", "politician:Marko", "politician_action:attack:Marko",
+                         "politician", "unknown", ""):
+                await router.dispatch(query(data), None)
+
+        asyncio.run(run())
+        self.assertEqual([name for name, _ in calls], [
+            "settings", "language_menu", "politician", "politician_action", "general", "general", "general"
+        ])
+        stats = router.stats()
+        self.assertEqual(stats["politician:"]["hits"], 1)
+        self.assertEqual(stats[CallbackRouter.FALLBACK_ROUTE]["hits"], 3)
+
+    def test_conflicts_and_overlaps(self):
+        calls = []
+        router = CallbackRouter()
+        first, second = make_handler("first", calls), make_handler("second", calls)
+        router.add("help:", first, prefix=True)
+        router.add("help:", first, prefix=True)  # duplicate, ignored
+        with self.assertRaises(ValueError):
+            router.add("help:", second, prefix=True)
+        # The same text as an exact route is a different table
+        router.add("help:", second)
+        self.assertEqual(len(router), 2)
+        self.assertEqual(len(router.check()), 1)
+
+    def test_registered_routes_do_not_overlap(self):
+        from bot.callbacks import register_callbacks
+
+        registry = HandlerRegistry()
+        register_callbacks(registry)
+        router = registry.callback_router
+        self.assertEqual(router.check(), [])
+        self.assertEqual(router.resolve("~1j")[1].__name__, "join_collective_action_callback")
+        self.assertEqual(router.resolve(encode("politician_action", "attack", "Marko"))[1].__name__,
+                         "politician_action_handler")
+        self.assertEqual(router.resolve("news_page:next")[1].__name__, "page_callback")
+        self.assertEqual(router.resolve("~9zz")[1].__name__, "general_callback")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import logging
+import time
+import tracemalloc
+import unittest
+
+from utils.context_manager import ContextManager
+
+logger = logging.getLogger(__name__)
+
+USERS = 100_000
+
+
+def _measure(populate):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    storage = populate()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return storage, after - before
+
+
+class TestUserContextMemory(unittest.TestCase):
+    def test_slotted_contexts_use_less_memory(self):
+        def legacy():
+            # The previous layout: {user_id: {'data': {...}, 'timestamp': float}}
+            storage = {}
+            for i in range(USERS):
+                storage[str(i)] = {
+                    'data': {'language': 'en_US', 'is_registered': True},
+                    'timestamp': time.time()
+                }
+            return storage
+
+        def slotted():
+            manager = ContextManager()
+            for i in range(USERS):
+                manager.set(str(i), 'language', 'en_US')
+                manager.set(str(i), 'is_registered', True)
+            return manager
+
+        _, legacy_bytes = _measure(legacy)
+        _, slotted_bytes = _measure(slotted)
+        logger.info(f"{USERS} contexts: legacy {legacy_bytes / 2**20:.1f} MiB, "
+                    f"slotted {slotted_bytes / 2**20:.1f} MiB")
+        self.assertLess(slotted_bytes, legacy_bytes * 0.75)
+
+    def test_views_are_read_only_and_live(self):
+        manager = ContextManager()
+        manager.set("1", "language", "ru_RU")
+        manager.set("1", "action_type", "attack")
+        manager.set("1", "custom", 5)
+
+        view = manager.get_all("1")
+        self.assertEqual(dict(view), {"language": "ru_RU", "action_type": "attack", "custom": 5})
+        with self.assertRaises(TypeError):
+            view["language"] = "en_US"
+
+        manager.set("1", "district_name", "Liman")
+        self.assertEqual(view["district_name"], "Liman")
+        self.assertNotIn("player_data", view)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import gc
+import tracemalloc
+import unittest
+from unittest import mock
+
+from utils.context_manager import (
+    InMemoryContextBackend,
+    UserDataView,
+    context_manager,
+    get_user_data,
+    set_user_data,
+)
+
+MAX_CONTEXTS = 500
+
+
+class TestContextSoak(unittest.TestCase):
+    def setUp(self):
+        self._backend = context_manager.backend
+        context_manager._backend = InMemoryContextBackend(max_contexts=MAX_CONTEXTS)
+
+    def tearDown(self):
+        context_manager._backend = self._backend
+
+    def _simulate_updates(self, first_user, count):
+        for user_id in range(first_user, first_user + count):
+            telegram_id = str(user_id)
+            # What the middleware and a wizard step do for each update
+            user_data = UserDataView(telegram_id)
+            user_data["player_data"] = {"player_name": f"Player {user_id}", "resources": {"influence": 5}}
+            set_user_data(telegram_id, "action_type", "influence")
+            user_data["news_page"] = 1
+            self.assertEqual(get_user_data(telegram_id)["news_page"], 1)
+
+    def test_memory_is_flat_under_churn(self):
+        tracemalloc.start()
+        # Fill to the steady state, then keep churning through new users
+        self._simulate_updates(0, 5 * MAX_CONTEXTS)
+        gc.collect()
+        steady = tracemalloc.get_traced_memory()[0]
+        self._simulate_updates(10_000, 40 * MAX_CONTEXTS)
+        gc.collect()
+        growth = tracemalloc.get_traced_memory()[0] - steady
+        tracemalloc.stop()
+
+        self.assertEqual(context_manager.size(), MAX_CONTEXTS)
+        # A leak of even one small dict per user would be well over this
+        self.assertLess(growth, 64 * 1024)
+
+    def test_full_cache_reads_do_not_scan(self):
+        self._simulate_updates(0, MAX_CONTEXTS)
+        # A full LRU is the normal state; expiry is left to the cleanup task
+        with mock.patch.object(context_manager.backend, "cleanup_expired",
+                               side_effect=AssertionError("scanned on read")):
+            self.assertEqual(get_user_data("1")["news_page"], 1)
+
+    def test_user_data_view_is_the_single_store(self):
+        user_data = UserDataView("1")
+        user_data["language"] = "ru_RU"
+        self.assertEqual(context_manager.get("1", "language"), "ru_RU")
+        set_user_data("1", "district_name", "Liman")
+        self.assertEqual(user_data["district_name"], "Liman")
+        del user_data["district_name"]
+        self.assertNotIn("district_name", get_user_data("1"))
+        user_data.clear()
+        self.assertEqual(len(user_data), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import logging
+import random
+import time
+import unittest
+
+import numpy as np
+
+from game.model import (
+    CONTROL_LEVELS,
+    ControlModel,
+    control_level,
+    district_income,
+    income_percent,
+    income_tier,
+    income_tiers,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def reference_income(control_points, base):
+    # calculate_district_resources from db/05_functions_core.sql
+    if control_points >= 75:
+        multiplier = 1.2
+    elif control_points >= 50:
+        multiplier = 1.0
+    elif control_points >= 35:
+        multiplier = 0.8
+    elif control_points >= 20:
+        multiplier = 0.6
+    else:
+        multiplier = 0.4
+    # DECIMAL arithmetic: floor of the exact product
+    return int(round(base * multiplier * 10)) // 10
+
+
+class TestControlModel(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.districts = [{"district_id": f"d{i}", "influence_resource": rng.randint(0, 9),
+                           "money_resource": rng.randint(0, 9), "information_resource": rng.randint(0, 9),
+                           "force_resource": rng.randint(0, 9)} for i in range(12)]
+        self.rows = [{"player_id": f"p{p}", "district_id": f"d{d}", "control_points": rng.randint(0, 100)}
+                     for p in range(300) for d in range(12) if rng.random() < 0.4]
+
+    def test_scalar_tiers(self):
+        self.assertEqual([income_percent(cp) for cp in (0, 19, 20, 34, 35, 49, 50, 74, 75, 100)],
+                         [40, 40, 60, 60, 80, 80, 100, 100, 120, 120])
+        self.assertEqual([control_level(cp) for cp in (0, 30, 59, 60, 80)],
+                         ["neutral", "contested", "contested", "controlled", "strong"])
+        points = np.arange(0, 101)
+        self.assertEqual(income_tiers(points).tolist(), [income_tier(cp) for cp in range(101)])
+
+    def test_income_matches_database_rules(self):
+        model = ControlModel.from_rows(self.districts, self.rows)
+        income = model.income()
+        resources = ("influence", "money", "information", "force")
+        totals = {}
+        for row in self.rows:
+            district = self.districts[int(row["district_id"][1:])]
+            expected = [reference_income(row["control_points"], district[f"{r}_resource"]) for r in resources]
+            p, d = model.player_ids.index(row["player_id"]), int(row["district_id"][1:])
+            self.assertEqual(income[p, d].tolist(), expected)
+            totals[row["player_id"]] = [a + b for a, b in zip(totals.get(row["player_id"], [0] * 4), expected)]
+
+        player_income = model.player_income()
+        for player_id, expected in totals.items():
+            self.assertEqual(player_income[model.player_ids.index(player_id)].tolist(), expected)
+        self.assertEqual(model.player_summary("p0")["income"], dict(zip(resources, totals["p0"])))
+
+    def test_control_status(self):
+        model = ControlModel(["a", "b", "c"], np.ones((3, 4)), ["x", "y"], [[85, 10, 65], [70, 20, 70]])
+        self.assertEqual(model.strong_control().tolist(), [[True, False, False], [False, False, False]])
+        self.assertEqual(model.controllers(), ["x", None, "y"])
+        self.assertEqual([CONTROL_LEVELS[i] for i in model.district_levels()], ["strong", "neutral", "controlled"])
+        self.assertEqual(district_income([80, 10], [[5, 5, 5, 5], [5, 5, 5, 5]]).tolist(),
+                         [[6, 6, 6, 6], [2, 2, 2, 2]])
+
+    def test_vectorized_throughput(self):
+        model = ControlModel.from_rows(self.districts, self.rows)
+        start = time.perf_counter()
+        model.player_income()
+        vectorized = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for row in self.rows:
+            district = self.districts[int(row["district_id"][1:])]
+            for resource in ("influence", "money", "information", "force"):
+                reference_income(row["control_points"], district[f"{resource}_resource"])
+        loop = time.perf_counter() - start
+
+        logger.info(f"{len(self.rows)} control records: vectorized {vectorized * 1000:.2f} ms, "
+                    f"loop {loop * 1000:.2f} ms")
+        self.assertLess(vectorized, loop)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from bot import middleware
+from db.player_directory import PlayerDirectory
+from utils import handoff
+from utils.context_manager import InMemoryContextBackend, USER_CONTEXT_TIMEOUT
+
+
+class TestHandoff(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "handoff.json")
+        # Only the sections registered by each test
+        patcher = mock.patch.dict(handoff._sections, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def register(self, directory, backend):
+        handoff.register_state("players", directory.snapshot, directory.restore)
+        handoff.register_state("contexts", backend.snapshot, backend.restore)
+
+    def test_state_survives_a_restart(self):
+        old_directory, old_backend = PlayerDirectory(), InMemoryContextBackend()
+        old_directory.add("1", "ru_RU")
+        old_directory.loaded, old_directory.loaded_at = True, time.time()
+        old_backend.set("1", "language", "ru_RU")
+        old_backend.set("1", "district_name", "Center")
+        old_backend.set("2", "language", "en_US")
+        old_backend.get("1", "language")
+        self.register(old_directory, old_backend)
+        self.assertEqual(handoff.write_snapshot(self.path), ["players", "contexts"])
+
+        new_directory, new_backend = PlayerDirectory(), InMemoryContextBackend()
+        self.register(new_directory, new_backend)
+        self.assertEqual(handoff.load_snapshot(self.path), ["players", "contexts"])
+
+        self.assertTrue(new_directory.loaded)
+        self.assertEqual(new_directory.language("1"), "ru_RU")
+        self.assertEqual(dict(new_backend.get_all("1")), {"language": "ru_RU", "district_name": "Center"})
+        # Least recently used order carries over
+        self.assertEqual(list(new_backend._storage), ["2", "1"])
+        # Handed over once only
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_unloaded_and_expired_state_is_left_out(self):
+        directory, backend = PlayerDirectory(), InMemoryContextBackend()
+        backend.set("1", "language", "ru_RU")
+        backend._storage["1"].timestamp = time.time() - USER_CONTEXT_TIMEOUT - 1
+        self.register(directory, backend)
+        self.assertEqual(handoff.write_snapshot(self.path), ["contexts"])
+
+        restored = InMemoryContextBackend()
+        handoff.register_state("contexts", restored.snapshot, restored.restore)
+        handoff.load_snapshot(self.path)
+        self.assertEqual(restored.size(), 0)
+
+    def test_old_snapshot_is_ignored(self):
+        directory = PlayerDirectory()
+        directory.loaded = True
+        directory.add("1", "en_US")
+        handoff.register_state("players", directory.snapshot, directory.restore)
+        handoff.write_snapshot(self.path)
+        with open(self.path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+        snapshot["created_at"] -= 600
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+
+        restored = PlayerDirectory()
+        handoff.register_state("players", restored.snapshot, restored.restore)
+        self.assertEqual(handoff.load_snapshot(self.path, max_age=300), [])
+        self.assertFalse(restored.loaded)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_stale_directory_is_loaded_again(self):
+        directory = PlayerDirectory()
+        directory.add("1", "en_US")
+        directory.loaded, directory.loaded_at = True, time.time() - 7200
+        handoff.register_state("players", directory.snapshot, directory.restore)
+        handoff.write_snapshot(self.path)
+
+        restored = PlayerDirectory()
+        handoff.register_state("players", restored.snapshot, restored.restore)
+        handoff.load_snapshot(self.path)
+        # Warm-up loads it from the database instead
+        self.assertFalse(restored.loaded)
+        self.assertEqual(len(restored), 0)
+
+    def test_rate_limits_round_trip(self):
+        counters = {42: {"window_start": 1.0, "last_request": time.time(), "request_count": 9, "warning_count": 1}}
+        with mock.patch.dict(middleware.rate_limit_data, counters, clear=True), \
+                mock.patch.object(middleware, "blocked_users", {7}):
+            state = json.loads(json.dumps(middleware.export_rate_limits()))
+        with mock.patch.dict(middleware.rate_limit_data, clear=True), \
+                mock.patch.object(middleware, "blocked_users", set()):
+            middleware.restore_rate_limits(state)
+            self.assertEqual(middleware.rate_limit_data[42]["request_count"], 9)
+            self.assertEqual(middleware.blocked_users, {7})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from utils import i18n_core
+from utils.i18n_core import _, render, build_catalog, compile_catalogs, _compile_renderer
+
+
+class TestCompiledCatalogs(unittest.TestCase):
+    def setUp(self):
+        self._saved = {lang: dict(strings) for lang, strings in i18n_core._translations.items()}
+        i18n_core._translations["en_US"].update({
+            "Hello {name}": "Hello {name}",
+            "Only English": "Only English",
+        })
+        i18n_core._translations["ru_RU"].update({
+            "Hello {name}": "Привет, {name}",
+            "Empty": "",
+        })
+        compile_catalogs()
+
+    def tearDown(self):
+        for lang, strings in self._saved.items():
+            i18n_core._translations[lang].clear()
+            i18n_core._translations[lang].update(strings)
+        compile_catalogs()
+
+    def test_lookup_and_fallback(self):
+        self.assertEqual(_("Hello {name}", "ru_RU"), "Привет, {name}")
+        self.assertEqual(_("Only English", "ru_RU"), "Only English")
+        self.assertEqual(_("Empty", "ru_RU"), "Empty")
+        self.assertEqual(_("Hello {name}", "xx_XX"), "Hello {name}")
+        self.assertEqual(_("Not translated", "ru_RU"), "Not translated")
+
+    def test_render_matches_format(self):
+        self.assertEqual(render("Hello {name}", "ru_RU", name="Ана"), "Привет, Ана")
+        self.assertEqual(render("Not translated {x}!", "ru_RU", x=3), "Not translated 3!")
+        self.assertEqual(render("Only English", "ru_RU"), "Only English")
+        with self.assertRaises(KeyError):
+            render("Hello {name}", "ru_RU")
+
+    def test_compiled_renderer_semantics(self):
+        templates = [
+            ("{a} and {b:>4} {{literal}}", {"a": 1, "b": "x"}),
+            ("quotes ' and \" {a!r}", {"a": "q"}),
+            ("{a:.2f}% {a}", {"a": 1.234}),
+            ("{a[k]} {b.real}", {"a": {"k": 1}, "b": 2}),
+            ("{class} {a:{w}}", {"class": 1, "a": 2, "w": 3}),
+            ("no fields {{}}", {}),
+        ]
+        for text, fields in templates:
+            self.assertEqual(_compile_renderer(text)(fields), text.format(**fields), text)
+
+    def test_catalog_merges_default_language(self):
+        catalog = build_catalog("ru_RU", {"en_US": {"a": "A", "b": "B {x}"}, "ru_RU": {"a": "А", "c": ""}})
+        self.assertEqual(catalog.get("a"), "А")
+        self.assertEqual(catalog.get("b"), "B {x}")
+        self.assertIsNone(catalog.get("c"))
+        self.assertEqual(catalog.template("b").render(x=1), "B 1")
+        self.assertIsNone(catalog.template("a"))
+
+
+if __name__ == '__main__':
+    unittest.main()
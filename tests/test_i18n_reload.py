@@ -0,0 +1,72 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from utils import i18n_core
+from utils.i18n import reload_translations
+from utils.i18n_core import _, add_reload_listener, compile_catalogs, render
+from utils.mmap_catalog import compiled_path, write_catalog
+
+
+class TestTranslationReload(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self._saved = {lang: dict(strings) for lang, strings in i18n_core._translations.items()}
+        self._saved_listeners = list(i18n_core._reload_listeners)
+
+    def tearDown(self):
+        i18n_core._reload_listeners[:] = self._saved_listeners
+        for mapped in list(i18n_core._mapped_catalogs.values()):
+            mapped.close()
+        i18n_core._mapped_catalogs.clear()
+        for lang, strings in self._saved.items():
+            i18n_core._translations[lang] = strings
+        compile_catalogs()
+        self.tmpdir.cleanup()
+
+    def _write(self, lang, strings):
+        path = os.path.join(self.tmpdir.name, f"{lang}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(strings, f, ensure_ascii=False)
+        return path
+
+    def _reload(self):
+        return asyncio.run(reload_translations(include_db=False, translations_dir=self.tmpdir.name))
+
+    def test_reload_swaps_catalogs_and_notifies(self):
+        self._write("en_US", {"Greeting {name}": "Hi {name}"})
+        self._write("ru_RU", {"Greeting {name}": "Привет, {name}"})
+        self._reload()
+        old_catalogs = i18n_core._catalogs
+        self.assertEqual(render("Greeting {name}", "ru_RU", name="Ана"), "Привет, Ана")
+
+        reloads = []
+        add_reload_listener(lambda: reloads.append(True))
+        self._write("ru_RU", {"Greeting {name}": "Здравствуйте, {name}"})
+        counts = self._reload()
+
+        self.assertIsNot(i18n_core._catalogs, old_catalogs)
+        self.assertEqual(render("Greeting {name}", "ru_RU", name="Ана"), "Здравствуйте, Ана")
+        # Built-in defaults survive a reload
+        self.assertEqual(_("Yes", "ru_RU"), i18n_core.default_translations()["ru_RU"]["Yes"])
+        self.assertEqual(reloads, [True])
+        self.assertEqual(counts["database"], 0)
+
+    def test_reload_maps_fresh_binary_catalogs(self):
+        json_path = self._write("ru_RU", {"Mapped": "Из файла"})
+        write_catalog({"Mapped": "Из каталога"}, compiled_path(json_path))
+        self._reload()
+        self.assertIn("ru_RU", i18n_core._mapped_catalogs)
+        self.assertEqual(_("Mapped", "ru_RU"), "Из каталога")
+
+        # A second reload maps the file again and unmaps the old one
+        old_mapped = i18n_core._mapped_catalogs["ru_RU"]
+        self._reload()
+        self.assertIsNot(i18n_core._mapped_catalogs["ru_RU"], old_mapped)
+        self.assertEqual(_("Mapped", "ru_RU"), "Из каталога")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from bot import keyboards
+from bot.keyboards import (
+    get_back_keyboard,
+    get_districts_keyboard,
+    get_start_keyboard,
+    invalidate_districts,
+    prebuild_keyboards,
+)
+from utils import i18n_core
+from utils.i18n_core import SUPPORTED_LANGUAGES, build_catalog, compile_catalogs, install_translations
+
+
+class TestKeyboardCache(unittest.TestCase):
+    def setUp(self):
+        self._saved = {lang: dict(strings) for lang, strings in i18n_core._translations.items()}
+
+    def tearDown(self):
+        for lang, strings in self._saved.items():
+            i18n_core._translations[lang] = strings
+        compile_catalogs()
+        keyboards.clear_keyboards()
+
+    def test_keyboards_are_shared_and_follow_reload(self):
+        self.assertGreater(prebuild_keyboards(), len(SUPPORTED_LANGUAGES))
+        before = get_start_keyboard("ru_RU")
+        self.assertIs(get_start_keyboard("ru_RU"), before)
+        self.assertIsNot(get_start_keyboard("en_US"), before)
+        self.assertIs(get_back_keyboard("en_US", "help"), get_back_keyboard("en_US", "help"))
+        self.assertEqual(get_back_keyboard("en_US", "help").inline_keyboard[0][0].callback_data, "help")
+
+        translations = {lang: dict(strings) for lang, strings in i18n_core._translations.items()}
+        translations["ru_RU"]["Status"] = "Статус игрока"
+        catalogs = {lang: build_catalog(lang, translations) for lang in SUPPORTED_LANGUAGES}
+        install_translations(translations, {}, catalogs)
+
+        after = get_start_keyboard("ru_RU")
+        self.assertIsNot(after, before)
+        self.assertEqual(after.inline_keyboard[0][0].text, "Статус игрока")
+
+    def test_districts_keyboard_rebuilt_on_change(self):
+        districts = [{"name": "Liman"}, {"name": "Podbara"}, {"name": "Detelinara"}]
+        fetches = []
+
+        async def fake_get_districts():
+            fetches.append(len(districts))
+            return list(districts)
+
+        async def run():
+            with mock.patch.object(keyboards, "get_districts", fake_get_districts):
+                first = await get_districts_keyboard("en_US")
+                self.assertIs(await get_districts_keyboard("en_US"), first)
+                districts.append({"name": "Grbavica"})
+                invalidate_districts()
+                second = await get_districts_keyboard("en_US")
+                self.assertIsNot(second, first)
+                self.assertIs(await get_districts_keyboard("en_US"), second)
+                return second
+
+        self.addCleanup(invalidate_districts)
+        keyboard = asyncio.run(run())
+        self.assertEqual([button.text for button in keyboard.inline_keyboard[1]], ["Detelinara", "Grbavica"])
+        # Fetched once, and once more after the invalidation
+        self.assertEqual(fetches, [3, 4])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from bot import map_view as map_view_module
+from bot.map_view import MapView
+
+
+class FakeGame:
+    def __init__(self):
+        self.map_calls = 0
+        self.results_time = datetime.now(timezone.utc) + timedelta(hours=1)
+        self.controller = "Marko_M"
+
+    async def get_map_data(self, language="en_US"):
+        self.map_calls += 1
+        # Let concurrent requests pile up behind the fetch
+        await asyncio.sleep(0.01)
+        return {
+            "districts": [
+                {"name": "Liman", "controlling_player": self.controller, "control_level": "strong"},
+                {"name": "Podbara", "controlling_player": None, "control_level": "neutral"},
+            ],
+            "game_date": "1999-09-01",
+            "cycle": "morning",
+        }
+
+    async def get_cycle_info(self, language="en_US"):
+        return {"results_time": self.results_time.isoformat()}
+
+
+class TestMapView(unittest.TestCase):
+    def setUp(self):
+        self.game = FakeGame()
+        patcher = mock.patch.multiple(
+            map_view_module, get_map_data=self.game.get_map_data, get_cycle_info=self.game.get_cycle_info
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_rendered_once_and_shared(self):
+        async def run():
+            view = MapView()
+            first = await asyncio.gather(*(view.get("ru_RU") for _ in range(20)))
+            english = await view.get("en_US")
+            return first, english
+
+        first, english = asyncio.run(run())
+        self.assertEqual(self.game.map_calls, 1)
+        self.assertTrue(all(screen is first[0] for screen in first))
+        self.assertIsNot(english, first[0])
+        self.assertIn("Marko\\_M", english.text)
+        self.assertIn("⚪ *Podbara*: No clear control", english.text)
+
+    def test_invalidation_and_cycle_rollover(self):
+        async def run():
+            view = MapView()
+            before = await view.get("en_US")
+            self.game.controller = "Ana"
+            self.assertIs(await view.get("en_US"), before)
+
+            view.invalidate()
+            after = await view.get("en_US")
+            self.assertIn("Controlled by Ana", after.text)
+            self.assertEqual(self.game.map_calls, 2)
+
+            # Results time has passed: the next request fetches the new cycle's map
+            view._expires_at = 0
+            await view.get("en_US")
+            self.assertEqual(self.game.map_calls, 3)
+
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import asyncio
+import unittest
+
+from utils.markdown import MARKDOWN_V2, MessageBuilder, check_entities, escape, strip_markdown
+from utils.message_utils import fixup_message_text
+
+
+class TestMarkdown(unittest.TestCase):
+    def test_check_entities(self):
+        for text in ("*Liman*: 80 CP", "Marko\\_M", "`a_b`", "[site](http://x.org)", "```\nx_y\n```", "a ] b"):
+            self.assertTrue(check_entities(text), text)
+        for text in ("*Liman", "Marko_M", "`a", "[site]", "```x"):
+            self.assertFalse(check_entities(text), text)
+
+        self.assertTrue(check_entities("*bold _italic_*\\. `a*b` [x](http://y\\))", MARKDOWN_V2))
+        for text in ("1.5", "*a _b* c_", "`a", "[x]", "a\\"):
+            self.assertFalse(check_entities(text, MARKDOWN_V2), text)
+
+    def test_builder_escapes_user_data(self):
+        message = (MessageBuilder().markup("*Your Districts*\n\n").text("🔴 ").bold("Marko_M*")
+                   .text(": [80] CP").line().code("a`b").italic("_").link("x]", "http://a.b/(c)"))
+        text = message.build()
+        self.assertEqual(text, "*Your Districts*\n\n🔴 *Marko_M*: \\[80] CP\n`ab`[x](http://a.b/(c%29)")
+        self.assertTrue(check_entities(text))
+
+        text = MessageBuilder(MARKDOWN_V2).bold("v1.5 (beta)").text(" a_b!").code("x`\\").build()
+        self.assertEqual(text, "*v1\\.5 \\(beta\\)* a\\_b\\!`x\\`\\\\`")
+        self.assertTrue(check_entities(text, MARKDOWN_V2))
+
+        # Unbalanced markup is shown literally instead of breaking the message
+        self.assertEqual(MessageBuilder().markup("50% *off").build(), "50% \\*off")
+        self.assertEqual(escape("a_b*c"), "a\\_b\\*c")
+
+    def test_fixup_keeps_valid_markdown(self):
+        text, parse_mode = asyncio.run(fixup_message_text("*Player:* Marko\\_M", "Markdown"))
+        self.assertEqual((text, parse_mode), ("*Player:* Marko\\_M", "Markdown"))
+
+        text, parse_mode = asyncio.run(fixup_message_text("*Player:* Marko\\_M_", "Markdown"))
+        self.assertEqual((text, parse_mode), ("*Player:* Marko_M_", None))
+        self.assertEqual(strip_markdown("a\\.b", MARKDOWN_V2), "a.b")
+
+
+if __name__ == '__main__':
+    unittest.main()
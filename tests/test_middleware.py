@@ -0,0 +1,65 @@
+import asyncio
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from bot import middleware
+from bot.middleware import apply_middleware_chain
+
+
+class TestMiddlewareChain(unittest.TestCase):
+    def test_only_explicit_rejection_stops_the_handlers(self):
+        ran = []
+
+        async def failing_enrichment(update, context):
+            ran.append("enrichment")
+            raise ConnectionError("database unavailable")
+
+        async def passing(update, context):
+            ran.append("passing")
+
+        async def rejecting(update, context):
+            ran.append("rejecting")
+            return False
+
+        # A transient error is logged; the rest of the chain and the handlers still run
+        self.assertTrue(asyncio.run(apply_middleware_chain(None, None, [failing_enrichment, passing])))
+        self.assertEqual(ran, ["enrichment", "passing"])
+
+        ran.clear()
+        self.assertFalse(asyncio.run(apply_middleware_chain(None, None, [rejecting, passing])))
+        self.assertEqual(ran, ["rejecting"])
+
+    def test_rejected_button_press_is_answered(self):
+        answers = []
+
+        async def answer(text=None, show_alert=False):
+            answers.append((text, show_alert))
+
+        async def language(telegram_id):
+            return "en_US"
+
+        update = SimpleNamespace(
+            effective_user=SimpleNamespace(id=99),
+            callback_query=SimpleNamespace(answer=answer),
+            message=None,
+        )
+        now = time.time()
+        counters = {99: {"window_start": now, "last_request": now, "request_count": 1, "warning_count": 0}}
+        with mock.patch.dict(middleware.rate_limit_data, counters, clear=True), \
+                mock.patch.object(middleware, "blocked_users", set()), \
+                mock.patch.object(middleware, "get_config", return_value=1), \
+                mock.patch.object(middleware, "get_user_language", language):
+            self.assertFalse(asyncio.run(middleware.rate_limit_middleware(update, None)))
+            middleware.blocked_users.add(99)
+            self.assertFalse(asyncio.run(middleware.rate_limit_middleware(update, None)))
+
+        # The block notice as an alert, then a bare answer while blocked
+        self.assertEqual(len(answers), 2)
+        self.assertTrue(answers[0][1])
+        self.assertEqual(answers[1], (None, False))
+
+
+if __name__ == '__main__':
+    unittest.main()
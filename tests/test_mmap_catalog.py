@@ -0,0 +1,109 @@
+import json
+import logging
+import os
+import tempfile
+import time
+import unittest
+
+from utils.i18n_core import build_catalog, read_translation_files
+from utils.mmap_catalog import MappedCatalog, build_catalog_bytes, build_directory, compiled_path, is_fresh, write_catalog
+
+logger = logging.getLogger(__name__)
+
+
+class TestMappedCatalog(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def test_round_trip(self):
+        strings = {f"key {i}": f"значение {i}" for i in range(500)}
+        strings["Hello {name}"] = "Привет, {name}"
+        strings["empty"] = ""
+        write_catalog(strings, self._path("ru_RU.cat"))
+
+        catalog = MappedCatalog(self._path("ru_RU.cat"))
+        self.assertEqual(len(catalog), 501)
+        self.assertEqual(catalog["key 42"], "значение 42")
+        self.assertEqual(catalog.get("Hello {name}"), "Привет, {name}")
+        self.assertIsNone(catalog.get("empty"))
+        self.assertNotIn("missing", catalog)
+        self.assertEqual(set(catalog), set(strings) - {"empty"})
+        catalog.close()
+
+    def test_build_directory_and_freshness(self):
+        json_path = self._path("en_US.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"Yes": "Yes"}, f)
+        self.assertFalse(is_fresh(json_path))
+
+        self.assertEqual(build_directory(self.tmpdir.name), {"en_US.json": 1})
+        self.assertTrue(is_fresh(json_path))
+
+        # Touching the JSON source makes the binary catalog stale
+        later = time.time() + 10
+        os.utime(json_path, (later, later))
+        self.assertFalse(is_fresh(json_path))
+        self.assertEqual(compiled_path(json_path), self._path("en_US.cat"))
+
+    def test_bad_catalog_falls_back_to_json(self):
+        for lang_code in ("en_US", "ru_RU"):
+            with open(self._path(f"{lang_code}.json"), "w", encoding="utf-8") as f:
+                json.dump({"Yes": f"Yes {lang_code}"}, f)
+        # An empty file, and one whose slot table runs past its end
+        open(self._path("en_US.cat"), "wb").close()
+        with open(self._path("ru_RU.cat"), "wb") as f:
+            f.write(build_catalog_bytes({"Yes": "Да"})[:40])
+        for name in ("en_US.cat", "ru_RU.cat"):
+            with self.assertRaises(ValueError):
+                MappedCatalog(self._path(name))
+
+        translations = {}
+        self.assertEqual(read_translation_files(translations, self.tmpdir.name), {})
+        self.assertEqual(translations, {"en_US": {"Yes": "Yes en_US"}, "ru_RU": {"Yes": "Yes ru_RU"}})
+
+    def test_layered_catalog_precedence(self):
+        write_catalog({"a": "file ru", "b": "file ru b {x}"}, self._path("ru_RU.cat"))
+        write_catalog({"a": "file en", "c": "file en c"}, self._path("en_US.cat"))
+        mapped = {"ru_RU": MappedCatalog(self._path("ru_RU.cat")), "en_US": MappedCatalog(self._path("en_US.cat"))}
+        overlays = {"ru_RU": {"b": "db ru b {x}"}, "en_US": {"d": "default en d"}}
+
+        catalog = build_catalog("ru_RU", overlays, mapped)
+        self.assertEqual(catalog.get("a"), "file ru")
+        self.assertEqual(catalog.template("b").render(x=1), "db ru b 1")
+        self.assertEqual(catalog.get("c"), "file en c")
+        self.assertEqual(catalog.get("d"), "default en d")
+        self.assertIsNone(catalog.get("missing"))
+        for catalog_file in mapped.values():
+            catalog_file.close()
+
+    def test_startup_cost_is_flat(self):
+        strings = {f"translation key number {i}": f"перевод номер {i} " * 4 for i in range(50_000)}
+        json_path = self._path("big.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(strings, f, ensure_ascii=False)
+        write_catalog(strings, compiled_path(json_path))
+
+        start = time.perf_counter()
+        with open(json_path, "r", encoding="utf-8") as f:
+            json.load(f)
+        json_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        catalog = MappedCatalog(compiled_path(json_path))
+        catalog.get("translation key number 49999")
+        mmap_seconds = time.perf_counter() - start
+        catalog.close()
+
+        logger.info(f"50k strings: json.load {json_seconds * 1000:.1f} ms, "
+                    f"mmap open + lookup {mmap_seconds * 1000:.2f} ms")
+        self.assertLess(mmap_seconds, json_seconds)
+
+
+if __name__ == '__main__':
+    unittest.main()
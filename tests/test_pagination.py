@@ -0,0 +1,94 @@
+import asyncio
+import copy
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from bot import pagination
+from bot.pagination import Page, register_source, show_page
+from utils.markdown import check_entities, split_message
+from utils.message_utils import MAX_MESSAGE_LENGTH, send_chunks
+
+
+class CopyingUserData(dict):
+    """user_data that hands out copies, as the Redis context backend does."""
+
+    def __getitem__(self, key):
+        return copy.deepcopy(super().__getitem__(key))
+
+    def get(self, key, default=None):
+        return copy.deepcopy(super().get(key, default))
+
+    def setdefault(self, key, default=None):
+        return copy.deepcopy(super().setdefault(key, default))
+
+
+class FakeBot:
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, chat_id, text, **kwargs):
+        self.sent.append((text, kwargs))
+        return text
+
+
+class TestPagination(unittest.TestCase):
+    def test_split_at_entity_safe_boundaries(self):
+        text = "\n\n".join(f"*Action ID:* {i}\n*District:* Marko\\_M `/join {i}` " + "x " * 40 for i in range(80))
+        chunks = split_message(text, MAX_MESSAGE_LENGTH)
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) <= MAX_MESSAGE_LENGTH and check_entities(chunk) for chunk in chunks))
+        # Only the whitespace at the cuts is dropped
+        self.assertEqual("".join("".join(chunks).split()), "".join(text.split()))
+
+        # An entity longer than the limit is cut anyway and left to be sent plain
+        self.assertEqual(split_message("*" + "a" * 8 + "*", 5), ["*aaaa", "aaaa*"])
+        self.assertEqual(split_message("short", 5), ["short"])
+
+    def test_chunks_keep_keyboard_on_last_message(self):
+        bot = FakeBot()
+        update = SimpleNamespace(callback_query=None, message=None, effective_chat=SimpleNamespace(id=7))
+        last = asyncio.run(send_chunks(update, ["*one*", "two", "three"], "keyboard", "Markdown",
+                                       SimpleNamespace(bot=bot)))
+        self.assertEqual(last, "three")
+        self.assertEqual([text for text, _ in bot.sent], ["*one*", "two", "three"])
+        self.assertEqual([kwargs["reply_markup"] for _, kwargs in bot.sent], [None, None, "keyboard"])
+
+    def test_cursor_fetches_one_slice_per_page(self):
+        items = [f"item {i}" for i in range(7)]
+        fetches = []
+        sent = []
+
+        async def source(telegram_id, language, offset, limit):
+            fetches.append((offset, limit))
+            return Page("\n".join(items[offset:offset + limit]), [], offset + limit < len(items))
+
+        async def fake_send(update, text, keyboard=None, **kwargs):
+            sent.append((text, [[button.callback_data for button in row] for row in keyboard.inline_keyboard]))
+
+        register_source("test_items", source)
+        self.addCleanup(pagination._sources.pop, "test_items")
+        update = SimpleNamespace(effective_user=SimpleNamespace(id=1))
+        context = SimpleNamespace(user_data=CopyingUserData())
+
+        async def language(telegram_id):
+            return "en_US"
+
+        async def run():
+            with mock.patch.multiple(pagination, send_message=fake_send, get_user_language=language), \
+                    mock.patch.object(pagination, "page_size", return_value=3):
+                await show_page(update, context, "test_items")
+                await show_page(update, context, "test_items", "next")
+                await show_page(update, context, "test_items", "next")
+                await show_page(update, context, "test_items", "prev")
+
+        asyncio.run(run())
+        self.assertEqual(fetches, [(0, 3), (3, 3), (6, 3), (3, 3)])
+        self.assertEqual(sent[2][0], "item 6")
+        self.assertEqual(sent[0][1][0], ["page:test_items:next"])
+        self.assertEqual(sent[2][1][0], ["page:test_items:prev"])
+        self.assertEqual(context.user_data["page_cursors"]["test_items"], {"offset": 3, "limit": 3})
+
+
+if __name__ == '__main__':
+    unittest.main()
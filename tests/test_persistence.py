@@ -0,0 +1,89 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from utils.context_manager import ContextManager
+from utils.persistence import ContextStore, SQLitePersistence
+
+
+class TestContextStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "store.sqlite3")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_context_survives_restart(self):
+        store = ContextStore(self.path)
+        manager = ContextManager()
+        manager.attach_store(store)
+        manager.set("42", "action_type", "influence")
+        manager.set("42", "district", "Stari Grad")
+        self.assertEqual(store.pending_count(), 1)
+        store.close()
+
+        # A fresh manager loads the user lazily on first access
+        store = ContextStore(self.path)
+        manager = ContextManager()
+        manager.attach_store(store)
+        self.assertEqual(manager.size(), 0)
+        self.assertEqual(manager.get("42", "district"), "Stari Grad")
+        self.assertEqual(manager.get_all("42")["action_type"], "influence")
+        store.close()
+
+    def test_clear_deletes_stored_context(self):
+        store = ContextStore(self.path)
+        manager = ContextManager()
+        manager.attach_store(store)
+        manager.set("7", "language", "ru_RU")
+        store.flush()
+        manager.clear("7")
+        store.flush()
+        self.assertIsNone(store.load("7"))
+        store.close()
+
+    def test_expired_rows_are_ignored(self):
+        store = ContextStore(self.path, max_age=-1)
+        store.mark_dirty("1", {"language": "en_US"})
+        store.flush()
+        self.assertIsNone(store.load("1"))
+        self.assertEqual(store.purge_expired(), 1)
+        store.close()
+
+
+class TestSQLitePersistence(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "ptb.sqlite3")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip(self):
+        async def write():
+            persistence = SQLitePersistence(self.path)
+            await persistence.update_user_data(42, {"resources": {"influence": 3}})
+            await persistence.update_conversation("action", (42, 42), 5)
+            await persistence.update_conversation("registration", (1, 1), 0)
+            await persistence.update_conversation("registration", (1, 1), None)
+            await persistence.flush()
+
+        async def read():
+            persistence = SQLitePersistence(self.path)
+            return (
+                await persistence.get_user_data(),
+                await persistence.get_conversations("action"),
+                await persistence.get_conversations("registration"),
+            )
+
+        asyncio.run(write())
+        user_data, action, registration = asyncio.run(read())
+        self.assertEqual(user_data, {42: {"resources": {"influence": 3}}})
+        self.assertEqual(action, {(42, 42): 5})
+        self.assertEqual(registration, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
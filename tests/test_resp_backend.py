@@ -0,0 +1,151 @@
+import asyncio
+import socketserver
+import threading
+import unittest
+
+from utils.context_manager import ContextManager, InMemoryContextBackend
+from utils.resp_backend import RespClient, RespContextBackend
+
+
+class FakeRespHandler(socketserver.StreamRequestHandler):
+    """Speaks just enough RESP for the context backend."""
+
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        count = int(line[1:-2])
+        args = []
+        for _ in range(count):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _write(self, value):
+        if value is None:
+            self.wfile.write(b"$-1\r\n")
+        elif isinstance(value, int):
+            self.wfile.write(b":%d\r\n" % value)
+        elif isinstance(value, bytes):
+            self.wfile.write(b"$%d\r\n%s\r\n" % (len(value), value))
+        elif isinstance(value, list):
+            self.wfile.write(b"*%d\r\n" % len(value))
+            for item in value:
+                self._write(item)
+        else:
+            self.wfile.write(b"+%s\r\n" % value.encode())
+
+    def handle(self):
+        server = self.server
+        while True:
+            args = self._read_command()
+            if args is None:
+                return
+            command, args = args[0].upper().decode(), args[1:]
+            with server.lock:
+                server.commands.append(command)
+                data = server.data
+                if command == "HSET":
+                    fields = data.setdefault(args[0], {})
+                    for i in range(1, len(args), 2):
+                        fields[args[i]] = args[i + 1]
+                    reply = len(args) // 2
+                elif command == "HGET":
+                    reply = data.get(args[0], {}).get(args[1])
+                elif command == "HMGET":
+                    reply = [data.get(args[0], {}).get(field) for field in args[1:]]
+                elif command == "HGETALL":
+                    reply = [item for pair in data.get(args[0], {}).items() for item in pair]
+                elif command == "HDEL":
+                    fields = data.get(args[0], {})
+                    reply = sum(fields.pop(field, None) is not None for field in args[1:])
+                elif command == "DEL":
+                    reply = int(data.pop(args[0], None) is not None)
+                elif command == "EXPIRE":
+                    reply = int(args[0] in data)
+                elif command == "SCAN":
+                    prefix = args[2].rstrip(b"*")
+                    reply = [b"0", [key for key in data if key.startswith(prefix)]]
+                else:
+                    reply = "OK"
+            self._write(reply)
+
+
+class FakeRespServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeRespHandler)
+        self.data = {}
+        self.commands = []
+        self.lock = threading.Lock()
+
+
+class TestRespContextBackend(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeRespServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        host, port = self.server.server_address
+        self.url = f"redis://{host}:{port}/0"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_workers_share_context(self):
+        worker_a = ContextManager(RespContextBackend.from_url(self.url))
+        worker_b = ContextManager(RespContextBackend.from_url(self.url))
+
+        worker_a.set_many("42", {"language": "ru_RU", "is_registered": True, "action_type": "attack"})
+        # Writes are queued until flushed, and read back locally meanwhile
+        self.assertEqual(worker_a.get("42", "language"), "ru_RU")
+        self.assertEqual(worker_a.backend.flush(), 1)
+        self.assertEqual(worker_b.get("42", "language"), "ru_RU")
+        self.assertEqual(worker_b.get_many("42", ["is_registered", "district_name"]), {"is_registered": True})
+        self.assertEqual(dict(worker_b.get_all("42")),
+                         {"language": "ru_RU", "is_registered": True, "action_type": "attack"})
+        self.assertEqual(worker_b.size(), 1)
+        # A stored None is not a missing key, in either backend
+        for backend in (worker_a.backend, InMemoryContextBackend()):
+            backend.set("43", "target_player_name", None)
+            self.assertIsNone(backend.get("43", "target_player_name", "unset"))
+            self.assertEqual(backend.get("43", "district_name", "unset"), "unset")
+
+        worker_b.clear("42")
+        worker_b.backend.flush()
+        asyncio.run(worker_a.prefetch("42"))
+        self.assertIsNone(worker_a.get("42", "language"))
+
+    def test_prefetch_serves_reads_locally(self):
+        manager = ContextManager(RespContextBackend.from_url(self.url))
+        manager.set_many("7", {"language": "en_US", "is_registered": True})
+        manager.backend.flush()
+        manager.evict("7")
+
+        self.server.commands.clear()
+        asyncio.run(manager.prefetch("7"))
+        self.assertEqual(manager.get("7", "language"), "en_US")
+        self.assertTrue(manager.get("7", "is_registered"))
+        manager.set("7", "district_name", "Center")
+        manager.delete("7", "is_registered")
+        self.assertEqual(dict(manager.get_all("7")), {"language": "en_US", "district_name": "Center"})
+        self.assertEqual(self.server.commands, ["HGETALL", "EXPIRE"])
+
+        # Writes still queued are applied over what the server has
+        manager.evict("7")
+        asyncio.run(manager.prefetch("7"))
+        self.assertEqual(manager.get("7", "district_name"), "Center")
+        self.assertEqual(manager.backend.flush(), 1)
+        self.assertEqual(self.server.commands[-3:], ["HSET", "EXPIRE", "HDEL"])
+
+    def test_reconnects_after_connection_loss(self):
+        client = RespClient.from_url(self.url)
+        client.execute("HSET", "k", "f", "v")
+        client._sock.close()
+        self.assertEqual(client.execute("HGET", "k", "f"), b"v")
+        client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
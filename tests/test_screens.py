@@ -0,0 +1,44 @@
+import unittest
+
+from bot.screens import HELP_SECTIONS, get_screen, prerender_screens, screens
+from utils import i18n_core
+from utils.i18n_core import SUPPORTED_LANGUAGES, build_catalog, compile_catalogs, install_translations
+
+
+class TestScreens(unittest.TestCase):
+    def setUp(self):
+        self._saved = {lang: dict(strings) for lang, strings in i18n_core._translations.items()}
+        self._saved_listeners = list(i18n_core._reload_listeners)
+
+    def tearDown(self):
+        i18n_core._reload_listeners[:] = self._saved_listeners
+        for lang, strings in self._saved.items():
+            i18n_core._translations[lang] = strings
+        compile_catalogs()
+        screens.render_all()
+
+    def test_static_screens_are_rendered_once(self):
+        rendered = prerender_screens()
+        self.assertEqual(rendered, len(SUPPORTED_LANGUAGES) * (len(HELP_SECTIONS) + 8))
+        for language in SUPPORTED_LANGUAGES:
+            self.assertIs(get_screen("help", language), get_screen("help", language))
+        self.assertIs(get_screen("help:rules", "xx_XX"), get_screen("help:rules", "en_US"))
+        self.assertTrue(get_screen("help:rules", "en_US").text.startswith("*Game Rules*"))
+        self.assertIsNotNone(get_screen("settings", "ru_RU").keyboard)
+
+    def test_screens_follow_translation_reload(self):
+        prerender_screens()
+        before = get_screen("main_menu", "ru_RU")
+
+        translations = {lang: dict(strings) for lang, strings in i18n_core._translations.items()}
+        translations["ru_RU"]["Main Menu"] = "Главное меню (новое)"
+        catalogs = {lang: build_catalog(lang, translations) for lang in SUPPORTED_LANGUAGES}
+        install_translations(translations, {}, catalogs)
+
+        after = get_screen("main_menu", "ru_RU")
+        self.assertIsNot(after, before)
+        self.assertEqual(after.text, "Главное меню (новое)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import asyncio
+import json
+import os
+import unittest
+
+from bot.sharding import READY, Supervisor, pick_worker, shard_path, update_key
+
+
+def counting_worker(index, shard):
+    """Reports ready, then exits with the number of updates it was sent."""
+    shard.sendall(READY)
+    received = b""
+    while True:
+        chunk = shard.recv(65536)
+        if not chunk:
+            break
+        received += chunk
+    os._exit(received.count(b"\n"))
+
+
+def message(update_id, user_id):
+    return {
+        "update_id": update_id,
+        "message": {"message_id": 1, "date": 0, "chat": {"id": -5, "type": "group"},
+                    "from": {"id": user_id, "is_bot": False, "first_name": "Test"}, "text": "hi"},
+    }
+
+
+class TestSharding(unittest.TestCase):
+    def test_update_key(self):
+        self.assertEqual(update_key(message(1, 42)), 42)
+        self.assertEqual(update_key({"update_id": 3, "poll_answer": {"user": {"id": 7}}}), 7)
+        self.assertEqual(update_key({"update_id": 3, "channel_post": {"chat": {"id": -100}}}), -100)
+        self.assertEqual(update_key({"update_id": 9}), 9)
+        self.assertEqual(shard_path("data/meta_game.sqlite3", 2), "data/meta_game.worker2.sqlite3")
+
+    def test_only_a_down_workers_users_move(self):
+        keys = range(5000)
+        everyone = [pick_worker(key, [0, 1, 2, 3]) for key in keys]
+        without_two = [pick_worker(key, [0, 1, 3]) for key in keys]
+
+        for before, after in zip(everyone, without_two):
+            if before != 2:
+                self.assertEqual(before, after)
+        # Shards are roughly even
+        for index in range(4):
+            self.assertGreater(everyone.count(index), 1000)
+
+    def test_supervisor_routes_to_worker_processes(self):
+        async def run():
+            supervisor = Supervisor(2, counting_worker)
+            await supervisor.start()
+            while len(supervisor.live) < 2:
+                await asyncio.sleep(0.05)
+            for update_id in range(40):
+                await supervisor.route(message(update_id, update_id % 10))
+            await supervisor.stop()
+            return supervisor
+
+        supervisor = asyncio.run(run())
+        expected = [0, 0]
+        for user_id in range(10):
+            expected[pick_worker(user_id, [0, 1])] += 4
+        self.assertEqual(supervisor.routed, expected)
+        self.assertEqual([worker.process.exitcode for worker in supervisor._workers], expected)
+
+
+    def test_down_workers_updates_wait_for_it(self):
+        class FakeWriter:
+            def __init__(self):
+                self.lines = []
+
+            def write(self, line):
+                self.lines.append(json.loads(line)["update_id"])
+
+            async def drain(self):
+                pass
+
+        async def run():
+            supervisor = Supervisor(2, counting_worker)
+            writers = [FakeWriter(), FakeWriter()]
+            for worker, writer in zip(supervisor._workers, writers):
+                worker.writer = writer
+                worker.sender = asyncio.create_task(supervisor._send(worker))
+            supervisor._set_ready(supervisor._workers[1], True)
+
+            users = {index: next(user for user in range(100) if pick_worker(user, [0, 1]) == index)
+                     for index in (0, 1)}
+            for update_id in range(6):
+                await supervisor.route(message(update_id, users[update_id % 2]))
+            await asyncio.sleep(0.01)
+            # Worker 0 is down: its users are not moved to worker 1, and worker 1 is not held up
+            before = (list(writers[0].lines), list(writers[1].lines))
+
+            supervisor._set_ready(supervisor._workers[0], True)
+            await asyncio.wait_for(supervisor._workers[0].queue.join(), 1)
+            for worker in supervisor._workers:
+                worker.sender.cancel()
+            return before, writers[0].lines
+
+        before, delivered = asyncio.run(run())
+        self.assertEqual(before, ([], [1, 3, 5]))
+        self.assertEqual(delivered, [0, 2, 4])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import random
+import unittest
+
+from utils import i18n_core
+from utils.i18n_core import _
+from utils.space_saving import SpaceSaving
+
+
+class TestSpaceSaving(unittest.TestCase):
+    def test_heavy_hitters_survive_a_long_tail(self):
+        sketch = SpaceSaving(capacity=200)
+        # Anything seen more than total / capacity times is guaranteed to be kept
+        stream = [f"hot {i}" for i in range(10) for _ in range(200)]
+        stream += [f"tail {i}" for i in range(20_000)]
+        random.Random(7).shuffle(stream)
+        for item in stream:
+            sketch.add(item)
+
+        self.assertEqual(len(sketch), 200)
+        self.assertEqual(sketch.total, len(stream))
+        top = sketch.top(10)
+        self.assertEqual({item for item, _count, _error in top}, {f"hot {i}" for i in range(10)})
+        for _item, count, error in top:
+            # Counts are upper bounds, off by at most the recorded error
+            self.assertGreaterEqual(count, 200)
+            self.assertLessEqual(count - error, 200)
+
+    def test_discard_and_reinsert(self):
+        sketch = SpaceSaving(capacity=2)
+        self.assertTrue(sketch.add("a"))
+        self.assertFalse(sketch.add("a"))
+        sketch.add("b")
+        sketch.discard("a")
+        self.assertNotIn("a", sketch)
+        sketch.add("c")
+        sketch.add("d")
+        self.assertEqual(len(sketch), 2)
+        self.assertEqual(sketch.count("d"), 2)
+
+    def test_missing_translations_are_bounded(self):
+        saved = i18n_core._missing_translation_log
+        i18n_core._missing_translation_log = SpaceSaving(100)
+        try:
+            for i in range(5_000):
+                _(f"News item {i}", "ru_RU")
+                _("Frequently missing", "ru_RU")
+            self.assertEqual(len(i18n_core._missing_translation_log), 100)
+            (language, text), count, _error = i18n_core._missing_translation_log.top(1)[0]
+            self.assertEqual((language, text, count), ("ru_RU", "Frequently missing", 5_000))
+        finally:
+            i18n_core._missing_translation_log = saved
+
+
+if __name__ == '__main__':
+    unittest.main()
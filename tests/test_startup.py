@@ -0,0 +1,69 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from utils.startup import StartupGraph
+
+
+class TestStartupGraph(unittest.TestCase):
+    def test_independent_tasks_overlap_and_dependencies_wait(self):
+        order = []
+
+        def task(name, delay):
+            async def run():
+                order.append(f"start:{name}")
+                await asyncio.sleep(delay)
+                order.append(f"end:{name}")
+                return name
+            return run
+
+        def blocking():
+            time.sleep(0.05)
+            return threading.current_thread() is threading.main_thread()
+
+        graph = StartupGraph()
+        graph.add("database", task("database", 0.05))
+        graph.add("translations", task("translations", 0.05))
+        graph.add("caches", task("caches", 0), needs=["translations"])
+        graph.add("handlers", blocking, blocking=True)
+        graph.add("application", task("application", 0), needs=["handlers", "database"])
+
+        start = time.perf_counter()
+        results = asyncio.run(graph.run())
+        elapsed = time.perf_counter() - start
+
+        # Three 50 ms steps side by side, not one after another
+        self.assertLess(elapsed, 0.12)
+        self.assertFalse(results["handlers"])
+        self.assertLess(order.index("end:translations"), order.index("start:caches"))
+        self.assertLess(order.index("end:database"), order.index("start:application"))
+        self.assertIn("application", graph.report())
+
+    def test_invalid_graphs_and_failures(self):
+        graph = StartupGraph()
+        graph.add("a", asyncio.sleep, needs=["b"])
+        graph.add("b", asyncio.sleep, needs=["a"])
+        with self.assertRaises(ValueError):
+            asyncio.run(graph.run())
+        with self.assertRaises(ValueError):
+            graph.add("a", asyncio.sleep)
+
+        async def fail():
+            raise RuntimeError("no handlers")
+
+        ran = []
+
+        async def after():
+            ran.append(True)
+
+        graph = StartupGraph()
+        graph.add("handlers", fail)
+        graph.add("application", after, needs=["handlers"])
+        with self.assertRaises(RuntimeError):
+            asyncio.run(graph.run())
+        self.assertEqual(ran, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import time
+import unittest
+
+from utils import i18n_core
+from utils.formatting import format_district_info, format_income_info
+from utils.i18n_core import SUPPORTED_LANGUAGES, build_catalog, compile_catalogs, install_translations, render
+from utils.templates import MessageTemplate, TemplateSyntaxError, escape_markdown
+
+logger = logging.getLogger(__name__)
+
+
+class TestMessageTemplates(unittest.TestCase):
+    def setUp(self):
+        self._saved = {lang: dict(strings) for lang, strings in i18n_core._translations.items()}
+        i18n_core._translations["ru_RU"].update({
+            "Hello {name}": "Привет, {name}",
+            "*Score:* {score:.1f}": "*Счёт:* {score:.1f}",
+            "apple": "яблоко",
+        })
+        compile_catalogs()
+
+    def tearDown(self):
+        for lang, strings in self._saved.items():
+            i18n_core._translations[lang] = strings
+        compile_catalogs()
+
+    def test_trans_blocks_and_escaping(self):
+        template = MessageTemplate(
+            "{% trans %}Hello {name}{% endtrans %}\n"
+            "*{{ name }}* `{{ code }}` {{ note }} {{ note|raw }}\n"
+            "{% trans %}*Score:* {score:.1f}{% endtrans %}"
+        )
+        context = {"name": "Marko_M*", "code": "a`b", "note": "[x]_y", "score": 2.25}
+        self.assertEqual(
+            template.render("ru_RU", **context),
+            "Привет, Marko\\_M\\*\n*Marko_M* `ab` \\[x]\\_y [x]_y\n*Счёт:* 2.2"
+        )
+        self.assertEqual(template.render("xx_XX", **context), template.render("en_US", **context))
+        self.assertEqual(escape_markdown(42), "42")
+
+    def test_loops_conditionals_and_filters(self):
+        template = MessageTemplate(
+            "{% for item in items %}"
+            "{% if item.count > 1 %}{{ item.count }} {{ item.name|t }}"
+            "{% elif item.count %}{% trans fruit=item.name|t %}one {fruit}{% endtrans %}"
+            "{% else %}-{% endif %}\n"
+            "{% endfor %}"
+            "{{ tags|join }}"
+        )
+        items = [{"name": "apple", "count": 3}, {"name": "apple", "count": 1}, {"name": "pear", "count": 0}]
+        self.assertEqual(
+            template.render("ru_RU", items=items, tags=["a", "b_c"]),
+            "3 яблоко\none яблоко\n-\na, b\\_c"
+        )
+
+    def test_matches_plain_render(self):
+        template = MessageTemplate("{% trans %}Hello {name}{% endtrans %}")
+        self.assertEqual(template.render("ru_RU", name="Ана"), render("Hello {name}", "ru_RU", name="Ана"))
+
+    def test_invalid_templates(self):
+        for source in ("{% if x %}", "{% endfor %}", "{% trans %}x", "{{ _private }}", "{{ a.__class__ }}",
+                       "{% trans %}{a[0]}{% endtrans %}", "{% while x %}"):
+            with self.assertRaises(TemplateSyntaxError, msg=source):
+                MessageTemplate(source)
+
+    def test_recompiled_after_reload(self):
+        template = MessageTemplate("{% trans %}Hello {name}{% endtrans %}")
+        self.assertEqual(template.render("ru_RU", name="A"), "Привет, A")
+
+        translations = {lang: dict(strings) for lang, strings in i18n_core._translations.items()}
+        translations["ru_RU"]["Hello {name}"] = "Здравствуйте, {name}"
+        catalogs = {lang: build_catalog(lang, translations) for lang in SUPPORTED_LANGUAGES}
+        install_translations(translations, {}, catalogs)
+        self.assertEqual(template.render("ru_RU", name="A"), "Здравствуйте, A")
+
+    def test_formatter_throughput(self):
+        district = {
+            "name": "Liman", "description": "University district", "player_control": 55,
+            "resources": {"influence": 3, "money": 4, "information": 2, "force": 1},
+            "politicians": [{"name": f"Pol {i}", "ideological_leaning": i, "influence_in_district": i,
+                             "friendliness": 20 * i} for i in range(4)],
+        }
+        income = {
+            "district_income": [{"district": f"D{i}", "control_points": 20 * i, "control_percentage": "60%",
+                                 "income": {"influence": i, "money": 2}} for i in range(5)],
+            "totals": {"influence": 10, "money": 10},
+            "next_cycle": {"type": "morning", "date": "1999-09-01"},
+        }
+
+        async def run(formatter, data, n=2000):
+            start = time.perf_counter()
+            for _ in range(n):
+                text = await formatter(data, "ru_RU")
+            return n / (time.perf_counter() - start), text
+
+        for formatter, data in ((format_district_info, district), (format_income_info, income)):
+            rate, text = asyncio.run(run(formatter, data))
+            logger.info(f"{formatter.__name__}: {rate:.0f} renders/s")
+            self.assertNotIn("Error formatting", text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from utils import i18n, i18n_core
+from utils.i18n import sync_translations_from_db, _
+from utils.i18n_core import render
+from utils.i18n_core import compile_catalogs
+
+
+class FakeQuery:
+    def __init__(self, table):
+        self.table = table
+        self.since = None
+
+    def select(self, columns):
+        return self
+
+    def gte(self, column, value):
+        self.since = datetime.fromisoformat(value)
+        return self
+
+    def order(self, column):
+        return self
+
+    def execute(self):
+        self.table.queries.append(self.since)
+        rows = [row for row in self.table.rows
+                if self.since is None or datetime.fromisoformat(row["updated_at"]) >= self.since]
+        return type("Response", (), {"data": sorted(rows, key=lambda row: row["updated_at"])})()
+
+
+class FakeTranslationsTable:
+    def __init__(self):
+        self.rows = []
+        self.queries = []
+        self.clock = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def upsert(self, key, en, ru):
+        self.clock += timedelta(minutes=5)
+        self.rows = [row for row in self.rows if row["translation_key"] != key]
+        # Columns come back lower-cased, as PostgreSQL folds unquoted names
+        self.rows.append({"translation_key": key, "en_us": en, "ru_ru": ru, "updated_at": self.clock.isoformat()})
+
+    def table(self, name):
+        return FakeQuery(self)
+
+
+class TestTranslationSync(unittest.TestCase):
+    def setUp(self):
+        self._saved = {lang: dict(strings) for lang, strings in i18n_core._translations.items()}
+        self._saved_supabase = i18n._get_supabase_func
+        self.db = FakeTranslationsTable()
+        i18n._get_supabase_func = lambda: self.db
+        i18n._sync_watermark = None
+
+    def tearDown(self):
+        i18n._get_supabase_func = self._saved_supabase
+        i18n._sync_watermark = None
+        for lang, strings in self._saved.items():
+            i18n_core._translations[lang] = strings
+        compile_catalogs()
+
+    def test_only_changed_rows_are_pulled(self):
+        for i in range(100):
+            self.db.upsert(f"key {i}", f"en {i}", f"ru {i}")
+        self.assertEqual(asyncio.run(sync_translations_from_db()), 100)
+        self.assertEqual(_("key 7", "ru_RU"), "ru 7")
+        self.assertIsNone(self.db.queries[0])
+
+        catalog = i18n_core._catalogs["ru_RU"]
+        self.db.upsert("Greeting {name}", "Hello {name}", "Привет, {name}")
+        self.db.upsert("key 7", "en 7", "ru 7 (edited)")
+        self.assertEqual(asyncio.run(sync_translations_from_db()), 2)
+
+        # Updated in place: same catalog object, only the edits were fetched
+        self.assertIs(i18n_core._catalogs["ru_RU"], catalog)
+        self.assertEqual(_("key 7", "ru_RU"), "ru 7 (edited)")
+        self.assertEqual(render("Greeting {name}", "ru_RU", name="Ана"), "Привет, Ана")
+        self.assertIsNotNone(self.db.queries[1])
+        self.assertLess(
+            sum(1 for row in self.db.rows if datetime.fromisoformat(row["updated_at"]) >= self.db.queries[1]), 5
+        )
+
+        # Nothing new: the overlap rows are re-read but change nothing
+        self.assertEqual(asyncio.run(sync_translations_from_db()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
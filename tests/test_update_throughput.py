@@ -0,0 +1,67 @@
+import asyncio
+import time
+import unittest
+
+from telegram import Update
+
+from utils.user_locks import PerUserUpdateProcessor, UserLockRegistry
+
+ROUND_TRIP = 0.005  # simulated database round trip per update
+
+
+def make_update(update_id, user_id):
+    return Update.de_json({
+        "update_id": update_id,
+        "callback_query": {
+            "id": str(update_id),
+            "chat_instance": "1",
+            "from": {"id": user_id, "is_bot": False, "first_name": "Test"},
+            "data": "status",
+        },
+    }, None)
+
+
+async def process_all(processor, updates, handled):
+    async def handle(update):
+        await asyncio.sleep(ROUND_TRIP)
+        handled.append((update.effective_user.id, update.update_id))
+
+    # Like the application: one task per update, all started at once
+    start = time.perf_counter()
+    await asyncio.gather(*(processor.process_update(update, handle(update)) for update in updates))
+    return time.perf_counter() - start
+
+
+class TestUpdateThroughput(unittest.TestCase):
+    def test_throughput_scales_with_concurrency(self):
+        # Updates arrive interleaved across users, as around a deadline
+        updates = [make_update(i, i % 32) for i in range(128)]
+        elapsed = {}
+        for concurrency in (1, 4, 16):
+            handled = []
+            processor = PerUserUpdateProcessor(concurrency, registry=UserLockRegistry())
+            elapsed[concurrency] = asyncio.run(process_all(processor, updates, handled))
+
+            self.assertEqual(len(handled), len(updates))
+            for user_id in range(32):
+                ids = [update_id for user, update_id in handled if user == user_id]
+                self.assertEqual(ids, sorted(ids))
+
+        self.assertLess(elapsed[4], elapsed[1] / 2.5)
+        self.assertLess(elapsed[16], elapsed[4] / 2.5)
+
+    def test_flooding_user_does_not_take_every_slot(self):
+        # One user double-taps 60 times, then eight others send one update each
+        updates = [make_update(i, 0) for i in range(60)] + [make_update(100 + i, i + 1) for i in range(8)]
+        handled = []
+        processor = PerUserUpdateProcessor(4, registry=UserLockRegistry())
+        asyncio.run(process_all(processor, updates, handled))
+
+        others = [position for position, (user_id, _) in enumerate(handled) if user_id != 0]
+        self.assertEqual(len(others), 8)
+        # Everyone else is done long before the flood is worked off
+        self.assertLess(max(others), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from utils.user_locks import PerUserUpdateProcessor, UserLockRegistry
+
+
+class TestPerUserUpdateProcessor(unittest.TestCase):
+    def test_same_user_serialized_other_users_parallel(self):
+        async def run():
+            registry = UserLockRegistry()
+            processor = PerUserUpdateProcessor(8, registry=registry)
+            events = []
+
+            async def handler(name, delay):
+                events.append(f"start:{name}")
+                await asyncio.sleep(delay)
+                events.append(f"end:{name}")
+
+            # Duck-typed updates are treated as user-less; use the registry directly
+            async def for_user(user_id, name, delay):
+                async with registry.hold(user_id):
+                    await handler(name, delay)
+
+            await asyncio.gather(
+                for_user("1", "a1", 0.02),
+                for_user("1", "a2", 0),
+                for_user("2", "b1", 0.01),
+            )
+            self.assertLess(events.index("end:a1"), events.index("start:a2"))
+            self.assertLess(events.index("start:b1"), events.index("end:a1"))
+            # Idle entries are evicted
+            self.assertEqual(registry.size(), 0)
+
+            await processor.process_update(SimpleNamespace(), handler("anon", 0))
+            self.assertIn("end:anon", events)
+
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from bot import keyboards, warmup
+from bot.callback_data import DISTRICT, encode
+from bot.sharding import pick_worker
+from db import get_player_language, player_exists, register_player
+from db import player_directory
+from db.player_directory import PlayerDirectory
+from utils import i18n
+from utils.context_manager import context_manager
+
+
+class FakeQuery:
+    """Just enough of a postgrest query to page through rows."""
+
+    def __init__(self, rows, requests):
+        self.rows = rows
+        self.requests = requests
+        self.bounds = (0, len(rows) - 1)
+
+    def select(self, columns):
+        return self
+
+    def order(self, column):
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+
+    def execute(self):
+        self.requests.append(self.bounds)
+        start, end = self.bounds
+        return SimpleNamespace(data=self.rows[start:end + 1])
+
+
+class TestWarmup(unittest.TestCase):
+    def test_directory_loads_in_pages(self):
+        rows = [{"telegram_id": str(i), "language": "ru_RU" if i % 2 else "en_US"} for i in range(25)]
+        requests = []
+        client = SimpleNamespace(table=lambda name: FakeQuery(rows, requests))
+        directory = PlayerDirectory()
+        with mock.patch.object(player_directory, "get_supabase", return_value=client):
+            self.assertEqual(asyncio.run(directory.load(page_size=10)), (25, 3))
+
+        self.assertEqual(requests, [(0, 9), (10, 19), (20, 29)])
+        self.assertEqual(len(directory), 25)
+        self.assertEqual(directory.language("3"), "ru_RU")
+        self.assertIsNone(directory.language("99"))
+        # Language codes are shared, not one string per player
+        self.assertIs(directory.language("1"), directory.language("3"))
+
+    def test_worker_loads_only_its_shard(self):
+        rows = [{"telegram_id": str(i), "language": "en_US"} for i in range(40)]
+        client = SimpleNamespace(table=lambda name: FakeQuery(rows, []))
+        with mock.patch.object(player_directory, "get_supabase", return_value=client), \
+                mock.patch.object(warmup, "players", PlayerDirectory()) as directory:
+            summary = asyncio.run(warmup._players(page_size=100, shard=(1, 3)))
+
+        owned = [str(i) for i in range(40) if pick_worker(i, range(3)) == 1]
+        self.assertTrue(owned)
+        self.assertEqual(sorted(directory._languages, key=int), owned)
+        self.assertEqual(summary, f"{len(owned)} of 40 players in 1 pages")
+
+    def test_known_players_skip_the_database(self):
+        directory = PlayerDirectory()
+        directory.add("555", "ru_RU")
+
+        def no_database():
+            raise AssertionError("database queried")
+
+        async def run():
+            with mock.patch("db.players", directory), mock.patch("db.get_supabase", no_database):
+                return await player_exists("555"), await get_player_language("555")
+
+        self.assertEqual(asyncio.run(run()), (True, "ru_RU"))
+
+    def test_directory_follows_language_changes_and_failed_registrations(self):
+        directory = PlayerDirectory()
+        directory.add("556", "ru_RU")
+        client = mock.MagicMock()
+        for telegram_id in ("556", "777"):
+            self.addCleanup(context_manager.clear, telegram_id)
+
+        async def registered(telegram_id):
+            return True
+
+        async def change_language():
+            with mock.patch("db.player_directory.players", directory), \
+                    mock.patch.multiple(i18n, _get_supabase_func=lambda: client, _player_exists_func=registered):
+                await i18n.set_user_language("556", "en_US")
+
+        asyncio.run(change_language())
+        self.assertEqual(directory.language("556"), "en_US")
+
+        def failing_insert():
+            raise ConnectionError("database down")
+
+        client.table.return_value.insert.return_value.execute = failing_insert
+        with mock.patch("db.players", directory), mock.patch("db.get_supabase", lambda: client):
+            asyncio.run(register_player("777", "Player", 0))
+        self.assertNotIn("777", directory)
+
+    def test_warm_up_reports_each_part(self):
+        async def districts():
+            return [{"name": "Warmup District"}]
+
+        async def failing_politicians():
+            raise RuntimeError("database down")
+
+        async def players(page_size, shard):
+            return "3 players in 1 pages"
+
+        async def no_map():
+            return "map and cycle for 0 languages"
+
+        self.addCleanup(keyboards._districts_keyboards.clear)
+        self.addCleanup(keyboards.invalidate_districts)
+        with mock.patch.multiple(warmup, get_districts=districts, _players=players, _map=no_map), \
+                mock.patch.object(warmup.POLITICIAN, "_load_names", failing_politicians):
+            summary = asyncio.run(warmup.warm_up())
+
+        self.assertEqual(summary["players"], "3 players in 1 pages")
+        self.assertIsNone(summary["politicians"])
+        self.assertTrue(summary["districts"].startswith("1 districts"))
+        # District buttons decode without a database lookup
+        data = encode("district", "Warmup District")
+        self.assertEqual(asyncio.run(DISTRICT.decode(data[3:])), "Warmup District")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from bot.webhook import SECRET_TOKEN_HEADER, WebhookServer
+from utils.user_locks import PerUserUpdateProcessor
+
+
+class FakeApplication:
+    """Just what the webhook server uses of a PTB application."""
+
+    def __init__(self):
+        self.bot = None
+        self.running = True
+        self.update_processor = PerUserUpdateProcessor(4)
+        self.processed = []
+        self.release = asyncio.Event()
+
+    async def process_update(self, update):
+        await self.release.wait()
+        self.processed.append(update.update_id)
+
+
+def synthetic_update(update_id, user_id=1):
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": user_id, "type": "private"},
+            "from": {"id": user_id, "is_bot": False, "first_name": "Test"},
+            "text": "/status",
+        },
+    }
+
+
+class TestWebhook(unittest.TestCase):
+    def test_post_updates_with_backpressure(self):
+        async def run():
+            application = FakeApplication()
+            server = WebhookServer(application, secret_token="s3cret", queue_size=2, workers=1)
+            server.accepting = True
+            client = TestClient(TestServer(server.build_app()))
+            await client.start_server()
+            headers = {SECRET_TOKEN_HEADER: "s3cret"}
+            try:
+                self.assertEqual((await client.post("/telegram", json=synthetic_update(1))).status, 403)
+                self.assertEqual((await client.post("/telegram", data="{", headers=headers)).status, 400)
+                self.assertEqual((await client.get("/healthz")).status, 200)
+
+                worker = asyncio.create_task(server._worker())
+                # The worker holds the first update; two more fill the queue, the fourth is turned away
+                statuses = []
+                for update_id in range(1, 5):
+                    response = await client.post("/telegram", json=synthetic_update(update_id), headers=headers)
+                    statuses.append(response.status)
+                    await asyncio.sleep(0)
+                self.assertEqual(statuses, [200, 200, 200, 429])
+                self.assertEqual((await client.get("/readyz")).status, 503)
+
+                application.release.set()
+                await asyncio.wait_for(server.queue.join(), 1)
+                worker.cancel()
+                self.assertEqual(application.processed, [1, 2, 3])
+                ready = await client.get("/readyz")
+                self.assertEqual(ready.status, 200)
+                self.assertEqual((await ready.json())["rejected"], 1)
+            finally:
+                await client.close()
+
+        asyncio.run(run())
+
+
+    def test_secret_generated_only_when_registering_the_webhook(self):
+        class FakeBot:
+            def __init__(self):
+                self.registered = []
+
+            async def set_webhook(self, url, **kwargs):
+                self.registered.append((url, kwargs["secret_token"]))
+
+        async def process(data):
+            pass
+
+        async def start(webhook_url):
+            bot = FakeBot()
+            server = WebhookServer.from_config(None, {"listen": "127.0.0.1", "port": 0, "workers": 1},
+                                               bot=bot, process=process)
+            await server.start(webhook_url)
+            await server.stop(drain_timeout=0)
+            return server, bot
+
+        # Registered elsewhere: nothing to compare against unless TELEGRAM_WEBHOOK_SECRET is set
+        server, bot = asyncio.run(start(None))
+        self.assertIsNone(server.secret_token)
+        self.assertEqual(bot.registered, [])
+
+        server, bot = asyncio.run(start("https://example.com"))
+        self.assertTrue(server.secret_token)
+        self.assertEqual(bot.registered, [("https://example.com/telegram", server.secret_token)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -36,7 +36,57 @@ DEFAULT_CONFIG = {
         "rate_limit_requests_per_minute": 15,
         "rate_limit_warning_threshold": 3,
         "max_message_length": 4000,
-        "web_map_url": "https://your-map-url.com"
+        "web_map_url": "https://your-map-url.com",
+        "max_concurrent_updates": 64,
+        "max_pending_updates": 1024,
+        "page_size": 5
+    },
+    "context": {
+        "backend": "memory",
+        "redis_url": "redis://localhost:6379/0",
+        "key_prefix": "meta_game:ctx:",
+        "near_cache_ttl_seconds": 5.0,
+        "flush_interval_seconds": 0.1,
+        "max_contexts": 10000
+    },
+    "persistence": {
+        "enabled": True,
+        "path": "data/meta_game.sqlite3",
+        "flush_interval_seconds": 5,
+        "ptb_update_interval_seconds": 60
+    },
+    "i18n": {
+        "watch_files": False,
+        "watch_interval_seconds": 5,
+        "missing_flush_interval_seconds": 300,
+        "db_sync_interval_seconds": 60
+    },
+    "workers": {
+        "count": 0,
+        "restart_delay_seconds": 1,
+        "max_restart_delay_seconds": 30,
+        "queue_size": 10000
+    },
+    "warmup": {
+        "enabled": True,
+        "player_page_size": 1000
+    },
+    "handoff": {
+        "enabled": True,
+        "path": "data/handoff.json",
+        "max_age_seconds": 300
+    },
+    "webhook": {
+        "enabled": False,
+        "url": "",
+        "path": "/telegram",
+        "listen": "0.0.0.0",
+        "port": 8443,
+        "secret_token": "",
+        "queue_size": 1000,
+        "workers": None,
+        "retry_after_seconds": 1,
+        "max_body_bytes": 1048576
     }
 }
 
@@ -7,80 +7,314 @@ Unified context management for the Meta Game bot.
 
 import logging
 import time
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
+from typing import Dict, Any, Iterable, Iterator, Optional
 
-from telegram.ext import ContextTypes
+from telegram.ext import CallbackContext, ContextTypes
+
+from utils.handoff import register_state
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
 # Timeout for user context (30 minutes)
 USER_CONTEXT_TIMEOUT = 1800  # seconds
-MAX_CONTEXTS = 1000
+# Least recently used contexts beyond this are evicted from memory
+MAX_CONTEXTS = 10000
+
+# Keys read on nearly every update get their own slot
+HOT_KEYS = ("language", "is_registered", "player_data")
+
+# Keys written by the conversation wizards in bot/states.py
+DRAFT_KEYS = frozenset({
+    "action_type", "is_quick_action", "district_name", "target_player_name",
+    "target_politician_name", "resource_type", "resource_amount", "physical_presence",
+    "from_resource", "to_resource", "convert_amount",
+    "collective_action_type", "collective_district_name", "collective_target_player_name",
+    "collective_resource_type", "collective_resource_amount", "collective_physical_presence",
+    "join_action_id", "join_action_info", "join_resource_type", "join_resource_amount",
+    "join_physical_presence", "player_name",
+})
+
+# Marks an unset hot slot, so a stored None is still a real value
+_UNSET = object()
+
+
+class UserContext:
+    """Compact per-user context record with typed slots for the hot keys."""
+
+    __slots__ = ("language", "is_registered", "player_data", "draft", "extra", "timestamp")
+
+    def __init__(self, timestamp: Optional[float] = None):
+        self.language = _UNSET
+        self.is_registered = _UNSET
+        self.player_data = _UNSET
+        # Wizard draft and overflow dicts are only allocated when used
+        self.draft: Optional[Dict[str, Any]] = None
+        self.extra: Optional[Dict[str, Any]] = None
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    @classmethod
+    def from_dict(cls, data: Optional[Mapping]) -> "UserContext":
+        """Build a context record from a plain mapping."""
+        ctx = cls()
+        for key, value in (data or {}).items():
+            ctx.set(key, value)
+        return ctx
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value by key with optional default."""
+        if key in HOT_KEYS:
+            value = getattr(self, key)
+            return default if value is _UNSET else value
+        container = self.draft if key in DRAFT_KEYS else self.extra
+        if container is None:
+            return default
+        return container.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Set a value by key."""
+        if key in HOT_KEYS:
+            setattr(self, key, value)
+        elif key in DRAFT_KEYS:
+            if self.draft is None:
+                self.draft = {}
+            self.draft[key] = value
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
 
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        if key in HOT_KEYS:
+            setattr(self, key, _UNSET)
+            return
+        container = self.draft if key in DRAFT_KEYS else self.extra
+        if container is not None:
+            container.pop(key, None)
 
-class ContextManager:
-    """Unified manager for user context data across the application."""
+    def clear_draft(self) -> None:
+        """Drop any in-progress wizard state."""
+        self.draft = None
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _UNSET) is not _UNSET
+
+    def __iter__(self) -> Iterator[str]:
+        for key in HOT_KEYS:
+            if getattr(self, key) is not _UNSET:
+                yield key
+        if self.draft:
+            yield from self.draft
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        count = sum(1 for key in HOT_KEYS if getattr(self, key) is not _UNSET)
+        return count + len(self.draft or ()) + len(self.extra or ())
+
+    def view(self) -> "UserContextView":
+        """Get a read-only mapping view of this context."""
+        return UserContextView(self)
+
+
+class UserContextView(Mapping):
+    """Read-only mapping over a UserContext; reflects later changes without copying."""
+
+    __slots__ = ("_ctx",)
+
+    def __init__(self, ctx: UserContext):
+        self._ctx = ctx
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._ctx.get(key, _UNSET)
+        if value is _UNSET:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._ctx.get(key, default)
 
-    def __init__(self):
-        # Internal context storage
-        self._storage: Dict[str, Dict[str, Any]] = {}
+    def __contains__(self, key: object) -> bool:
+        return key in self._ctx
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ctx)
+
+    def __len__(self) -> int:
+        return len(self._ctx)
+
+    def __repr__(self) -> str:
+        return f"UserContextView({dict(self)!r})"
+
+
+_EMPTY_VIEW = UserContextView(UserContext(timestamp=0))
+
+
+class ContextBackend:
+    """Interface for where user contexts actually live."""
 
     def get(self, user_id: str, key: str, default: Any = None) -> Any:
-        """Get value from context by key with optional default."""
-        if user_id not in self._storage:
-            return default
+        raise NotImplementedError
 
-        self._refresh_timestamp(user_id)
-        return self._storage[user_id].get('data', {}).get(key, default)
+    def get_many(self, user_id: str, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get several keys at once; missing keys are left out of the result."""
+        raise NotImplementedError
 
     def set(self, user_id: str, key: str, value: Any) -> None:
-        """Set value in context by key."""
-        if user_id not in self._storage:
-            self._storage[user_id] = {
-                'data': {},
-                'timestamp': time.time()
-            }
+        raise NotImplementedError
+
+    def set_many(self, user_id: str, values: Mapping) -> None:
+        raise NotImplementedError
+
+    def delete(self, user_id: str, key: str) -> None:
+        raise NotImplementedError
+
+    def get_all(self, user_id: str) -> Mapping:
+        raise NotImplementedError
+
+    def set_all(self, user_id: str, data: Mapping) -> None:
+        raise NotImplementedError
+
+    def clear(self, user_id: str) -> None:
+        raise NotImplementedError
+
+    def evict(self, user_id: str) -> None:
+        """Drop any locally held copy of a user's context."""
+
+    async def prefetch(self, user_id: str) -> None:
+        """Warm any local cache for a user whose update is about to be handled."""
+
+    def cleanup_expired(self) -> int:
+        return 0
+
+    def size(self) -> int:
+        raise NotImplementedError
+
+    def check_cleanup_needed(self) -> bool:
+        return False
+
+    def snapshot(self) -> Optional[Dict[str, Any]]:
+        """Contexts held by this process, for the handoff snapshot; None if they outlive it anyway."""
+        return None
+
+    def restore(self, state: Mapping) -> None:
+        """Take over contexts from a snapshot of the previous process."""
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class InMemoryContextBackend(ContextBackend):
+    """In-process LRU-bounded backend, optionally backed by a disk store."""
+
+    def __init__(self, max_contexts: int = MAX_CONTEXTS):
+        # Internal context storage, least recently used first
+        self._storage: "OrderedDict[str, UserContext]" = OrderedDict()
+        self.max_contexts = max_contexts
+        # Optional disk-backed store (see utils.persistence.ContextStore)
+        self._store = None
+
+    def attach_store(self, store) -> None:
+        """Attach a persistent store; contexts are then loaded lazily from it."""
+        self._store = store
+
+    def _load(self, user_id: str) -> Optional[UserContext]:
+        """Get a user's context, loading it from the store on first access."""
+        ctx = self._storage.get(user_id)
+        if ctx is not None:
+            self._storage.move_to_end(user_id)
+            return ctx
+        if self._store is None:
+            return None
+
+        # Cache misses too, so we don't hit the disk on every update
+        return self._insert(user_id, UserContext.from_dict(self._store.load(user_id)))
+
+    def _insert(self, user_id: str, ctx: UserContext) -> UserContext:
+        """Add a context, evicting the least recently used ones beyond the limit."""
+        self._storage[user_id] = ctx
+        self._storage.move_to_end(user_id)
+        while len(self._storage) > self.max_contexts:
+            # Anything not yet flushed stays referenced by the store's write buffer
+            self._storage.popitem(last=False)
+        return ctx
+
+    def _ensure(self, user_id: str) -> UserContext:
+        """Get a user's context, creating an empty one if needed."""
+        ctx = self._load(user_id)
+        if ctx is None:
+            ctx = self._insert(user_id, UserContext())
         else:
-            self._refresh_timestamp(user_id)
+            ctx.timestamp = time.time()
+        return ctx
+
+    def _mark_dirty(self, user_id: str, ctx: UserContext) -> None:
+        """Queue a user's context for the next store flush."""
+        if self._store is not None:
+            self._store.mark_dirty(user_id, ctx.view())
+
+    def get(self, user_id: str, key: str, default: Any = None) -> Any:
+        ctx = self._load(user_id)
+        if ctx is None:
+            return default
 
-        self._storage[user_id]['data'][key] = value
+        ctx.timestamp = time.time()
+        return ctx.get(key, default)
 
-    def get_all(self, user_id: str) -> Dict[str, Any]:
-        """Get all context data for a user."""
-        if user_id not in self._storage:
-            self._storage[user_id] = {
-                'data': {},
-                'timestamp': time.time()
-            }
+    def get_many(self, user_id: str, keys: Iterable[str]) -> Dict[str, Any]:
+        ctx = self._load(user_id)
+        if ctx is None:
             return {}
 
-        self._refresh_timestamp(user_id)
-        return self._storage[user_id].get('data', {}).copy()
+        ctx.timestamp = time.time()
+        return {key: ctx.get(key) for key in keys if key in ctx}
 
-    def set_all(self, user_id: str, data: Dict[str, Any]) -> None:
-        """Set all context data for a user."""
-        self._storage[user_id] = {
-            'data': data,
-            'timestamp': time.time()
-        }
+    def set(self, user_id: str, key: str, value: Any) -> None:
+        ctx = self._ensure(user_id)
+        ctx.set(key, value)
+        self._mark_dirty(user_id, ctx)
+
+    def set_many(self, user_id: str, values: Mapping) -> None:
+        ctx = self._ensure(user_id)
+        for key, value in values.items():
+            ctx.set(key, value)
+        self._mark_dirty(user_id, ctx)
+
+    def delete(self, user_id: str, key: str) -> None:
+        ctx = self._load(user_id)
+        if ctx is not None and key in ctx:
+            ctx.delete(key)
+            self._mark_dirty(user_id, ctx)
+
+    def get_all(self, user_id: str) -> Mapping:
+        ctx = self._load(user_id)
+        if ctx is None:
+            return _EMPTY_VIEW
+
+        ctx.timestamp = time.time()
+        return ctx.view()
+
+    def set_all(self, user_id: str, data: Mapping) -> None:
+        ctx = self._insert(user_id, UserContext.from_dict(data))
+        self._mark_dirty(user_id, ctx)
 
     def clear(self, user_id: str) -> None:
-        """Clear all context data for a user."""
         if user_id in self._storage:
             del self._storage[user_id]
+        if self._store is not None:
+            self._store.mark_deleted(user_id)
 
-    def _refresh_timestamp(self, user_id: str) -> None:
-        """Update the timestamp for a user's context."""
-        if user_id in self._storage:
-            self._storage[user_id]['timestamp'] = time.time()
+    def evict(self, user_id: str) -> None:
+        self._storage.pop(user_id, None)
 
     def cleanup_expired(self) -> int:
-        """Remove expired contexts. Returns the number of items cleaned up."""
         current_time = time.time()
         expired_ids = [
-            tid for tid, context_data in self._storage.items()
-            if current_time - context_data.get('timestamp', 0) > USER_CONTEXT_TIMEOUT
+            tid for tid, ctx in self._storage.items()
+            if current_time - ctx.timestamp > USER_CONTEXT_TIMEOUT
         ]
 
         for user_id in expired_ids:
@@ -89,62 +323,202 @@ class ContextManager:
         return len(expired_ids)
 
     def size(self) -> int:
-        """Get the number of user contexts in storage."""
         return len(self._storage)
 
+    def check_cleanup_needed(self) -> bool:
+        # The LRU bound already caps memory, and a full cache is its normal state;
+        # expired contexts are left to the periodic cleanup task
+        return False
+
+    def snapshot(self) -> Optional[Dict[str, Any]]:
+        # Least recently used first, so restoring keeps the LRU order
+        return {
+            user_id: [ctx.timestamp, dict(ctx.view())]
+            for user_id, ctx in self._storage.items()
+        }
+
+    def restore(self, state: Mapping) -> None:
+        current_time = time.time()
+        for user_id, (timestamp, data) in state.items():
+            if user_id in self._storage or current_time - timestamp > USER_CONTEXT_TIMEOUT:
+                continue
+            # Not marked dirty: the store was flushed before the snapshot was taken
+            ctx = self._insert(user_id, UserContext.from_dict(data))
+            ctx.timestamp = timestamp
+
+
+class ContextManager:
+    """Unified manager for user context data across the application."""
+
+    def __init__(self, backend: Optional[ContextBackend] = None):
+        self._backend = backend or InMemoryContextBackend()
+
+    @property
+    def backend(self) -> ContextBackend:
+        return self._backend
+
+    def set_backend(self, backend: ContextBackend) -> None:
+        """Switch to another backend, e.g. a shared one for multi-worker deployments."""
+        old_backend, self._backend = self._backend, backend
+        old_backend.close()
+
+    def attach_store(self, store) -> None:
+        """Attach a persistent store to the in-process backend."""
+        if not isinstance(self._backend, InMemoryContextBackend):
+            logger.warning("Context store ignored: the active backend persists contexts itself")
+            return
+        self._backend.attach_store(store)
+
+    def get(self, user_id: str, key: str, default: Any = None) -> Any:
+        """Get value from context by key with optional default."""
+        return self._backend.get(user_id, key, default)
+
+    def get_many(self, user_id: str, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get several values in one round trip; missing keys are left out."""
+        return self._backend.get_many(user_id, keys)
+
+    async def prefetch(self, user_id: str) -> None:
+        """Fetch a user's context before handling their update, so the reads that follow are local."""
+        await self._backend.prefetch(user_id)
+
+    def set(self, user_id: str, key: str, value: Any) -> None:
+        """Set value in context by key."""
+        self._backend.set(user_id, key, value)
+
+    def set_many(self, user_id: str, values: Mapping) -> None:
+        """Set several values in one round trip."""
+        self._backend.set_many(user_id, values)
+
+    def delete(self, user_id: str, key: str) -> None:
+        """Remove a single key from a user's context."""
+        self._backend.delete(user_id, key)
+
+    def get_all(self, user_id: str) -> Mapping:
+        """Get a read-only view of all context data for a user."""
+        return self._backend.get_all(user_id)
+
+    def set_all(self, user_id: str, data: Dict[str, Any]) -> None:
+        """Set all context data for a user."""
+        self._backend.set_all(user_id, data)
+
+    def clear(self, user_id: str) -> None:
+        """Clear all context data for a user."""
+        self._backend.clear(user_id)
+
+    def evict(self, user_id: str) -> None:
+        """Drop a user's context from local memory only, leaving the stored copy intact."""
+        self._backend.evict(user_id)
+
+    def cleanup_expired(self) -> int:
+        """Remove expired contexts. Returns the number of items cleaned up."""
+        return self._backend.cleanup_expired()
+
+    def size(self) -> int:
+        """Get the number of user contexts in storage."""
+        return self._backend.size()
+
     def check_cleanup_needed(self) -> bool:
         """Check if cleanup is needed due to large context size."""
-        return len(self._storage) >= MAX_CONTEXTS
+        return self._backend.check_cleanup_needed()
+
+    def snapshot(self) -> Optional[Dict[str, Any]]:
+        """Contexts to hand over to the next process, if the backend doesn't outlive this one."""
+        return self._backend.snapshot()
+
+    def restore(self, state: Mapping) -> None:
+        """Take over contexts handed over by the previous process."""
+        self._backend.restore(state)
 
 
 # Global context manager instance
 context_manager = ContextManager()
+register_state("contexts", context_manager.snapshot, context_manager.restore)
+
+
+class UserDataView(MutableMapping):
+    """PTB-style user_data that reads and writes straight through to context_manager."""
+
+    __slots__ = ("_user_id",)
+
+    def __init__(self, user_id: str):
+        self._user_id = user_id
+
+    def __getitem__(self, key: str) -> Any:
+        value = context_manager.get(self._user_id, key, _UNSET)
+        if value is _UNSET:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return context_manager.get(self._user_id, key, default)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        context_manager.set(self._user_id, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        context_manager.delete(self._user_id, key)
+
+    def __contains__(self, key: object) -> bool:
+        return context_manager.get(self._user_id, key, _UNSET) is not _UNSET
 
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(context_manager.get_all(self._user_id)))
 
-# Helper functions for working with both PTB context and our custom context
-def get_user_data(telegram_id: str, context: Optional[ContextTypes.DEFAULT_TYPE] = None) -> Dict[str, Any]:
+    def __len__(self) -> int:
+        return len(context_manager.get_all(self._user_id))
+
+    def update(self, *args, **kwargs) -> None:
+        context_manager.set_many(self._user_id, dict(*args, **kwargs))
+
+    def clear(self) -> None:
+        context_manager.clear(self._user_id)
+
+    def __repr__(self) -> str:
+        return f"UserDataView({dict(context_manager.get_all(self._user_id))!r})"
+
+
+class GameContext(CallbackContext):
     """
-    Get user data, combining PTB context (if provided) with our custom context.
-    Always returns a copy to prevent unintended modifications.
+    CallbackContext whose user_data is a view of context_manager.
+
+    PTB keeps its own user_data dict per user and never evicts it; routing it
+    through context_manager keeps a single, bounded copy of user state.
     """
-    # Check if cleanup is needed
-    if context_manager.check_cleanup_needed():
-        context_manager.cleanup_expired()
 
-    # Get data from our custom context
-    data = context_manager.get_all(telegram_id)
+    @property
+    def user_data(self) -> Optional[UserDataView]:
+        if self._user_id is None:
+            return None
+        return UserDataView(str(self._user_id))
+
 
-    # If PTB context is provided, merge its data
-    if context and hasattr(context, 'user_data'):
-        # Make a copy of context.user_data to avoid modifying it directly
-        ptb_data = dict(context.user_data) if context.user_data else {}
-        # Update our data with PTB data, giving PTB priority
-        data.update(ptb_data)
+# Pass to ApplicationBuilder.context_types() to use GameContext
+GAME_CONTEXT_TYPES = ContextTypes(context=GameContext)
+
+
+# Helper functions for reading and writing user state
+def get_user_data(telegram_id: str, context: Optional[ContextTypes.DEFAULT_TYPE] = None) -> Mapping:
+    """
+    Get a read-only view of user data.
+    The context argument is accepted for compatibility; context_manager is the only store.
+    """
+    return context_manager.get_all(telegram_id)
 
-    return data
 
 def set_user_data(telegram_id: str, key: str, value: Any, context: Optional[ContextTypes.DEFAULT_TYPE] = None) -> None:
-    """Set user data in both our custom context and PTB context if provided."""
-    # Set in our custom context
+    """Set user data; PTB user_data sees the change through GameContext."""
     context_manager.set(telegram_id, key, value)
 
-    # Also set in PTB context if provided
-    if context and hasattr(context, 'user_data'):
-        context.user_data[key] = value
-
 
 def clear_user_data(telegram_id: str, context: Optional[ContextTypes.DEFAULT_TYPE] = None) -> None:
-    """Clear user data from both our custom context and PTB context if provided."""
-    # Clear our custom context
+    """Clear user data; PTB user_data sees the change through GameContext."""
     context_manager.clear(telegram_id)
 
-    # Also clear PTB context if provided
-    if context and hasattr(context, 'user_data'):
-        context.user_data.clear()
-
 
 # Legacy aliases for backward compatibility
-def get_user_context(telegram_id: str) -> Dict[str, Any]:
+def get_user_context(telegram_id: str) -> Mapping:
     """Legacy alias for get_user_data for backward compatibility."""
     return context_manager.get_all(telegram_id)
 
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+State handoff between an old and a new bot process.
+
+A restart used to start from nothing: rate limit counters and blocks, the
+player directory, the map and every in-memory user context were lost, and
+the new process filled them again from the database with the first updates.
+On a graceful stop the process now writes its in-memory state to one
+snapshot file once in-flight updates are done and the write-behind queues
+are flushed; the next process loads it on start, if it is recent enough, so
+a deploy looks like a short pause to players and to the database.
+
+Modules holding state register an export and a restore function for their
+section, the same way caches register translation reload listeners.
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+DEFAULT_SNAPSHOT_PATH = "data/handoff.json"
+# An older snapshot is ignored: the database has moved on since
+DEFAULT_MAX_AGE = 300  # seconds
+
+# Section name -> (export, restore)
+_sections: Dict[str, Tuple[Callable[[], Any], Callable[[Any], Any]]] = {}
+
+
+def register_state(name: str, export: Callable[[], Any], restore: Callable[[Any], Any]) -> None:
+    """
+    Register a section of the snapshot.
+
+    export returns JSON-serializable data, or None to leave the section out;
+    restore receives that data in the next process.
+    """
+    _sections[name] = (export, restore)
+
+
+def write_snapshot(path: str = DEFAULT_SNAPSHOT_PATH) -> List[str]:
+    """Write every registered section to path. Returns the names of the sections written."""
+    sections = {}
+    for name, (export, _restore) in _sections.items():
+        try:
+            data = export()
+        except Exception as e:
+            logger.error(f"Error exporting {name} for the handoff snapshot: {e}")
+            continue
+        if data is not None:
+            sections[name] = data
+
+    snapshot = {"version": SNAPSHOT_VERSION, "created_at": time.time(), "sections": sections}
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Written aside and renamed, so the next process never reads half a snapshot
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, default=str, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+    logger.info(f"Handoff snapshot written to {path}: {', '.join(sections) or 'no state'}")
+    return list(sections)
+
+
+def load_snapshot(path: str = DEFAULT_SNAPSHOT_PATH, max_age: Optional[float] = DEFAULT_MAX_AGE) -> List[str]:
+    """
+    Restore the sections of the snapshot at path, if there is a recent one.
+
+    The snapshot is removed once read, so state is only ever handed over
+    once. Returns the names of the sections restored.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable handoff snapshot {path}: {e}")
+        snapshot = None
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        if snapshot is not None:
+            logger.warning(f"Ignoring handoff snapshot {path} of an unknown version")
+        return []
+    age = time.time() - snapshot.get("created_at", 0)
+    if max_age is not None and age > max_age:
+        logger.info(f"Ignoring handoff snapshot {path} from {age:.0f}s ago")
+        return []
+
+    restored = []
+    for name, data in snapshot.get("sections", {}).items():
+        section = _sections.get(name)
+        if section is None:
+            logger.warning(f"Handoff snapshot has an unknown section {name!r}")
+            continue
+        try:
+            section[1](data)
+        except Exception as e:
+            # That state is filled on first use instead, as after a cold start
+            logger.error(f"Error restoring {name} from the handoff snapshot: {e}")
+            continue
+        restored.append(name)
+
+    logger.info(f"Handoff snapshot from {age:.1f}s ago restored: {', '.join(restored) or 'no state'}")
+    return restored
@@ -1,13 +1,29 @@
 # utils/i18n.py - Improved internationalization implementation
 
+import asyncio
 import json
 import logging
 import os
 import time
-from typing import Dict, Any, Optional, Callable, Awaitable
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple
 
 # Import core functionality without database dependencies
-from utils.i18n_core import _, load_default_translations, SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE, _translations, load_translations_from_file
+from utils.i18n_core import (
+    _,
+    compile_catalogs,
+    load_default_translations,
+    SUPPORTED_LANGUAGES,
+    DEFAULT_LANGUAGE,
+    _translations,
+    load_translations_from_file,
+    TRANSLATIONS_DIR,
+    build_catalog,
+    default_translations,
+    install_translations,
+    read_translation_files,
+    update_translations,
+)
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -52,6 +68,10 @@ async def get_user_language(telegram_id: str) -> str:
     cached_language = context_manager.get(telegram_id, "language")
     if cached_language in SUPPORTED_LANGUAGES:
         return cached_language
+    from db.player_directory import players
+    known_language = players.language(telegram_id)
+    if known_language in SUPPORTED_LANGUAGES:
+        return known_language
 
     # Try database as fallback
     try:
@@ -90,6 +110,9 @@ async def set_user_language(telegram_id: str, language: str) -> bool:
                 update_query = client.table("players").update({"language": language})
                 update_query = update_query.eq("telegram_id", telegram_id)
                 update_query.execute()
+                # The directory outlives the context, so it must not keep the old language
+                from db.player_directory import players
+                players.add(telegram_id, language)
                 return True
         # If player doesn't exist, language will be saved during registration
     except Exception as e:
@@ -106,6 +129,22 @@ async def load_translations_safely():
     logger.info(f"Loaded translations from files: {len(_translations['en_US'])} English, {len(_translations['ru_RU'])} Russian keys")
 
 
+def merge_translation_rows(rows: List[Any], translations: Dict[str, Dict[str, str]]) -> int:
+    """Merge rows of the translations table into translations. Returns the number of keys merged."""
+    loaded_count = 0
+    for translation in rows:
+        if isinstance(translation, dict):
+            key = translation.get("translation_key", "")
+            if key:
+                for lang in SUPPORTED_LANGUAGES:
+                    # PostgreSQL folds the unquoted en_US/ru_RU columns to lower case
+                    value = translation.get(lang) or translation.get(lang.lower())
+                    if value:
+                        translations.setdefault(lang, {})[key] = value
+                loaded_count += 1
+    return loaded_count
+
+
 async def load_translations_from_db() -> None:
     """Load translations from the database with unified error handling."""
     try:
@@ -119,17 +158,8 @@ async def load_translations_from_db() -> None:
 
             # Process the translations
             if translations_data and isinstance(translations_data, list):
-                loaded_count = 0
-                for translation in translations_data:
-                    if isinstance(translation, dict):
-                        key = translation.get("translation_key", "")
-                        if key:
-                            if "en_US" in translation and translation["en_US"]:
-                                _translations["en_US"][key] = translation["en_US"]
-                            if "ru_RU" in translation and translation["ru_RU"]:
-                                _translations["ru_RU"][key] = translation["ru_RU"]
-                            loaded_count += 1
-
+                loaded_count = merge_translation_rows(translations_data, _translations)
+                compile_catalogs()
                 logger.info(f"Loaded {loaded_count} translations from database")
             else:
                 logger.info("No translations found in database or invalid format")
@@ -171,26 +201,210 @@ async def load_translations() -> None:
         logger.info("Continuing with default translations only")
 
 
-# Track missing translations for future improvement
-def save_missing_translations() -> None:
-    """Save list of missing translations to a file for future additions."""
-    try:
-        from utils.i18n_core import _missing_translation_log
-        missing_file = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)),
-            "translations",
-            "missing_translations.txt"
+# Only one reload or sync runs at a time; a second request waits and runs again
+_reload_lock = asyncio.Lock()
+
+# Latest translations.updated_at seen; rows changed at or after it are pulled by the next sync
+_sync_watermark: Optional[datetime] = None
+
+# Re-read this far behind the watermark so rows committed after a later-stamped one are not missed
+TRANSLATION_SYNC_OVERLAP = timedelta(seconds=30)
+
+
+def _latest_update(rows: List[Any]) -> Optional[datetime]:
+    """Newest updated_at among translation rows."""
+    latest = None
+    for row in rows:
+        if isinstance(row, dict) and row.get("updated_at"):
+            try:
+                updated_at = datetime.fromisoformat(str(row["updated_at"]).replace("Z", "+00:00"))
+            except ValueError:
+                continue
+            if latest is None or updated_at > latest:
+                latest = updated_at
+    return latest
+
+
+def _fetch_translation_rows(since: Optional[datetime] = None) -> List[Any]:
+    """Fetch translation rows changed since a timestamp, or all of them (blocking)."""
+    client = _get_supabase_func()
+    query = client.table("translations").select("*")
+    if since is not None:
+        query = query.gte("updated_at", since.isoformat())
+    rows = query.order("updated_at").execute().data
+    return rows if isinstance(rows, list) else []
+
+
+def _build_translations(
+    include_db: bool,
+    translations_dir: str
+) -> Tuple[Dict[str, Dict[str, str]], Dict[str, Any], Dict[str, Any], List[Any]]:
+    """Build a complete new set of translations and catalogs (blocking, run in a worker thread)."""
+    translations = default_translations()
+    for lang in SUPPORTED_LANGUAGES:
+        translations.setdefault(lang, {})
+
+    mapped_catalogs = read_translation_files(translations, translations_dir)
+
+    rows = []
+    if include_db and _get_supabase_func is not None:
+        try:
+            rows = _fetch_translation_rows()
+            merge_translation_rows(rows, translations)
+        except Exception as e:
+            logger.warning(f"Error loading translations from database, keeping file translations: {e}")
+
+    # Compile here too, so the event loop only has to swap the result in
+    catalogs = {lang: build_catalog(lang, translations, mapped_catalogs) for lang in SUPPORTED_LANGUAGES}
+    return translations, mapped_catalogs, catalogs, rows
+
+
+async def reload_translations(include_db: bool = True, translations_dir: str = TRANSLATIONS_DIR) -> Dict[str, int]:
+    """
+    Rebuild translations from files and the database without a restart.
+
+    Everything is read and compiled off the event loop; handlers keep using the
+    current catalogs until the new ones are swapped in. Returns key counts per
+    language plus the number of database rows merged.
+    """
+    global _sync_watermark
+    async with _reload_lock:
+        started = time.monotonic()
+        translations, mapped_catalogs, catalogs, rows = await asyncio.to_thread(
+            _build_translations, include_db, translations_dir
         )
+        install_translations(translations, mapped_catalogs, catalogs)
+        if rows:
+            # The full table was just read; syncing can continue from here
+            _sync_watermark = _latest_update(rows) or _sync_watermark
 
-        with open(missing_file, "w", encoding="utf-8") as f:
-            for key in sorted(_missing_translation_log):
-                f.write(f"{key}\n")
+        counts = {lang: len(translations[lang]) + len(mapped_catalogs.get(lang, ())) for lang in SUPPORTED_LANGUAGES}
+        counts["database"] = len(rows)
+        logger.info(f"Reloaded translations in {time.monotonic() - started:.2f}s: {counts}")
+        return counts
 
-        logger.info(f"Saved {len(_missing_translation_log)} missing translations to {missing_file}")
+
+async def sync_translations_from_db() -> int:
+    """
+    Pull translation rows changed since the last sync and apply them in place.
+
+    The first sync reads the whole table. Deleted rows are not noticed; a full
+    reload_translations() picks those up. Returns the number of keys changed.
+    """
+    global _sync_watermark
+    if _get_supabase_func is None:
+        return 0
+
+    async with _reload_lock:
+        since = None if _sync_watermark is None else _sync_watermark - TRANSLATION_SYNC_OVERLAP
+        rows = await asyncio.to_thread(_fetch_translation_rows, since)
+        if not rows:
+            return 0
+
+        updates: Dict[str, Dict[str, str]] = {}
+        merge_translation_rows(rows, updates)
+        # Rows inside the overlap were applied before; only apply real changes
+        changes = {
+            lang: {key: value for key, value in strings.items() if _translations[lang].get(key) != value}
+            for lang, strings in updates.items()
+        }
+        changed = update_translations(changes)
+        _sync_watermark = _latest_update(rows) or _sync_watermark
+
+        if changed:
+            logger.info(f"Synced {changed} changed translations from database")
+        return changed
+
+
+async def translation_sync_task(interval: float = 60) -> None:
+    """Periodically apply translation edits made in the database."""
+    while True:
+        try:
+            await sync_translations_from_db()
+        except Exception as e:
+            logger.warning(f"Error syncing translations from database: {e}")
+        await asyncio.sleep(interval)
+
+
+def _translation_files_state(translations_dir: str) -> Dict[str, float]:
+    """Modification times of the translation catalogs in a directory."""
+    state = {}
+    try:
+        for name in os.listdir(translations_dir):
+            if name.endswith((".json", ".cat")):
+                state[name] = os.path.getmtime(os.path.join(translations_dir, name))
+    except OSError as e:
+        logger.warning(f"Cannot scan translations directory {translations_dir}: {e}")
+    return state
+
+
+async def watch_translation_files(interval: float = 5.0, translations_dir: str = TRANSLATIONS_DIR) -> None:
+    """Reload translations whenever a catalog file in the translations directory changes."""
+    state = await asyncio.to_thread(_translation_files_state, translations_dir)
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            current = await asyncio.to_thread(_translation_files_state, translations_dir)
+            if current != state:
+                changed = sorted(name for name in current.keys() | state.keys() if current.get(name) != state.get(name))
+                logger.info(f"Translation files changed ({', '.join(changed)}), reloading")
+                state = current
+                await reload_translations(translations_dir=translations_dir)
+        except Exception as e:
+            logger.error(f"Error in translation file watcher: {e}")
+
+
+# Track missing translations for future improvement
+MISSING_TRANSLATIONS_FILE = os.path.join(TRANSLATIONS_DIR, "missing_translations.txt")
+
+
+def _missing_translations_report() -> List[str]:
+    """Lines for the missing translations file, most frequent first."""
+    from utils.i18n_core import _missing_translation_log
+    lines = []
+    for (language, text), count, _error in _missing_translation_log.top():
+        # Keys may span lines; keep one entry per line
+        escaped = text.replace("\\", "\\\\").replace("\n", "\\n")
+        lines.append(f"{count}\t{language}:{escaped}\n")
+    return lines
+
+
+def _write_missing_translations(lines: List[str], missing_file: str = MISSING_TRANSLATIONS_FILE) -> None:
+    tmp_file = f"{missing_file}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.write("# misses\tlanguage:text, most frequent first\n")
+        f.writelines(lines)
+    os.replace(tmp_file, missing_file)
+
+
+def save_missing_translations() -> None:
+    """Save the most frequently missing translations to a file for future additions."""
+    try:
+        lines = _missing_translations_report()
+        _write_missing_translations(lines)
+        logger.info(f"Saved {len(lines)} missing translations to {MISSING_TRANSLATIONS_FILE}")
     except Exception as e:
         logger.error(f"Error saving missing translations: {e}")
 
 
+async def flush_missing_translations_task(interval: float = 300) -> None:
+    """Periodically write the missing translations file, skipping the write when nothing was missed."""
+    from utils.i18n_core import _missing_translation_log
+    flushed_total = _missing_translation_log.total
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if _missing_translation_log.total == flushed_total:
+                continue
+            flushed_total = _missing_translation_log.total
+            # Snapshot on the loop, write from a worker thread
+            lines = _missing_translations_report()
+            await asyncio.to_thread(_write_missing_translations, lines)
+            logger.debug(f"Flushed {len(lines)} missing translations")
+        except Exception as e:
+            logger.error(f"Error flushing missing translations: {e}")
+
+
 # Decorator for automatic language handling in handlers
 def with_language(handler_func: Callable) -> Callable:
     """
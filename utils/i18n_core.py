@@ -6,9 +6,15 @@ Core internationalization functionality without database dependencies.
 """
 
 import json
+import keyword
 import logging
 import os
-from typing import Dict, Any, Optional
+import re
+import string
+from typing import Dict, Any, Callable, Iterable, List, Mapping, Optional, Sequence
+
+from utils.mmap_catalog import MappedCatalog, compiled_path, is_fresh
+from utils.space_saving import SpaceSaving
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -23,50 +29,248 @@ _translations = {
 SUPPORTED_LANGUAGES = ["en_US", "ru_RU"]
 DEFAULT_LANGUAGE = "en_US"
 
-# Fallback system for missing translations
-_missing_translation_log = set()  # Track missing translations to avoid log spam
+# Directory holding <lang>.json and the compiled <lang>.cat catalogs
+TRANSLATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "translations")
+
+# Fallback system for missing translations: (language, text) -> miss count, bounded to the most frequent
+MAX_MISSING_TRANSLATIONS = 2048
+_missing_translation_log = SpaceSaving(MAX_MISSING_TRANSLATIONS)
+
+# Callbacks run after a translation reload
+_reload_listeners: List[Callable[[], None]] = []
+
+# Format specs simple enough to inline into a generated f-string
+_SIMPLE_SPEC = re.compile(r"^[\w<>=^+\- #.,%]*$")
+_formatter = string.Formatter()
+
+
+def _compile_renderer(text: str) -> Callable[[Dict[str, Any]], str]:
+    """
+    Compile a str.format template into a render function.
+
+    Templates with plain named fields become a generated f-string, which is
+    noticeably faster than re-parsing the template with str.format on every
+    call. Anything fancier (positional, attribute or index fields, nested
+    specs) falls back to the bound str.format.
+    """
+    try:
+        parts = list(_formatter.parse(text))
+    except ValueError:
+        # Not a valid template (e.g. a stray brace); render it verbatim
+        return lambda fields: text
+
+    if all(field is None for _literal, field, _spec, _conv in parts):
+        # No fields at all: str.format would still collapse doubled braces
+        literal = "".join(literal for literal, _field, _spec, _conv in parts)
+        return lambda fields: literal
+
+    body = []
+    names = []
+    for literal, field, spec, conversion in parts:
+        body.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is None:
+            continue
+        if (not field.isidentifier() or keyword.iskeyword(field) or field.startswith("_")
+                or not _SIMPLE_SPEC.match(spec or "")):
+            return lambda fields: text.format(**fields)
+        if field not in names:
+            names.append(field)
+        body.append("{" + field + ("!" + conversion if conversion else "") + (":" + spec if spec else "") + "}")
+
+    source = "def _render(_fields):\n"
+    for name in names:
+        source += f"    {name} = _fields[{name!r}]\n"
+    source += f"    return f{''.join(body)!r}\n"
+
+    namespace: Dict[str, Any] = {}
+    try:
+        exec(compile(source, "<translation template>", "exec"), namespace)
+    except SyntaxError:
+        return lambda fields: text.format(**fields)
+    return namespace["_render"]
+
+
+class Template:
+    """A translated string with its format template parsed once."""
+
+    __slots__ = ("text", "_render")
+
+    def __init__(self, text: str):
+        self.text = text
+        self._render = _compile_renderer(text)
+
+    def render(self, **fields: Any) -> str:
+        """Fill in the template; same semantics as str.format(**fields)."""
+        return self._render(fields)
+
+    def render_map(self, fields: Dict[str, Any]) -> str:
+        """Fill in the template from a mapping, without repacking keyword arguments."""
+        return self._render(fields)
+
+
+class Catalog:
+    """
+    Compiled translations for one language, falling back to the default language.
+
+    Layers are consulted in priority order. Plain dict layers are merged up
+    front; memory-mapped layers are looked up lazily and each hit is cached,
+    so only strings that are actually used ever get decoded.
+    """
+
+    __slots__ = ("language", "_resolved", "_layers", "_lazy", "_templates")
+
+    def __init__(self, language: str, layers: Sequence[Mapping[str, str]]):
+        self.language = language
+        self._templates: Dict[str, Optional[Template]] = {}
+        self._layers = tuple(layers)
+
+        self._lazy = not all(isinstance(layer, dict) for layer in layers)
+        if self._lazy:
+            self._resolved = {}
+        else:
+            resolved = {}
+            for layer in reversed(layers):
+                resolved.update((key, value) for key, value in layer.items() if value)
+            self._resolved = resolved
+            # Small in-memory catalogs are compiled completely at load time
+            for key, value in resolved.items():
+                if "{" in value or "}" in value:
+                    self._templates[key] = Template(value)
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the translation for a key, or None if no layer has it."""
+        value = self._resolved.get(key)
+        if value is None and self._lazy:
+            for layer in self._layers:
+                value = layer.get(key)
+                if value:
+                    self._resolved[key] = value
+                    return value
+            return None
+        return value
+
+    def template(self, key: str) -> Optional[Template]:
+        """Get the parsed template for a key, or None if the key has no fields or is unknown."""
+        try:
+            return self._templates[key]
+        except KeyError:
+            pass
+
+        value = self.get(key)
+        if value is None:
+            # Unknown keys are not cached; they may be arbitrary dynamic text
+            return None
+        template = Template(value) if "{" in value or "}" in value else None
+        self._templates[key] = template
+        return template
+
+    def refresh(self, keys: Iterable[str]) -> None:
+        """Re-resolve keys after their values changed in one of the layers."""
+        for key in keys:
+            self._templates.pop(key, None)
+            self._resolved.pop(key, None)
+            if self._lazy:
+                # Resolved again on the next lookup
+                continue
+            for layer in self._layers:
+                value = layer.get(key)
+                if value:
+                    self._resolved[key] = value
+                    if "{" in value or "}" in value:
+                        self._templates[key] = Template(value)
+                    break
+
+
+def build_catalog(
+    language: str,
+    translations: Dict[str, Dict[str, str]],
+    mapped: Optional[Dict[str, Mapping[str, str]]] = None
+) -> Catalog:
+    """Build the compiled catalog for one language from raw and memory-mapped translations."""
+    mapped = mapped or {}
+    layers = []
+    for lang in dict.fromkeys((language, DEFAULT_LANGUAGE)):
+        layers.append(translations.get(lang, {}))
+        if lang in mapped:
+            layers.append(mapped[lang])
+    return Catalog(language, layers)
+
+
+def compile_catalogs() -> None:
+    """Rebuild the compiled catalogs from _translations and the mapped catalog files."""
+    global _catalogs
+    _catalogs = {lang: build_catalog(lang, _translations, _mapped_catalogs) for lang in SUPPORTED_LANGUAGES}
+    logger.debug("Compiled translation catalogs")
+
+
+# Memory-mapped catalogs built by utils.mmap_catalog, used instead of the JSON files when fresh
+_mapped_catalogs: Dict[str, MappedCatalog] = {}
+
+# Compiled catalogs used on the hot path, rebuilt whenever translations are loaded
+_catalogs: Dict[str, Catalog] = {}
+
+# Templates for keys with no translation, compiled from the key itself
+MAX_SOURCE_TEMPLATES = 1024
+_source_templates: Dict[str, Template] = {}
+compile_catalogs()
+
+
+def _record_missing(text: str, language: str) -> None:
+    """Count a missing translation, logging it only when it starts being tracked to avoid spam."""
+    if len(text) < 100 and _missing_translation_log.add((language, text)):  # Don't track very long strings
+        logger.debug(f"Missing translation for '{text}' in {language}")
 
 
 def _(text: str, language: str = DEFAULT_LANGUAGE) -> str:
     """
     Translate a text string to the specified language.
 
-    Enhanced with fallback system and missing translation tracking.
+    Falls back to the default language, then to the original text.
     """
     if not text:
         return ""
 
-    # Normalize language code
-    language = language if language in SUPPORTED_LANGUAGES else DEFAULT_LANGUAGE
-
-    # Check for translation
-    translation = _translations[language].get(text)
-
-    # If translation exists, return it
-    if translation:
+    catalog = _catalogs.get(language)
+    if catalog is None:
+        catalog = _catalogs[DEFAULT_LANGUAGE]
+    translation = catalog.get(text)
+    if translation is not None:
         return translation
 
-    # No translation found, try fallbacks
-    if language != DEFAULT_LANGUAGE:
-        # Try default language
-        default_translation = _translations[DEFAULT_LANGUAGE].get(text)
-        if default_translation:
-            return default_translation
-
-    # Log missing translation (only once per string to avoid spam)
-    cache_key = f"{language}:{text}"
-    if cache_key not in _missing_translation_log and len(text) < 100:  # Don't log very long strings
-        _missing_translation_log.add(cache_key)
-        logger.debug(f"Missing translation for '{text}' in {language}")
+    _record_missing(text, catalog.language)
 
     # Return original text as last resort
     return text
 
 
-def load_default_translations() -> None:
-    """Initialize the system with essential fallback translations."""
+def render(key: str, language: str = DEFAULT_LANGUAGE, **fields: Any) -> str:
+    """Translate key and fill in its fields; the fast equivalent of _(key, language).format(**fields)."""
+    catalog = _catalogs.get(language)
+    if catalog is None:
+        catalog = _catalogs[DEFAULT_LANGUAGE]
+    template = catalog.template(key)
+    if template is not None:
+        return template.render_map(fields)
+
+    text = catalog.get(key)
+    if text is not None:
+        # Translated, but has no fields to fill in
+        return text
+
+    # Untranslated: the key itself is the template
+    _record_missing(key, catalog.language)
+    template = _source_templates.get(key)
+    if template is None:
+        if len(_source_templates) >= MAX_SOURCE_TEMPLATES:
+            _source_templates.clear()
+        template = _source_templates[key] = Template(key)
+    return template.render_map(fields)
+
+
+def default_translations() -> Dict[str, Dict[str, str]]:
+    """Essential fallback translations built into the bot."""
     # Core UI elements and commonly used strings
-    essentials = {
+    return {
         "en_US": {
             # Basic UI elements
             "Yes": "Yes",
@@ -177,30 +381,57 @@ def load_default_translations() -> None:
         }
     }
 
-    # Load these essentials into the translation dictionary
+
+def load_default_translations() -> None:
+    """Initialize the system with essential fallback translations."""
+    essentials = default_translations()
     for lang in SUPPORTED_LANGUAGES:
         _translations[lang].update(essentials.get(lang, {}))
+    compile_catalogs()
 
     logger.info("Loaded default translations as fallback")
 
 
-async def load_translations_from_file() -> None:
-    """Load translations from JSON files with improved error handling."""
-    # Path to translations directory
-    translations_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "translations")
+def read_translation_files(
+    translations: Dict[str, Dict[str, str]],
+    translations_dir: str = TRANSLATIONS_DIR
+) -> Dict[str, MappedCatalog]:
+    """
+    Read the translation files into translations (blocking).
 
+    Uses the memory-mapped binary catalog built by utils.mmap_catalog when it
+    is at least as new as the JSON file and valid, and falls back to json.load
+    otherwise.
+    Returns the mapped catalogs by language.
+    """
     # Create the directory if it doesn't exist
     os.makedirs(translations_dir, exist_ok=True)
 
-    # Load for each supported language
+    mapped_catalogs: Dict[str, MappedCatalog] = {}
     for lang_code in SUPPORTED_LANGUAGES:
         lang_path = os.path.join(translations_dir, f"{lang_code}.json")
+        lang_translations = translations.setdefault(lang_code, {})
 
         try:
-            if os.path.exists(lang_path):
+            # Prefer the compiled binary catalog when it is up to date
+            mapped = None
+            if is_fresh(lang_path):
+                try:
+                    mapped = MappedCatalog(compiled_path(lang_path))
+                except (OSError, ValueError) as e:
+                    # An empty or corrupt catalog: the JSON file is still the source
+                    logger.warning(f"Ignoring binary catalog for {lang_code}: {e}")
+
+            if mapped is not None:
+                mapped_catalogs[lang_code] = mapped
+                # The file overrides built-in defaults, so drop the ones it covers
+                for key in [key for key in lang_translations if key in mapped]:
+                    del lang_translations[key]
+                logger.info(f"Mapped {len(mapped)} {lang_code} translations from {mapped.path}")
+            elif os.path.exists(lang_path):
                 with open(lang_path, "r", encoding="utf-8") as f:
                     lang_data = json.load(f)
-                    _translations[lang_code].update(lang_data)
+                    lang_translations.update(lang_data)
                     logger.info(f"Loaded {len(lang_data)} {lang_code} translations from file")
             else:
                 # Create an empty translations file for future use
@@ -208,4 +439,86 @@ async def load_translations_from_file() -> None:
                     json.dump({}, f, indent=4)
                     logger.info(f"Created empty {lang_code} translations file")
         except Exception as e:
-            logger.error(f"Error loading translation file {lang_path}: {str(e)}")
\ No newline at end of file
+            logger.error(f"Error loading translation file {lang_path}: {str(e)}")
+
+    return mapped_catalogs
+
+
+def _replace_mapped_catalogs(mapped_catalogs: Dict[str, MappedCatalog]) -> None:
+    """Make mapped_catalogs the current set and unmap the ones it replaces."""
+    old_catalogs = [mapped for mapped in _mapped_catalogs.values() if mapped not in mapped_catalogs.values()]
+    _mapped_catalogs.clear()
+    _mapped_catalogs.update(mapped_catalogs)
+    for mapped in old_catalogs:
+        mapped.close()
+
+
+async def load_translations_from_file() -> None:
+    """Load translations from the translations directory."""
+    _replace_mapped_catalogs(read_translation_files(_translations))
+    compile_catalogs()
+
+
+def add_reload_listener(callback: Callable[[], None]) -> None:
+    """Register a callback run after translations are reloaded, to drop caches of rendered text."""
+    if callback not in _reload_listeners:
+        _reload_listeners.append(callback)
+
+
+def install_translations(
+    translations: Dict[str, Dict[str, str]],
+    mapped_catalogs: Dict[str, MappedCatalog],
+    catalogs: Dict[str, Catalog]
+) -> None:
+    """
+    Make a freshly built set of translations current.
+
+    Lookups only go through _catalogs, so the single assignment below is the
+    switch-over: a handler sees either the old catalogs or the new ones.
+    """
+    global _catalogs
+    _catalogs = catalogs
+
+    # Keep the module-level containers (imported by name elsewhere) in step
+    for lang in SUPPORTED_LANGUAGES:
+        _translations[lang] = translations.get(lang, {})
+    _replace_mapped_catalogs(mapped_catalogs)
+
+    # Anything derived from the old catalogs is now stale
+    _source_templates.clear()
+    _notify_reload()
+
+
+def update_translations(updates: Dict[str, Dict[str, str]]) -> int:
+    """
+    Apply changed translations to the current catalogs in place.
+
+    Only the changed keys are re-resolved, so the cost follows the number of
+    edits rather than the size of the catalogs. Returns the number of keys changed.
+    """
+    keys = set()
+    for lang, strings in updates.items():
+        if lang in _translations and strings:
+            _translations[lang].update(strings)
+            keys.update(strings)
+    if not keys:
+        return 0
+
+    for catalog in _catalogs.values():
+        catalog.refresh(keys)
+    for key in keys:
+        _source_templates.pop(key, None)
+    _notify_reload()
+    return len(keys)
+
+
+def _notify_reload() -> None:
+    """Drop misses that are now translated and let listeners rebuild their caches."""
+    for language, text in _missing_translation_log:
+        if _catalogs[language if language in _catalogs else DEFAULT_LANGUAGE].get(text) is not None:
+            _missing_translation_log.discard((language, text))
+    for callback in list(_reload_listeners):
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Error in translation reload listener {callback!r}: {e}")
@@ -42,19 +42,7 @@ def setup_logger(
 
         # Set up logging to file if a file is specified
         if log_file:
-            log_dir = os.path.dirname(log_file)
-            if log_dir and not os.path.exists(log_dir):
-                os.makedirs(log_dir)
-
-            file_handler = RotatingFileHandler(
-                log_file,
-                maxBytes=max_bytes,
-                backupCount=backup_count,
-                encoding="utf-8"
-            )
-            file_handler.setLevel(numeric_level)
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            add_log_file(logger, log_file, formatter, max_bytes, backup_count)
 
         # Set up console handler
         console_handler = logging.StreamHandler(sys.stdout)
@@ -65,6 +53,34 @@ def setup_logger(
     return logger
 
 
+def add_log_file(
+        logger: logging.Logger,
+        log_file: str,
+        formatter: Optional[logging.Formatter] = None,
+        max_bytes: int = 10485760,  # 10 MB
+        backup_count: int = 5
+) -> None:
+    """
+    Add a rotating file handler to a logger.
+
+    Each process needs a file of its own: processes rotating the same file
+    independently lose and interleave lines.
+    """
+    log_dir = os.path.dirname(log_file)
+    if log_dir and not os.path.exists(log_dir):
+        os.makedirs(log_dir)
+
+    file_handler = RotatingFileHandler(
+        log_file,
+        maxBytes=max_bytes,
+        backupCount=backup_count,
+        encoding="utf-8"
+    )
+    file_handler.setLevel(logger.level)
+    file_handler.setFormatter(formatter or logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    logger.addHandler(file_handler)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a specific logger by name."""
     return logging.getLogger(name)
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Telegram Markdown escaping, validation and a safe message builder.
+
+User data (player names, district descriptions, news) is escaped when it is
+inserted into a message, with precompiled tables for both parse modes:
+
+    Markdown    outside an entity the special characters _ * ` [ are
+                backslash-escaped; inside an entity escapes are not
+                recognised, so the character that would close it is dropped.
+    MarkdownV2  every special character is backslash-escaped, inside code
+                only ` and \\.
+
+MessageBuilder only opens entities it also closes, so a message built from
+trusted markup and escaped values always parses. check_entities() validates
+finished text in one pass, so send_message can fall back to plain text
+before sending instead of after Telegram rejects the message.
+"""
+
+import logging
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+MARKDOWN = "Markdown"
+MARKDOWN_V2 = "MarkdownV2"
+
+_SPECIAL = {
+    MARKDOWN: "_*`[",
+    MARKDOWN_V2: "_*[]()~`>#+-=|{}.!\\",
+}
+_ESCAPE_TABLES = {
+    mode: str.maketrans({char: "\\" + char for char in chars}) for mode, chars in _SPECIAL.items()
+}
+_NEEDS_ESCAPE = {
+    mode: re.compile("[" + re.escape(chars) + "]").search for mode, chars in _SPECIAL.items()
+}
+_UNESCAPE = {
+    mode: re.compile(r"\\([" + re.escape(chars) + "])") for mode, chars in _SPECIAL.items()
+}
+_V2_CODE_TABLE = str.maketrans({"`": "\\`", "\\": "\\\\"})
+_V2_URL_TABLE = str.maketrans({")": "\\)", "\\": "\\\\"})
+
+# Entity delimiters of legacy Markdown
+ENTITY_CHARS = "_*`"
+
+_MARKDOWN_TABLE = _ESCAPE_TABLES[MARKDOWN]
+_MARKDOWN_NEEDS_ESCAPE = _NEEDS_ESCAPE[MARKDOWN]
+
+
+def _mode(parse_mode: Optional[str]) -> str:
+    return MARKDOWN_V2 if parse_mode and parse_mode.lower() == "markdownv2" else MARKDOWN
+
+
+def escape_markdown(value: Any) -> str:
+    """Escape a value for legacy Markdown, outside any entity."""
+    text = value if value.__class__ is str else str(value)
+    # Most values have nothing to escape
+    return text.translate(_MARKDOWN_TABLE) if _MARKDOWN_NEEDS_ESCAPE(text) else text
+
+
+def escape(value: Any, parse_mode: Optional[str] = MARKDOWN) -> str:
+    """Escape a value for a parse mode, outside any entity."""
+    mode = _mode(parse_mode)
+    text = value if value.__class__ is str else str(value)
+    return text.translate(_ESCAPE_TABLES[mode]) if _NEEDS_ESCAPE[mode](text) else text
+
+
+def entity_escaper(entity: str, parse_mode: Optional[str] = MARKDOWN) -> Callable[[Any], str]:
+    """Escaper for values inside an entity opened by `entity` (_ * or `)."""
+    if _mode(parse_mode) == MARKDOWN_V2:
+        if entity == "`":
+            return lambda value: str(value).translate(_V2_CODE_TABLE)
+        return lambda value: escape(value, MARKDOWN_V2)
+
+    # Legacy Markdown has no escapes inside entities: drop the closing character
+    def escape_inside(value: Any) -> str:
+        text = value if value.__class__ is str else str(value)
+        return text.replace(entity, "") if entity in text else text
+    return escape_inside
+
+
+def entity_state(text: str, state: Optional[str]) -> Optional[str]:
+    """Legacy Markdown entity still open after text, given the one open before it."""
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if state is None:
+            if char == "\\" and text[i + 1:i + 2] in tuple(_SPECIAL[MARKDOWN]):
+                i += 1
+            elif char in ENTITY_CHARS:
+                state = char
+        elif char == state:
+            state = None
+        i += 1
+    return state
+
+
+def _check_markdown(text: str, boundaries: Optional[List[int]] = None) -> bool:
+    i, length = 0, len(text)
+    while i < length:
+        char = text[i]
+        if char == "\\" and i + 1 < length and text[i + 1] in _SPECIAL[MARKDOWN]:
+            i += 2
+            continue
+        if text.startswith("```", i):
+            end = text.find("```", i + 3)
+            if end < 0:
+                return False
+            i = end + 3
+            continue
+        if char in ENTITY_CHARS:
+            end = text.find(char, i + 1)
+            if end < 0:
+                return False
+            i = end + 1
+            continue
+        if char == "[":
+            # Only a complete [label](url) opens a link
+            close = text.find("]", i + 1)
+            if close < 0 or text[close + 1:close + 2] != "(":
+                return False
+            end = text.find(")", close + 2)
+            if end < 0:
+                return False
+            i = end + 1
+            continue
+        if boundaries is not None and char in " \n":
+            boundaries.append(i)
+        i += 1
+    return True
+
+
+def _check_markdown_v2(text: str, boundaries: Optional[List[int]] = None) -> bool:
+    special = _SPECIAL[MARKDOWN_V2]
+    stack: List[str] = []
+    i, length = 0, len(text)
+    while i < length:
+        char = text[i]
+        if char == "\\":
+            if i + 1 >= length:
+                return False
+            i += 2
+            continue
+        if stack and stack[-1] in ("`", "```"):
+            # Only the closing delimiter is special inside code
+            if text.startswith(stack[-1], i):
+                i += len(stack.pop())
+            else:
+                i += 1
+            continue
+        for delimiter in ("```", "||", "__", "`", "*", "_", "~"):
+            if text.startswith(delimiter, i):
+                break
+        else:
+            delimiter = None
+        if delimiter is not None:
+            if delimiter in stack:
+                if stack[-1] != delimiter:
+                    return False
+                stack.pop()
+            else:
+                stack.append(delimiter)
+            i += len(delimiter)
+            continue
+        if char == "[":
+            stack.append("[")
+        elif char == "]":
+            if not stack or stack[-1] != "[" or text[i + 1:i + 2] != "(":
+                return False
+            stack.pop()
+            i += 2
+            while i < length and text[i] != ")":
+                i += 2 if text[i] == "\\" else 1
+            if i >= length:
+                return False
+        elif char in special:
+            return False
+        elif boundaries is not None and not stack and char in " \n":
+            boundaries.append(i)
+        i += 1
+    return not stack
+
+
+def check_entities(text: str, parse_mode: Optional[str] = MARKDOWN) -> bool:
+    """Check in one pass that text parses in a Markdown parse mode."""
+    if _mode(parse_mode) == MARKDOWN_V2:
+        return _check_markdown_v2(text)
+    return _check_markdown(text)
+
+
+def split_message(text: str, limit: int, parse_mode: Optional[str] = MARKDOWN) -> List[str]:
+    """Split text into chunks of at most limit characters.
+
+    Chunks end at a paragraph, line or word break outside any entity, so each
+    chunk of valid text parses on its own. Text with no such break is cut at
+    the limit, and that chunk is left for fixup_message_text to send plain.
+    """
+    check = _check_markdown_v2 if parse_mode and _mode(parse_mode) == MARKDOWN_V2 else _check_markdown
+    chunks: List[str] = []
+    while len(text) > limit:
+        boundaries: List[int] = []
+        if parse_mode:
+            check(text[:limit + 1], boundaries)
+        else:
+            boundaries = [i for i, char in enumerate(text[:limit + 1]) if char in " \n"]
+
+        cut = 0
+        for separator in ("\n\n", "\n", " "):
+            cut = next((position for position in reversed(boundaries)
+                        if position and text.startswith(separator, position)), 0)
+            if cut:
+                break
+        if cut:
+            chunks.append(text[:cut].rstrip())
+            text = text[cut + 1:].lstrip("\n")
+            continue
+
+        cut = limit
+        # Don't separate an escape from the character it escapes
+        if parse_mode and text[cut - 1] == "\\":
+            cut -= 1
+        chunks.append(text[:cut])
+        text = text[cut:]
+    if text or not chunks:
+        chunks.append(text)
+    return chunks
+
+
+def strip_markdown(text: str, parse_mode: Optional[str] = MARKDOWN) -> str:
+    """Plain-text version of Markdown text: escapes are removed, markup is kept as literal characters."""
+    return _UNESCAPE[_mode(parse_mode)].sub(r"\1", text)
+
+
+class MessageBuilder:
+    """Builds a Markdown message, escaping values as they are added.
+
+    markup() takes trusted text such as a translated string; everything else
+    is user data. Entities are always opened and closed together, so the
+    result has a valid entity structure.
+    """
+
+    _DELIMITERS: Dict[str, str] = {"bold": "*", "italic": "_", "code": "`"}
+
+    def __init__(self, parse_mode: str = MARKDOWN):
+        self.parse_mode = parse_mode
+        self._mode = _mode(parse_mode)
+        self._parts: List[str] = []
+
+    def markup(self, text: str) -> "MessageBuilder":
+        """Add trusted markup. Markup that would not parse on its own is escaped instead."""
+        if not check_entities(text, self._mode):
+            logger.warning(f"Escaping unbalanced markup: {text[:80]!r}")
+            text = escape(strip_markdown(text, self._mode), self._mode)
+        self._parts.append(text)
+        return self
+
+    def text(self, value: Any) -> "MessageBuilder":
+        """Add a value as literal text."""
+        self._parts.append(escape(value, self._mode))
+        return self
+
+    def _entity(self, kind: str, value: Any) -> "MessageBuilder":
+        delimiter = self._DELIMITERS[kind]
+        inner = entity_escaper(delimiter, self._mode)(value)
+        if inner:
+            self._parts.append(f"{delimiter}{inner}{delimiter}")
+        return self
+
+    def bold(self, value: Any) -> "MessageBuilder":
+        return self._entity("bold", value)
+
+    def italic(self, value: Any) -> "MessageBuilder":
+        return self._entity("italic", value)
+
+    def code(self, value: Any) -> "MessageBuilder":
+        return self._entity("code", value)
+
+    def link(self, label: Any, url: str) -> "MessageBuilder":
+        """Add a link; falls back to the label when it is empty after escaping."""
+        if self._mode == MARKDOWN_V2:
+            label_text = escape(label, MARKDOWN_V2)
+            url_text = str(url).translate(_V2_URL_TABLE)
+        else:
+            # Nothing can be escaped inside a legacy link
+            label_text = str(label).replace("]", "")
+            url_text = str(url).replace(")", "%29")
+        if label_text and url_text:
+            self._parts.append(f"[{label_text}]({url_text})")
+        else:
+            self.text(label)
+        return self
+
+    def line(self) -> "MessageBuilder":
+        """End the current line."""
+        self._parts.append("\n")
+        return self
+
+    def build(self) -> str:
+        return "".join(self._parts)
+
+    def __str__(self) -> str:
+        return self.build()
@@ -6,13 +6,14 @@ Unified messaging utilities for the Meta Game bot.
 """
 
 import logging
-import re
 from typing import Optional, Dict, Any, List, Union, Tuple
 
 from telegram import Update, InlineKeyboardMarkup, Message, InlineKeyboardButton, Bot
 from telegram.ext import ContextTypes
 from telegram.error import BadRequest, TimedOut, TelegramError
 
+from utils.markdown import check_entities, split_message, strip_markdown
+
 # Initialize logger
 logger = logging.getLogger(__name__)
 
@@ -49,10 +50,12 @@ async def send_message(
     # Clean up Markdown to avoid parsing errors
     text, parse_mode = await fixup_message_text(text, parse_mode)
 
-    # Safely truncate text if it's too long
+    # Send long text as several messages instead of truncating it
     if len(text) > MAX_MESSAGE_LENGTH:
-        logger.warning(f"Message too long ({len(text)} chars), truncating")
-        text = text[:MAX_MESSAGE_LENGTH - 3] + "..."
+        chunks = split_message(text, MAX_MESSAGE_LENGTH, parse_mode)
+        logger.info(f"Message too long ({len(text)} chars), sending as {len(chunks)} messages")
+        return await send_chunks(update, chunks, keyboard, parse_mode, context,
+                                 disable_web_page_preview, chat_id, reply_to_message_id)
 
     try:
         if update.callback_query:
@@ -107,11 +110,11 @@ async def send_message(
                 except Exception as new_msg_error:
                     logger.error(f"Failed to send new message: {new_msg_error}")
         elif "can't parse entities" in error_text:
-            # Parsing mode error, try without parse_mode
-            logger.warning(f"Parse mode error, trying without formatting: {e}")
+            # fixup_message_text validates entities before sending, so this means the validator missed a case
+            logger.error(f"Telegram rejected validated {parse_mode} text: {e}")
             return await send_message(
                 update,
-                text,
+                strip_markdown(text, parse_mode) if parse_mode and parse_mode.lower() != "html" else text,
                 keyboard=keyboard,
                 parse_mode=None,
                 context=context,
@@ -146,6 +149,57 @@ async def send_message(
     return None
 
 
+async def send_chunks(
+        update: Update,
+        chunks: List[str],
+        keyboard: Optional[InlineKeyboardMarkup] = None,
+        parse_mode: Optional[str] = "Markdown",
+        context: Optional[ContextTypes.DEFAULT_TYPE] = None,
+        disable_web_page_preview: bool = True,
+        chat_id: Optional[int] = None,
+        reply_to_message_id: Optional[int] = None
+) -> Optional[Message]:
+    """
+    Send consecutive parts of one long message. The first part replaces the
+    callback's message, the rest follow it, and the keyboard goes on the last.
+    Returns the last message sent.
+    """
+    message = await send_message(
+        update,
+        chunks[0],
+        keyboard=keyboard if len(chunks) == 1 else None,
+        parse_mode=parse_mode,
+        context=context,
+        disable_web_page_preview=disable_web_page_preview,
+        chat_id=chat_id,
+        reply_to_message_id=reply_to_message_id
+    )
+    if len(chunks) == 1:
+        return message
+
+    if not chat_id and update.effective_chat:
+        chat_id = update.effective_chat.id
+    if not chat_id:
+        logger.error(f"No chat ID available to send the remaining {len(chunks) - 1} parts of a message")
+        return message
+
+    bot = context.bot if context else update.get_bot()
+    for i, chunk in enumerate(chunks[1:], start=2):
+        chunk, chunk_parse_mode = await fixup_message_text(chunk, parse_mode)
+        try:
+            message = await bot.send_message(
+                chat_id=chat_id,
+                text=chunk,
+                parse_mode=chunk_parse_mode,
+                reply_markup=keyboard if i == len(chunks) else None,
+                disable_web_page_preview=disable_web_page_preview
+            )
+        except TelegramError as e:
+            logger.error(f"Error sending part {i}/{len(chunks)} of a message: {e}")
+            return message
+    return message
+
+
 async def edit_or_reply(
         update: Update,
         text: str,
@@ -191,25 +245,17 @@ async def answer_callback(
 async def fixup_message_text(text: str, parse_mode: Optional[str]) -> Tuple[str, Optional[str]]:
     """
     Fix up message text to avoid formatting issues.
+
+    Markdown is validated in one pass before sending; text that would not
+    parse is sent as plain text rather than rejected by Telegram.
     """
     if not parse_mode:
         return text, None
 
-    # Try to detect unclosed formatting
-    if parse_mode.lower() == "markdown":
-        # Check for unclosed formatting markers
-        marker_counts = {
-            '*': text.count('*'),
-            '_': text.count('_'),
-            '`': text.count('`'),
-            '[': text.count('['),
-            ']': text.count(']')
-        }
-
-        if marker_counts['*'] % 2 != 0 or marker_counts['_'] % 2 != 0 or marker_counts['`'] % 2 != 0 or marker_counts[
-            '['] != marker_counts[']']:
-            # Unbalanced formatting, escape the problematic characters
-            return await escape_markdown(text), None
+    if parse_mode.lower() in ("markdown", "markdownv2"):
+        if not check_entities(text, parse_mode):
+            logger.warning(f"Unbalanced {parse_mode} entities, sending as plain text")
+            return strip_markdown(text, parse_mode), None
 
     elif parse_mode.lower() == "html":
         # Simple check for unbalanced HTML tags
@@ -219,16 +265,6 @@ async def fixup_message_text(text: str, parse_mode: Optional[str]) -> Tuple[str,
     return text, parse_mode
 
 
-async def escape_markdown(text: str) -> str:
-    """Escape special characters for Markdown formatting."""
-    if not text:
-        return ""
-
-    # Escape special Markdown characters
-    escape_chars = r'_*`[]()~>#+-=|{}.!'
-    return re.sub(r'([{}])'.format(re.escape(escape_chars)), r'\\\1', text)
-
-
 async def escape_html(text: str) -> str:
     """Escape special characters for HTML formatting."""
     if not text:
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Compact binary translation catalogs loaded through mmap.
+
+The build step compiles translations/<lang>.json into translations/<lang>.cat,
+a read-only open-addressing hash table of UTF-8 strings. Loading one is just
+an mmap: nothing is parsed up front, strings are decoded on first lookup, and
+every worker process maps the same pages from the page cache.
+
+Build with:
+    python -m utils.mmap_catalog [translations_dir]
+
+File layout (little endian):
+    header   magic (8s), entry count (I), slot count (I), strings offset (I)
+    slots    slot count x (hash I, key offset I, key length I, value offset I, value length I)
+    strings  UTF-8 keys and values
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import zlib
+from typing import Dict, Iterator, Mapping, Optional
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+MAGIC = b"MGCAT\x00\x01\x00"
+CATALOG_SUFFIX = ".cat"
+
+_HEADER = struct.Struct("<8sIII")
+_SLOT = struct.Struct("<IIIII")
+_EMPTY = 0xFFFFFFFF
+
+
+def _slot_count(entries: int) -> int:
+    """Power of two keeping the load factor at or below one half."""
+    size = 8
+    while size < entries * 2:
+        size *= 2
+    return size
+
+
+def build_catalog_bytes(translations: Mapping[str, str]) -> bytes:
+    """Serialize a key -> text mapping into the binary catalog format."""
+    items = [(key.encode("utf-8"), value.encode("utf-8")) for key, value in translations.items() if value]
+    nslots = _slot_count(len(items))
+    mask = nslots - 1
+    slots = [(0, _EMPTY, 0, 0, 0)] * nslots
+
+    strings_offset = _HEADER.size + nslots * _SLOT.size
+    blob = bytearray()
+    for key, value in items:
+        key_offset = strings_offset + len(blob)
+        blob += key
+        value_offset = strings_offset + len(blob)
+        blob += value
+
+        key_hash = zlib.crc32(key)
+        index = key_hash & mask
+        while slots[index][1] != _EMPTY:
+            index = (index + 1) & mask
+        slots[index] = (key_hash, key_offset, len(key), value_offset, len(value))
+
+    parts = [_HEADER.pack(MAGIC, len(items), nslots, strings_offset)]
+    parts.extend(_SLOT.pack(*slot) for slot in slots)
+    parts.append(bytes(blob))
+    return b"".join(parts)
+
+
+def write_catalog(translations: Mapping[str, str], path: str) -> None:
+    """Write a binary catalog atomically, so readers never see a partial file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(build_catalog_bytes(translations))
+    # Processes that already mapped the old file keep their pages
+    os.replace(tmp_path, path)
+
+
+def compiled_path(json_path: str) -> str:
+    """Path of the binary catalog built from a JSON catalog."""
+    return os.path.splitext(json_path)[0] + CATALOG_SUFFIX
+
+
+def is_fresh(json_path: str) -> bool:
+    """Check whether the binary catalog exists and is at least as new as its JSON source."""
+    cat_path = compiled_path(json_path)
+    if not os.path.exists(cat_path):
+        return False
+    if not os.path.exists(json_path):
+        return True
+    return os.path.getmtime(cat_path) >= os.path.getmtime(json_path)
+
+
+class MappedCatalog(Mapping):
+    """Read-only mapping over a memory-mapped binary catalog."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            # An empty or truncated file can't even hold the header (and an empty one can't be mapped)
+            if size < _HEADER.size:
+                raise ValueError(f"{path} is not a translation catalog: {size} bytes")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self._count, self._nslots, strings_offset = _HEADER.unpack_from(self._mm, 0)
+        # A slot table that doesn't fit the file would be read past its end
+        valid = (magic == MAGIC and self._nslots and self._nslots & (self._nslots - 1) == 0
+                 and self._count <= self._nslots
+                 and strings_offset == _HEADER.size + self._nslots * _SLOT.size <= size)
+        if not valid:
+            self._mm.close()
+            raise ValueError(f"{path} is not a translation catalog")
+        self._mask = self._nslots - 1
+
+    def _lookup(self, key: bytes) -> Optional[bytes]:
+        mm = self._mm
+        key_hash = zlib.crc32(key)
+        index = key_hash & self._mask
+        key_len = len(key)
+        while True:
+            slot_hash, key_offset, slot_key_len, value_offset, value_len = _SLOT.unpack_from(
+                mm, _HEADER.size + index * _SLOT.size
+            )
+            if key_offset == _EMPTY:
+                return None
+            if (slot_hash == key_hash and slot_key_len == key_len
+                    and mm[key_offset:key_offset + key_len] == key):
+                return mm[value_offset:value_offset + value_len]
+            index = (index + 1) & self._mask
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        value = self._lookup(key.encode("utf-8"))
+        return default if value is None else value.decode("utf-8")
+
+    def __getitem__(self, key: str) -> str:
+        value = self._lookup(key.encode("utf-8"))
+        if value is None:
+            raise KeyError(key)
+        return value.decode("utf-8")
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._lookup(key.encode("utf-8")) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        mm = self._mm
+        for index in range(self._nslots):
+            _hash, key_offset, key_len, _value_offset, _value_len = _SLOT.unpack_from(
+                mm, _HEADER.size + index * _SLOT.size
+            )
+            if key_offset != _EMPTY:
+                yield mm[key_offset:key_offset + key_len].decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+def build_directory(translations_dir: str) -> Dict[str, int]:
+    """Compile every <lang>.json in a directory. Returns entries written per file."""
+    written = {}
+    for name in sorted(os.listdir(translations_dir)):
+        if not name.endswith(".json"):
+            continue
+        json_path = os.path.join(translations_dir, name)
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            logger.warning(f"Skipping {json_path}: not a key/value catalog")
+            continue
+        write_catalog(data, compiled_path(json_path))
+        written[name] = len(data)
+    return written
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    target = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "translations"
+    )
+    for catalog_name, count in build_directory(target).items():
+        logger.info(f"Compiled {catalog_name}: {count} strings")
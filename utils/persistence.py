@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Disk-backed persistence for user context and PTB conversation state.
+
+Everything lives in a single SQLite file. Writes are collected in memory and
+flushed in batches from a worker thread so the event loop never waits on
+disk I/O; reads happen lazily, one user at a time, on first access.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Dict, Optional, Tuple
+
+from telegram.ext import BasePersistence, PersistenceInput
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = "data/meta_game.sqlite3"
+DEFAULT_FLUSH_INTERVAL = 5  # seconds
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS user_context (
+    user_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ptb_data (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, key)
+);
+CREATE TABLE IF NOT EXISTS ptb_conversations (
+    name TEXT NOT NULL,
+    key TEXT NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY (name, key)
+);
+"""
+
+# Sentinel marking a pending delete in the write buffer
+_DELETED = object()
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value for storage, stringifying anything JSON can't handle."""
+    return json.dumps(value, default=str, ensure_ascii=False)
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    """Open a SQLite connection usable from the flush worker thread."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+class ContextStore:
+    """SQLite store for context_manager data with batched, asynchronous writes."""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, max_age: Optional[float] = None):
+        self.path = path
+        # Rows older than this are treated as expired on load
+        self.max_age = max_age
+        self._conn = _connect(path)
+        # Serializes access to the connection between the loop and the worker
+        self._db_lock = threading.Lock()
+        # user_id -> data dict (or _DELETED) waiting to be written
+        self._pending: Dict[str, Any] = {}
+        self._pending_lock = threading.Lock()
+
+    def load(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Load one user's context from disk, or None if absent or expired."""
+        with self._pending_lock:
+            pending = self._pending.get(user_id)
+        if pending is _DELETED:
+            return None
+        if pending is not None:
+            return dict(pending)
+
+        try:
+            with self._db_lock:
+                row = self._conn.execute(
+                    "SELECT data, updated_at FROM user_context WHERE user_id = ?",
+                    (user_id,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Error loading context for user {user_id}: {e}")
+            return None
+
+        if not row:
+            return None
+
+        data, updated_at = row
+        if self.max_age is not None and time.time() - updated_at > self.max_age:
+            return None
+
+        try:
+            return json.loads(data)
+        except ValueError as e:
+            logger.warning(f"Discarding unreadable context for user {user_id}: {e}")
+            return None
+
+    def mark_dirty(self, user_id: str, data: Mapping) -> None:
+        """Queue a user's context for the next flush; it is serialized at flush time."""
+        with self._pending_lock:
+            self._pending[user_id] = data
+
+    def mark_deleted(self, user_id: str) -> None:
+        """Queue a user's context for deletion on the next flush."""
+        with self._pending_lock:
+            self._pending[user_id] = _DELETED
+
+    def pending_count(self) -> int:
+        """Get the number of users waiting to be flushed."""
+        return len(self._pending)
+
+    def _take_batch(self) -> Tuple[Dict[str, Any], list, list]:
+        """Swap out the pending changes and serialize them."""
+        with self._pending_lock:
+            batch, self._pending = self._pending, {}
+
+        now = time.time()
+        upserts = []
+        deletes = []
+        for user_id, data in batch.items():
+            if data is _DELETED:
+                deletes.append((user_id,))
+            else:
+                upserts.append((user_id, _dumps(dict(data)), now))
+        return batch, upserts, deletes
+
+    def _write(self, batch: Dict[str, Any], upserts: list, deletes: list) -> int:
+        """Write one serialized batch in a single transaction."""
+        if not batch:
+            return 0
+
+        try:
+            with self._db_lock:
+                self._conn.execute("BEGIN")
+                if upserts:
+                    self._conn.executemany(
+                        "INSERT INTO user_context (user_id, data, updated_at) VALUES (?, ?, ?) "
+                        "ON CONFLICT(user_id) DO UPDATE SET data = excluded.data, "
+                        "updated_at = excluded.updated_at",
+                        upserts
+                    )
+                if deletes:
+                    self._conn.executemany("DELETE FROM user_context WHERE user_id = ?", deletes)
+                self._conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.error(f"Error flushing user contexts: {e}")
+            try:
+                self._conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            # Put the batch back without clobbering newer writes
+            with self._pending_lock:
+                for user_id, data in batch.items():
+                    self._pending.setdefault(user_id, data)
+            return 0
+
+        return len(batch)
+
+    def flush(self) -> int:
+        """Write all pending changes in one transaction. Returns rows written."""
+        return self._write(*self._take_batch())
+
+    async def flush_async(self) -> int:
+        """Flush pending changes, doing the disk write from a worker thread."""
+        # Serialize on the loop so live contexts aren't read from another thread
+        return await asyncio.to_thread(self._write, *self._take_batch())
+
+    def purge_expired(self) -> int:
+        """Delete rows older than max_age. Returns the number of rows removed."""
+        if self.max_age is None:
+            return 0
+
+        try:
+            with self._db_lock:
+                cursor = self._conn.execute(
+                    "DELETE FROM user_context WHERE updated_at < ?",
+                    (time.time() - self.max_age,)
+                )
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Error purging expired contexts: {e}")
+            return 0
+
+    def close(self) -> None:
+        """Flush remaining changes and close the connection."""
+        self.flush()
+        with self._db_lock:
+            self._conn.close()
+
+
+async def flush_task(store: ContextStore, interval: float = DEFAULT_FLUSH_INTERVAL):
+    """Periodically flush the context store, or any store with flush_async() such as the Redis backend."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            written = await store.flush_async()
+            if written:
+                logger.debug(f"Flushed {written} user contexts")
+        except Exception as e:
+            logger.error(f"Error in context flush task: {e}")
+
+
+class SQLitePersistence(BasePersistence):
+    """
+    PTB persistence backed by the same SQLite file as the context store.
+
+    Updates issued by the application during one persistence cycle are
+    buffered and written together in a single transaction.
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, update_interval: float = 60):
+        super().__init__(
+            # User data lives in context_manager (see GameContext), so PTB doesn't keep a copy
+            store_data=PersistenceInput(bot_data=True, chat_data=True, user_data=False, callback_data=False),
+            update_interval=update_interval
+        )
+        self.path = path
+        self._conn = _connect(path)
+        self._db_lock = threading.Lock()
+        # (kind, key) -> serialized data, or None for a delete
+        self._pending_data: Dict[Tuple[str, str], Optional[str]] = {}
+        # (name, key) -> serialized state, or None for a delete
+        self._pending_conversations: Dict[Tuple[str, str], Optional[str]] = {}
+        self._flush_scheduled: Optional[asyncio.Task] = None
+
+    def _read_data(self, kind: str) -> Dict[str, Any]:
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT key, data FROM ptb_data WHERE kind = ?", (kind,)
+            ).fetchall()
+        return {key: json.loads(data) for key, data in rows}
+
+    def _write_batch(
+        self,
+        data: Dict[Tuple[str, str], Optional[str]],
+        conversations: Dict[Tuple[str, str], Optional[str]]
+    ) -> None:
+        with self._db_lock:
+            self._conn.execute("BEGIN")
+            try:
+                for (kind, key), value in data.items():
+                    if value is None:
+                        self._conn.execute("DELETE FROM ptb_data WHERE kind = ? AND key = ?", (kind, key))
+                    else:
+                        self._conn.execute(
+                            "INSERT OR REPLACE INTO ptb_data (kind, key, data) VALUES (?, ?, ?)",
+                            (kind, key, value)
+                        )
+                for (name, key), state in conversations.items():
+                    if state is None:
+                        self._conn.execute(
+                            "DELETE FROM ptb_conversations WHERE name = ? AND key = ?", (name, key)
+                        )
+                    else:
+                        self._conn.execute(
+                            "INSERT OR REPLACE INTO ptb_conversations (name, key, state) VALUES (?, ?, ?)",
+                            (name, key, state)
+                        )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    async def _flush_pending(self) -> None:
+        # Yield once so every update issued in the same cycle joins the batch
+        await asyncio.sleep(0)
+        self._flush_scheduled = None
+        data, self._pending_data = self._pending_data, {}
+        conversations, self._pending_conversations = self._pending_conversations, {}
+        if not data and not conversations:
+            return
+
+        try:
+            await asyncio.to_thread(self._write_batch, data, conversations)
+        except sqlite3.Error as e:
+            logger.error(f"Error writing persistence batch: {e}")
+            for key, value in data.items():
+                self._pending_data.setdefault(key, value)
+            for key, value in conversations.items():
+                self._pending_conversations.setdefault(key, value)
+
+    def _schedule_flush(self) -> None:
+        if self._flush_scheduled is None:
+            self._flush_scheduled = asyncio.create_task(self._flush_pending())
+
+    async def get_user_data(self) -> Dict[int, Dict[Any, Any]]:
+        return {int(key): value for key, value in (await asyncio.to_thread(self._read_data, "user")).items()}
+
+    async def get_chat_data(self) -> Dict[int, Dict[Any, Any]]:
+        return {int(key): value for key, value in (await asyncio.to_thread(self._read_data, "chat")).items()}
+
+    async def get_bot_data(self) -> Dict[Any, Any]:
+        return (await asyncio.to_thread(self._read_data, "bot")).get("bot", {})
+
+    async def get_callback_data(self) -> None:
+        return None
+
+    async def get_conversations(self, name: str) -> Dict[Tuple[Any, ...], object]:
+        def read():
+            with self._db_lock:
+                return self._conn.execute(
+                    "SELECT key, state FROM ptb_conversations WHERE name = ?", (name,)
+                ).fetchall()
+
+        rows = await asyncio.to_thread(read)
+        return {tuple(json.loads(key)): json.loads(state) for key, state in rows}
+
+    async def update_conversation(self, name: str, key: Tuple[Any, ...], new_state: Optional[object]) -> None:
+        self._pending_conversations[(name, json.dumps(list(key)))] = (
+            None if new_state is None else _dumps(new_state)
+        )
+        self._schedule_flush()
+
+    async def update_user_data(self, user_id: int, data: Dict[Any, Any]) -> None:
+        self._pending_data[("user", str(user_id))] = _dumps(data)
+        self._schedule_flush()
+
+    async def update_chat_data(self, chat_id: int, data: Dict[Any, Any]) -> None:
+        self._pending_data[("chat", str(chat_id))] = _dumps(data)
+        self._schedule_flush()
+
+    async def update_bot_data(self, data: Dict[Any, Any]) -> None:
+        self._pending_data[("bot", "bot")] = _dumps(data)
+        self._schedule_flush()
+
+    async def update_callback_data(self, data: Any) -> None:
+        pass
+
+    async def drop_chat_data(self, chat_id: int) -> None:
+        self._pending_data[("chat", str(chat_id))] = None
+        self._schedule_flush()
+
+    async def drop_user_data(self, user_id: int) -> None:
+        self._pending_data[("user", str(user_id))] = None
+        self._schedule_flush()
+
+    async def refresh_user_data(self, user_id: int, user_data: Dict[Any, Any]) -> None:
+        pass
+
+    async def refresh_chat_data(self, chat_id: int, chat_data: Dict[Any, Any]) -> None:
+        pass
+
+    async def refresh_bot_data(self, bot_data: Dict[Any, Any]) -> None:
+        pass
+
+    async def flush(self) -> None:
+        if self._flush_scheduled is not None:
+            await self._flush_scheduled
+        await self._flush_pending()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Shared context backend speaking the Redis protocol (RESP).
+
+Lets several bot workers share user contexts. Each user is one hash keyed by
+telegram_id; values are JSON-encoded and the key expires after the usual
+context timeout, so Redis takes care of cleanup.
+"""
+
+import asyncio
+import json
+import logging
+import socket
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+from utils.context_manager import ContextBackend, USER_CONTEXT_TIMEOUT
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_KEY_PREFIX = "meta_game:ctx:"
+# A prefetched context is served locally while used at least this often
+DEFAULT_NEAR_CACHE_TTL = 5.0  # seconds
+DEFAULT_MAX_CACHED = 1024
+
+
+class RespError(Exception):
+    """Error reply returned by the server."""
+    pass
+
+
+def _encode_command(args: Sequence[Any]) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, bytes):
+            data = arg
+        else:
+            data = str(arg).encode("utf-8")
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+class RespClient:
+    """Minimal synchronous RESP client with pipelining and one automatic reconnect."""
+
+    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0,
+                 password: Optional[str] = None, timeout: float = 2.0):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 2.0) -> "RespClient":
+        """Create a client from a redis://[:password@]host:port/db URL."""
+        parsed = urlparse(url)
+        db = int(parsed.path.lstrip("/") or 0)
+        return cls(parsed.hostname or "localhost", parsed.port or 6379, db, parsed.password, timeout)
+
+    def _connect(self) -> None:
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._sock.makefile("rb")
+
+        setup = []
+        if self.password:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", self.db))
+        if setup:
+            self._roundtrip(setup)
+
+    def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = None
+        self._reader = None
+
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by server")
+
+        prefix, payload = line[:1], line[1:-2]
+        if prefix == b"+":
+            return payload.decode("utf-8")
+        if prefix == b"-":
+            return RespError(payload.decode("utf-8"))
+        if prefix == b":":
+            return int(payload)
+        if prefix == b"$":
+            length = int(payload)
+            if length == -1:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if prefix == b"*":
+            length = int(payload)
+            if length == -1:
+                return None
+            return [self._read_reply() for _ in range(length)]
+
+        raise ConnectionError(f"Unexpected reply prefix: {prefix!r}")
+
+    def _roundtrip(self, commands: Sequence[Sequence[Any]]) -> List[Any]:
+        self._sock.sendall(b"".join(_encode_command(command) for command in commands))
+        return [self._read_reply() for _ in commands]
+
+    def pipeline(self, commands: Sequence[Sequence[Any]]) -> List[Any]:
+        """Send several commands in one write and read all replies."""
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    replies = self._roundtrip(commands)
+                    break
+                except (OSError, ConnectionError) as e:
+                    self._close()
+                    if attempt:
+                        raise
+                    logger.warning(f"Context backend connection lost, reconnecting: {e}")
+
+        for reply in replies:
+            if isinstance(reply, RespError):
+                raise reply
+        return replies
+
+    def execute(self, *args: Any) -> Any:
+        """Send one command and return its reply."""
+        return self.pipeline([args])[0]
+
+
+def _decode(value: Optional[str]) -> Any:
+    return None if value is None else json.loads(value)
+
+
+def _encode(value: Any) -> str:
+    return json.dumps(value, default=str, ensure_ascii=False)
+
+
+class RespContextBackend(ContextBackend):
+    """
+    Context backend storing each user as a hash on a Redis-compatible server.
+
+    The client blocks, so nothing on the hot path talks to the server from
+    the event loop: prefetch() loads a user's whole hash from a worker thread
+    when an update comes in, reads are then served from that local copy, and
+    writes are applied to it and queued for flush_async() to send in one
+    pipeline. Only reading a user who wasn't prefetched still blocks.
+    """
+
+    def __init__(self, client: RespClient, key_prefix: str = DEFAULT_KEY_PREFIX,
+                 ttl: int = USER_CONTEXT_TIMEOUT, near_cache_ttl: float = DEFAULT_NEAR_CACHE_TTL,
+                 max_cached: int = DEFAULT_MAX_CACHED):
+        self.client = client
+        self.key_prefix = key_prefix
+        self.ttl = ttl
+        self.near_cache_ttl = near_cache_ttl
+        self.max_cached = max_cached
+        # user_id -> [expires_at, {field: encoded value}], least recently used first
+        self._near_cache: "OrderedDict[str, List[Any]]" = OrderedDict()
+        # user_id -> write operations not yet sent, in order
+        self._pending: Dict[str, List[Tuple[Any, ...]]] = {}
+        self._pending_lock = threading.Lock()
+        # Held while fetching or flushing, so a fetch never misses writes taken for a flush
+        self._io_lock = threading.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RespContextBackend":
+        return cls(RespClient.from_url(url), **kwargs)
+
+    def _key(self, user_id: str) -> str:
+        return self.key_prefix + user_id
+
+    def _cached(self, user_id: str) -> Optional[Dict[str, str]]:
+        entry = self._near_cache.get(user_id)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if entry[0] < now:
+            del self._near_cache[user_id]
+            return None
+        entry[0] = now + self.near_cache_ttl
+        self._near_cache.move_to_end(user_id)
+        return entry[1]
+
+    def _cache(self, user_id: str, fields: Dict[str, str]) -> Dict[str, str]:
+        self._near_cache[user_id] = [time.monotonic() + self.near_cache_ttl, fields]
+        self._near_cache.move_to_end(user_id)
+        while len(self._near_cache) > self.max_cached:
+            self._near_cache.popitem(last=False)
+        return fields
+
+    def _fetch(self, user_id: str) -> Dict[str, str]:
+        """Read a user's hash, with any writes still queued for it applied on top."""
+        name = self._key(user_id)
+        with self._io_lock:
+            flat, _ = self.client.pipeline([
+                ("HGETALL", name),
+                ("EXPIRE", name, self.ttl),
+            ])
+            fields = {flat[i].decode("utf-8"): flat[i + 1].decode("utf-8") for i in range(0, len(flat), 2)}
+            with self._pending_lock:
+                for op in self._pending.get(user_id, ()):
+                    _apply(fields, op)
+        return fields
+
+    def _load(self, user_id: str) -> Dict[str, str]:
+        fields = self._cached(user_id)
+        if fields is None:
+            # Not prefetched: the one read that blocks
+            fields = self._cache(user_id, self._fetch(user_id))
+        return fields
+
+    def _queue(self, user_id: str, op: Tuple[Any, ...]) -> None:
+        fields = self._cached(user_id)
+        if fields is not None:
+            _apply(fields, op)
+        with self._pending_lock:
+            self._pending.setdefault(user_id, []).append(op)
+
+    async def prefetch(self, user_id: str) -> None:
+        if user_id in self._pending and self._cached(user_id) is not None:
+            # Our own queued writes are newer than the server's copy
+            return
+        self._cache(user_id, await asyncio.to_thread(self._fetch, user_id))
+
+    def get(self, user_id: str, key: str, default: Any = None) -> Any:
+        fields = self._load(user_id)
+        # A stored None is a value, as in the in-memory backend
+        return _decode(fields[key]) if key in fields else default
+
+    def get_many(self, user_id: str, keys: Iterable[str]) -> Dict[str, Any]:
+        fields = self._load(user_id)
+        return {key: _decode(fields[key]) for key in keys if key in fields}
+
+    def set(self, user_id: str, key: str, value: Any) -> None:
+        self.set_many(user_id, {key: value})
+
+    def set_many(self, user_id: str, values: Mapping) -> None:
+        if values:
+            self._queue(user_id, ("set", {key: _encode(value) for key, value in values.items()}))
+
+    def delete(self, user_id: str, key: str) -> None:
+        self._queue(user_id, ("delete", key))
+
+    def get_all(self, user_id: str) -> Mapping:
+        return MappingProxyType({key: _decode(value) for key, value in self._load(user_id).items()})
+
+    def set_all(self, user_id: str, data: Mapping) -> None:
+        self._queue(user_id, ("replace", {key: _encode(value) for key, value in data.items()}))
+
+    def clear(self, user_id: str) -> None:
+        self._queue(user_id, ("replace", {}))
+        self._near_cache.pop(user_id, None)
+
+    def evict(self, user_id: str) -> None:
+        self._near_cache.pop(user_id, None)
+
+    def size(self) -> int:
+        # Counting the server's keys means scanning them all; this is what this worker holds
+        return len(self._near_cache)
+
+    def pending_count(self) -> int:
+        """Get the number of users with writes waiting to be sent."""
+        return len(self._pending)
+
+    def flush(self) -> int:
+        """Send all queued writes in one pipeline. Returns the number of users written."""
+        with self._io_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+
+            commands: List[Sequence[Any]] = []
+            for user_id, ops in batch.items():
+                commands.extend(_commands(self._key(user_id), ops, self.ttl))
+            try:
+                self.client.pipeline(commands)
+            except (OSError, ConnectionError) as e:
+                logger.error(f"Error flushing user contexts: {e}")
+                # Put the batch back ahead of anything queued since
+                with self._pending_lock:
+                    for user_id, ops in batch.items():
+                        self._pending[user_id] = ops + self._pending.get(user_id, [])
+                return 0
+            except RespError as e:
+                # The server did run the batch; only some command in it failed
+                logger.error(f"Error reply while flushing user contexts: {e}")
+        return len(batch)
+
+    async def flush_async(self) -> int:
+        """Send queued writes from a worker thread."""
+        if not self._pending:
+            return 0
+        return await asyncio.to_thread(self.flush)
+
+    def close(self) -> None:
+        self.flush()
+        self.client.close()
+
+
+def _apply(fields: Dict[str, str], op: Tuple[Any, ...]) -> None:
+    """Apply one queued write to a local copy of a hash."""
+    kind, arg = op
+    if kind == "set":
+        fields.update(arg)
+    elif kind == "delete":
+        fields.pop(arg, None)
+    else:
+        fields.clear()
+        fields.update(arg)
+
+
+def _commands(name: str, ops: Sequence[Tuple[Any, ...]], ttl: int) -> List[Sequence[Any]]:
+    """Redis commands for a user's queued writes, in order."""
+    commands: List[Sequence[Any]] = []
+    for kind, arg in ops:
+        if kind == "delete":
+            commands.append(("HDEL", name, arg))
+            continue
+        if kind == "replace":
+            commands.append(("DEL", name))
+        if arg:
+            commands.append(("HSET", name, *(item for pair in arg.items() for item in pair)))
+            commands.append(("EXPIRE", name, ttl))
+    return commands
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Space-saving top-K counter.
+
+Counts how often items occur in an unbounded stream using at most `capacity`
+counters. Frequent items are always kept; when the table is full the least
+counted item is replaced and the newcomer inherits its count, which is then
+an upper bound with a known error (Metwally et al., "Efficient Computation of
+Frequent and Top-k Elements in Data Streams").
+"""
+
+import heapq
+import itertools
+from typing import Dict, Hashable, Iterator, List, Tuple
+
+
+class SpaceSaving:
+    """Bounded frequency counter keeping the heaviest hitters of a stream."""
+
+    def __init__(self, capacity: int = 1024):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: Dict[Hashable, int] = {}
+        self._errors: Dict[Hashable, int] = {}
+        # (count, sequence, item) entries; an entry is stale once the item's count moved on
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        self._sequence = itertools.count()
+
+    def add(self, item: Hashable, count: int = 1) -> bool:
+        """Count an occurrence of item. Returns True if the item was not being tracked."""
+        self.total += count
+        current = self._counts.get(item)
+        if current is not None:
+            self._counts[item] = current + count
+            self._push(current + count, item)
+            return False
+
+        error = 0
+        if len(self._counts) >= self.capacity:
+            # Replace the least counted item; the newcomer may have been it
+            error = self._pop_min()
+        self._counts[item] = error + count
+        self._errors[item] = error
+        self._push(error + count, item)
+        return True
+
+    def _push(self, count: int, item: Hashable) -> None:
+        heapq.heappush(self._heap, (count, next(self._sequence), item))
+        if len(self._heap) > 4 * self.capacity:
+            # Drop stale entries so the heap stays proportional to the table
+            self._heap = [(c, next(self._sequence), key) for key, c in self._counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> int:
+        while True:
+            count, _, item = heapq.heappop(self._heap)
+            if self._counts.get(item) == count:
+                del self._counts[item]
+                del self._errors[item]
+                return count
+
+    def discard(self, item: Hashable) -> None:
+        """Stop tracking item."""
+        if self._counts.pop(item, None) is not None:
+            del self._errors[item]
+
+    def count(self, item: Hashable) -> int:
+        """Estimated count of item (an upper bound), 0 if not tracked."""
+        return self._counts.get(item, 0)
+
+    def top(self, n: int = 0) -> List[Tuple[Hashable, int, int]]:
+        """(item, count, error) for the n most frequent items, or all of them, most frequent first."""
+        items = sorted(self._counts.items(), key=lambda entry: entry[1], reverse=True)
+        if n:
+            items = items[:n]
+        return [(item, count, self._errors[item]) for item, count in items]
+
+    def clear(self) -> None:
+        self.total = 0
+        self._counts.clear()
+        self._errors.clear()
+        self._heap.clear()
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._counts
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._counts))
+
+    def __len__(self) -> int:
+        return len(self._counts)
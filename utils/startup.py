@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Bot startup as a graph of init tasks.
+
+Each task names the tasks it needs and starts as soon as those are done, so
+independent steps (probing the database, loading translations, importing
+and registering the handlers, connecting to Telegram) overlap instead of
+running one after another. Blocking steps run in a thread so they don't hold
+up the rest. When the graph finishes, a timing report is logged; the cold
+start itself is measured up to the first update the bot handles.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from telegram import Update
+from telegram.ext import Application, ContextTypes, TypeHandler
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+# Runs before the middleware (group -1)
+FIRST_UPDATE_GROUP = -2
+
+
+class StartupGraph:
+    """Init tasks with dependencies, run concurrently and timed."""
+
+    def __init__(self, started_at: Optional[float] = None):
+        # Timings are relative to started_at, e.g. the process start
+        self.started_at = time.perf_counter() if started_at is None else started_at
+        self.results: Dict[str, Any] = {}
+        # name -> (start offset, duration) in seconds
+        self.timings: Dict[str, Tuple[float, float]] = {}
+        self._tasks: Dict[str, Tuple[Callable[[], Any], Tuple[str, ...], bool]] = {}
+
+    def add(self, name: str, func: Callable[[], Any], needs: Iterable[str] = (), blocking: bool = False) -> None:
+        """Add a task: a coroutine function, or with blocking=True a plain function run in a thread."""
+        if name in self._tasks:
+            raise ValueError(f"Startup task {name!r} is already defined")
+        self._tasks[name] = (func, tuple(needs), blocking)
+
+    def _check(self) -> None:
+        for name, (_func, needs, _blocking) in self._tasks.items():
+            for need in needs:
+                if need not in self._tasks:
+                    raise ValueError(f"Startup task {name!r} needs unknown task {need!r}")
+
+        done = set()
+        visiting = set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Startup tasks depend on each other in a cycle through {name!r}")
+            visiting.add(name)
+            for need in self._tasks[name][1]:
+                visit(need)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self._tasks:
+            visit(name)
+
+    async def _run_task(self, name: str, futures: Dict[str, "asyncio.Task[Any]"]) -> Any:
+        func, needs, blocking = self._tasks[name]
+        if needs:
+            await asyncio.gather(*(futures[need] for need in needs))
+
+        start = time.perf_counter()
+        try:
+            result = await asyncio.to_thread(func) if blocking else await func()
+        finally:
+            self.timings[name] = (start - self.started_at, time.perf_counter() - start)
+        self.results[name] = result
+        return result
+
+    async def run(self) -> Dict[str, Any]:
+        """Run every task once its dependencies are done. The first failure cancels the rest."""
+        self._check()
+        futures: Dict[str, "asyncio.Task[Any]"] = {}
+        for name in self._tasks:
+            futures[name] = asyncio.create_task(self._run_task(name, futures), name=f"startup:{name}")
+
+        try:
+            await asyncio.gather(*futures.values())
+        except BaseException:
+            for future in futures.values():
+                future.cancel()
+            await asyncio.gather(*futures.values(), return_exceptions=True)
+            raise
+
+        logger.info(self.report())
+        return self.results
+
+    def report(self) -> str:
+        """Start and duration of each task, in the order they started."""
+        lines = ["Startup timing (ms since start):"]
+        for name, (start, duration) in sorted(self.timings.items(), key=lambda item: item[1][0]):
+            lines.append(f"  {name:<16} {start * 1000:8.0f} +{duration * 1000:7.0f}")
+        if self.timings:
+            ready = max(start + duration for start, duration in self.timings.values())
+            lines.append(f"  {'ready':<16} {ready * 1000:8.0f}")
+        return "\n".join(lines)
+
+
+def track_first_update(application: Application, started_at: float) -> None:
+    """Log the time from started_at to the first update the handlers see: the cold-start time."""
+    state = {"seen": False}
+
+    async def first_update(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        if not state["seen"]:
+            state["seen"] = True
+            logger.info(f"Cold start: first update handled {(time.perf_counter() - started_at) * 1000:.0f} ms "
+                        f"after start")
+
+    application.add_handler(TypeHandler(Update, first_update), FIRST_UPDATE_GROUP)
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Compiled message templates.
+
+A template describes a whole message: layout, translatable text, loops and
+conditionals. It is compiled once per language into a Python function, so
+rendering a message is a single call instead of a chain of _() lookups,
+.format() calls and string concatenation.
+
+Syntax:
+    {% trans %}Text with {field}s{% endtrans %}
+        Translated at compile time. The {field} placeholders use str.format
+        syntax (the text is the existing translation key) and are filled
+        from the context.
+    {{ expression }}
+        A Python expression over the context. Filters: {{ value|t }}
+        translates the value, {{ values|join }} joins with ", ",
+        {{ value|raw }} skips escaping.
+    {% if expression %} ... {% elif expression %} ... {% else %} ... {% endif %}
+    {% for name in expression %} ... {% endfor %}
+
+Helper functions passed to MessageTemplate(helpers=...) can be called from
+expressions; everything else comes from the render context.
+
+Text outside trans blocks is emitted as is. Every field is escaped for
+Telegram's Markdown parse mode: outside an entity the special characters
+are backslash-escaped, inside *bold*, _italic_ or `code` the character that
+would close the entity is dropped. Entity state is tracked through the
+literal text of each block, so an entity has to open and close in the same
+block. Attribute access reads mapping keys too, so item.name works on dicts.
+"""
+
+import ast
+import collections.abc
+import logging
+import re
+import string
+import weakref
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from utils.i18n_core import _, add_reload_listener, SUPPORTED_LANGUAGES, DEFAULT_LANGUAGE
+from utils.markdown import ENTITY_CHARS, entity_escaper, entity_state, escape_markdown
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+_TAG = re.compile(r"\{\{(.*?)\}\}|\{%\s*(.*?)\s*%\}", re.S)
+_END_TRANS = re.compile(r"\{%\s*endtrans\s*%\}")
+_FOR = re.compile(r"^(.+?)\s+in\s+(.+)$", re.S)
+_FILTER = re.compile(r"\|\s*(\w+)\s*$")
+_FIELD_PATH = re.compile(r"^[A-Za-z]\w*(\.\w+)*$")
+
+FILTERS = ("raw", "t", "join")
+
+# Builtins available to template expressions
+_SAFE_BUILTINS = {
+    name: __builtins__[name] if isinstance(__builtins__, dict) else getattr(__builtins__, name)
+    for name in ("abs", "all", "any", "ascii", "bool", "enumerate", "float", "format", "int", "len", "list",
+                 "map", "max", "min", "range", "repr", "reversed", "round", "sorted", "str", "sum", "zip")
+}
+
+_formatter = string.Formatter()
+
+
+class TemplateSyntaxError(ValueError):
+    """Malformed message template."""
+    pass
+
+
+_ENTITY_ESCAPERS = {char: entity_escaper(char) for char in ENTITY_CHARS}
+# Names the escapers are bound to in generated code
+_ESCAPER_NAMES = {None: "_escape", "_": "_escape_italic", "*": "_escape_bold", "`": "_escape_code"}
+
+# Distinct values a compiled template memoizes translations of
+TRANSLATION_CACHE_SIZE = 256
+
+
+def _lookup(obj: Any, name: str) -> Any:
+    """Attribute access that reads mapping keys first."""
+    if obj.__class__ is dict or isinstance(obj, collections.abc.Mapping):
+        if name in obj:
+            return obj[name]
+    return getattr(obj, name, None)
+
+
+def _split_filters(expression: str) -> Tuple[str, List[str]]:
+    """Split trailing |filter names off an expression."""
+    expression = expression.strip()
+    filters: List[str] = []
+    while True:
+        match = _FILTER.search(expression)
+        if match is None or match.group(1) not in FILTERS:
+            return expression, filters
+        filters.insert(0, match.group(1))
+        expression = expression[:match.start()].strip()
+
+
+def _parse_bindings(text: str) -> List[Tuple[str, str, List[str]]]:
+    """Parse the name=expression pairs of a trans tag."""
+    parts, depth, start, quote = [], 0, 0, None
+    for i, char in enumerate(text):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+
+    bindings = []
+    for part in parts:
+        if not part.strip():
+            continue
+        name, sep, expression = part.partition("=")
+        name = name.strip()
+        if not sep or not name.isidentifier() or name.startswith("_"):
+            raise TemplateSyntaxError(f"Invalid trans binding: {part.strip()}")
+        bindings.append((name,) + _split_filters(expression))
+    return bindings
+
+
+# Parse tree nodes: ("text", str), ("expr", source, filters), ("trans", msgid, bindings),
+# ("if", [(condition, body), ...], else_body), ("for", target, iterable, body)
+
+def _parse(source: str) -> List[tuple]:
+    """Parse template source into a node tree."""
+    root: List[tuple] = []
+    # Open blocks: (kind, node data, current body)
+    stack: List[Tuple[str, Any, List[tuple]]] = []
+    body = root
+    pos = 0
+
+    while True:
+        match = _TAG.search(source, pos)
+        if match is None:
+            break
+        if match.start() > pos:
+            body.append(("text", source[pos:match.start()]))
+        pos = match.end()
+
+        expression, statement = match.group(1), match.group(2)
+        if expression is not None:
+            body.append(("expr",) + _split_filters(expression))
+            continue
+
+        keyword_, _sep, rest = statement.partition(" ")
+        rest = rest.strip()
+        if keyword_ == "trans":
+            end = _END_TRANS.search(source, pos)
+            if end is None:
+                raise TemplateSyntaxError("{% trans %} without {% endtrans %}")
+            body.append(("trans", source[pos:end.start()], _parse_bindings(rest)))
+            pos = end.end()
+        elif keyword_ == "if":
+            branches = [(rest, [])]
+            node_else: List[tuple] = []
+            body.append(("if", branches, node_else))
+            stack.append(("if", (branches, node_else), body))
+            body = branches[0][1]
+        elif keyword_ in ("elif", "else"):
+            if not stack or stack[-1][0] != "if":
+                raise TemplateSyntaxError(f"{{% {keyword_} %}} outside {{% if %}}")
+            branches, node_else = stack[-1][1]
+            if body is node_else:
+                raise TemplateSyntaxError(f"{{% {keyword_} %}} after {{% else %}}")
+            if keyword_ == "elif":
+                branches.append((rest, []))
+                body = branches[-1][1]
+            else:
+                body = node_else
+        elif keyword_ == "for":
+            for_match = _FOR.match(rest)
+            if for_match is None:
+                raise TemplateSyntaxError(f"Invalid for statement: {statement}")
+            loop_body: List[tuple] = []
+            body.append(("for", for_match.group(1), for_match.group(2), loop_body))
+            stack.append(("for", None, body))
+            body = loop_body
+        elif keyword_ in ("endif", "endfor"):
+            if not stack or stack[-1][0] != keyword_[3:]:
+                raise TemplateSyntaxError(f"Unexpected {{% {keyword_} %}}")
+            body = stack.pop()[2]
+        else:
+            raise TemplateSyntaxError(f"Unknown statement: {statement}")
+
+    if pos < len(source):
+        body.append(("text", source[pos:]))
+    if stack:
+        raise TemplateSyntaxError(f"Unclosed {{% {stack[-1][0]} %}}")
+    return root
+
+
+class _LookupTransformer(ast.NodeTransformer):
+    """Rewrite attribute reads as _lookup calls and collect the names used.
+
+    Method calls such as item.get("name", "") stay plain attribute access.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+
+    def visit_Name(self, node: ast.Name) -> ast.Name:
+        if node.id.startswith("_"):
+            raise TemplateSyntaxError(f"Names starting with an underscore are reserved: {node.id}")
+        if node.id not in self.names:
+            self.names.append(node.id)
+        return node
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if isinstance(node.func, ast.Attribute):
+            node.func._method = True
+        return self.generic_visit(node)
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.AST:
+        self.generic_visit(node)
+        if node.attr.startswith("_"):
+            raise TemplateSyntaxError(f"Attributes starting with an underscore are reserved: {node.attr}")
+        if not isinstance(node.ctx, ast.Load) or getattr(node, "_method", False):
+            return node
+        call = ast.Call(
+            func=ast.Name(id="_lookup", ctx=ast.Load()),
+            args=[node.value, ast.Constant(value=node.attr)],
+            keywords=[]
+        )
+        return ast.copy_location(call, node)
+
+
+class _Compiler:
+    """Generates the render function of one template for one language."""
+
+    def __init__(self, language: str, name: str, translate: bool = True,
+                 helpers: Optional[Mapping[str, Any]] = None):
+        self.language = language
+        self.name = name
+        self.translate = translate
+        self.helpers = helpers or {}
+        self.lines: List[str] = []
+        self.names: List[str] = []
+        self.temp_count = 0
+
+    def expression(self, source: str, mode: str = "eval") -> str:
+        try:
+            tree = ast.parse(source.strip(), mode=mode)
+        except SyntaxError as e:
+            raise TemplateSyntaxError(f"Invalid expression in {self.name}: {source!r} ({e.msg})")
+        transformer = _LookupTransformer()
+        tree = ast.fix_missing_locations(transformer.visit(tree))
+        for name in transformer.names:
+            if name not in self.names and name not in _SAFE_BUILTINS and name not in self.helpers:
+                self.names.append(name)
+        return ast.unparse(tree)
+
+    def temp(self) -> str:
+        self.temp_count += 1
+        return f"_v{self.temp_count}"
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def value(self, expression: str, filters: List[str]) -> str:
+        """Code computing an expression with its filters applied."""
+        code = self.expression(expression)
+        for filter_name in filters:
+            if filter_name == "t":
+                code = f"_translate({code})"
+            elif filter_name == "join":
+                code = f"', '.join(map(str, {code}))"
+        return code
+
+    def output(self, indent: int, code: str, raw: bool, state: Optional[str]) -> str:
+        """Emit statements computing an output field; returns the temp variable holding it."""
+        name = self.temp()
+        self.emit(indent, f"{name} = {code}")
+        if not raw:
+            # Integers never need escaping and are the most common field
+            self.emit(indent, f"if {name}.__class__ is not int: {name} = {_ESCAPER_NAMES[state]}({name})")
+        return name
+
+    def trans_parts(self, msgid: str) -> List[Tuple[str, Optional[Tuple[str, str, str]]]]:
+        """Translate msgid and split it into (literal, field) parts."""
+        for text in ((_(msgid, self.language), msgid) if self.translate else (msgid,)):
+            try:
+                parts = []
+                for literal, field, spec, conversion in _formatter.parse(text):
+                    if field is not None and not _FIELD_PATH.match(field):
+                        raise ValueError(f"unsupported field {{{field}}}")
+                    parts.append((literal, None if field is None else (field, spec or "", conversion or "")))
+                return parts
+            except ValueError as e:
+                if text is msgid:
+                    raise TemplateSyntaxError(f"Invalid trans block in {self.name}: {e}")
+                logger.warning(f"Invalid {self.language} translation of {msgid!r}, using the original: {e}")
+        return []
+
+    def block(self, nodes: List[tuple], indent: int) -> None:
+        # Consecutive text and fields are joined into one f-string
+        pieces: List[str] = []
+        state: Optional[str] = None
+
+        def flush():
+            if pieces:
+                self.emit(indent, f"_append(f{''.join(pieces)!r})")
+                pieces.clear()
+
+        def add_literal(text: str) -> None:
+            pieces.append(text.replace("{", "{{").replace("}", "}}"))
+
+        for node in nodes:
+            kind = node[0]
+            if kind == "text":
+                add_literal(node[1])
+                state = entity_state(node[1], state)
+            elif kind == "expr":
+                code = self.value(node[1], node[2])
+                pieces.append("{" + self.output(indent, code, "raw" in node[2], state) + "}")
+            elif kind == "trans":
+                bound = {}
+                for name, expression, filters in node[2]:
+                    bound[name] = self.temp()
+                    self.emit(indent, f"{bound[name]} = {self.value(expression, filters)}")
+                for literal, field in self.trans_parts(node[1]):
+                    add_literal(literal)
+                    state = entity_state(literal, state)
+                    if field is None:
+                        continue
+                    path, spec, conversion = field
+                    head, *attributes = path.split(".")
+                    if head in bound:
+                        code = bound[head]
+                        for attribute in attributes:
+                            code = f"_lookup({code}, {attribute!r})"
+                    else:
+                        code = self.expression(path)
+                    if conversion:
+                        code = {"r": "repr", "s": "str", "a": "ascii"}[conversion] + f"({code})"
+                    if spec:
+                        code = f"format({code}, {spec!r})"
+                    pieces.append("{" + self.output(indent, code, False, state) + "}")
+            elif kind == "if":
+                flush()
+                _kind, branches, else_body = node
+                for i, (condition, body) in enumerate(branches):
+                    self.emit(indent, f"{'if' if i == 0 else 'elif'} {self.expression(condition)}:")
+                    self.block(body, indent + 1)
+                if else_body:
+                    self.emit(indent, "else:")
+                    self.block(else_body, indent + 1)
+                state = None
+            elif kind == "for":
+                flush()
+                _kind, target, iterable, body = node
+                target_code = self.expression(f"{target} = None", mode="exec").split(" = ")[0]
+                self.emit(indent, f"for {target_code} in {self.expression(iterable)}:")
+                self.block(body, indent + 1)
+                state = None
+        flush()
+        if not self.lines or self.lines[-1].endswith(":"):
+            self.emit(indent, "pass")
+
+    def translator(self) -> Callable[[Any], str]:
+        """The |t filter: translations memoized for the lifetime of the compiled function."""
+        language = self.language
+        cache: Dict[str, str] = {}
+
+        def translate(value: Any) -> str:
+            text = cache.get(value) if value.__class__ is str else None
+            if text is None:
+                text = _(str(value), language)
+                if value.__class__ is str and len(cache) < TRANSLATION_CACHE_SIZE:
+                    cache[value] = text
+            return text
+        return translate
+
+    def compile(self, nodes: List[tuple]) -> Callable[[Mapping], str]:
+        self.block(nodes, 1)
+        header = ["def _render(_context):", "    _parts = []", "    _append = _parts.append"]
+        header += [f"    {name} = _context.get({name!r})" for name in self.names]
+        source = "\n".join(header + self.lines + ["    return ''.join(_parts)"]) + "\n"
+
+        namespace: Dict[str, Any] = dict(_SAFE_BUILTINS)
+        namespace.update(self.helpers)
+        namespace.update({
+            "__builtins__": {},
+            "_lookup": _lookup,
+            "_escape": escape_markdown,
+            "_translate": self.translator(),
+        })
+        namespace.update({_ESCAPER_NAMES[char]: escaper for char, escaper in _ENTITY_ESCAPERS.items()})
+        exec(compile(source, f"<template {self.name} {self.language}>", "exec"), namespace)
+        return namespace["_render"]
+
+
+class MessageTemplate:
+    """A message template, compiled lazily once per language."""
+
+    def __init__(self, source: str, name: str = "template", helpers: Optional[Mapping[str, Any]] = None):
+        self.source = source
+        self.name = name
+        # Functions and constants the template can use without passing them in the context
+        self.helpers = dict(helpers or {})
+        self._nodes = _parse(source)
+        self._compiled: Dict[str, Callable[[Mapping], str]] = {}
+        # Catch expression errors at definition time rather than on first use
+        _Compiler(DEFAULT_LANGUAGE, name, translate=False, helpers=self.helpers).block(self._nodes, 1)
+        _templates.add(self)
+
+    def compile(self, language: str) -> Callable[[Mapping], str]:
+        """Return the render function for a language."""
+        renderer = self._compiled.get(language)
+        if renderer is None:
+            renderer = self._compiled[language] = _Compiler(language, self.name, helpers=self.helpers).compile(self._nodes)
+        return renderer
+
+    def render(self, language: str = DEFAULT_LANGUAGE, **context: Any) -> str:
+        """Render the template for a language."""
+        return self.render_map(language, context)
+
+    def render_map(self, language: str, context: Mapping[str, Any]) -> str:
+        """Render the template from a context mapping."""
+        renderer = self._compiled.get(language)
+        if renderer is None:
+            if language not in SUPPORTED_LANGUAGES:
+                language = DEFAULT_LANGUAGE
+            renderer = self.compile(language)
+        return renderer(context)
+
+    def clear(self) -> None:
+        """Drop compiled functions, e.g. after translations changed."""
+        self._compiled = {}
+
+
+# Every template, so a translation reload can drop their compiled functions
+_templates: "weakref.WeakSet[MessageTemplate]" = weakref.WeakSet()
+
+
+def _clear_compiled() -> None:
+    for template in list(_templates):
+        template.clear()
+
+
+add_reload_listener(_clear_compiled)
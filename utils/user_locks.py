@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Per-user update serialization.
+
+Updates from one user are processed strictly in arrival order while
+different users still run concurrently. This keeps double-tapped buttons
+(e.g. "Confirm" in the action wizards) from submitting twice and stops
+one user's context updates from interleaving.
+
+Two limits apply: PTB's semaphore bounds the updates in flight, including
+those waiting behind an earlier update of the same user, and a second one
+taken after the user's lock bounds the updates actually running. A user
+who floods the bot near a deadline so only queues behind themselves
+instead of occupying the slots everyone else needs. The in-flight bound is
+kept well above any one user's burst for the same reason.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Dict, Optional
+
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT_UPDATES = 64
+# Updates in flight, counting those waiting for an earlier update of their user
+DEFAULT_MAX_PENDING_UPDATES = 1024
+
+
+class _LockEntry:
+    """A lock plus the number of tasks currently holding or waiting for it."""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class UserLockRegistry:
+    """Registry of per-user asyncio locks; entries are dropped as soon as they go idle."""
+
+    def __init__(self):
+        self._locks: Dict[str, _LockEntry] = {}
+
+    @asynccontextmanager
+    async def hold(self, user_id: str):
+        """Hold the lock for a user for the duration of the block."""
+        entry = self._locks.get(user_id)
+        if entry is None:
+            entry = self._locks[user_id] = _LockEntry()
+
+        entry.users += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.users -= 1
+            # Nobody else is holding or queued, so the entry can go
+            if entry.users == 0 and self._locks.get(user_id) is entry:
+                del self._locks[user_id]
+
+    def is_locked(self, user_id: str) -> bool:
+        """Check whether a user's updates are currently being processed."""
+        entry = self._locks.get(user_id)
+        return entry is not None and entry.lock.locked()
+
+    def size(self) -> int:
+        """Get the number of users with an active or queued update."""
+        return len(self._locks)
+
+
+# Global lock registry instance
+user_locks = UserLockRegistry()
+
+
+def get_update_user_id(update: Any) -> Optional[str]:
+    """Get the telegram_id an update belongs to, if any."""
+    if isinstance(update, Update) and update.effective_user:
+        return str(update.effective_user.id)
+    return None
+
+
+class PerUserUpdateProcessor(BaseUpdateProcessor):
+    """Update processor that runs updates concurrently but one at a time per user."""
+
+    def __init__(
+        self,
+        max_concurrent_updates: int = DEFAULT_MAX_CONCURRENT_UPDATES,
+        registry: Optional[UserLockRegistry] = None,
+        max_pending_updates: Optional[int] = None
+    ):
+        max_concurrent_updates = max(1, max_concurrent_updates)
+        super().__init__(max(max_pending_updates or DEFAULT_MAX_PENDING_UPDATES, max_concurrent_updates))
+        self.registry = registry or user_locks
+        self.max_running_updates = max_concurrent_updates
+        self._running = asyncio.BoundedSemaphore(max_concurrent_updates)
+
+    async def do_process_update(self, update: object, coroutine: Awaitable[Any]) -> None:
+        user_id = get_update_user_id(update)
+        if user_id is None:
+            async with self._running:
+                await coroutine
+            return
+
+        async with self.registry.hold(user_id):
+            async with self._running:
+                await coroutine
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass